@@ -0,0 +1,292 @@
+"""
+Vectorized script operations on entire pandas Series and Arrow arrays.
+
+This module is optional and not imported by `alphabetic` itself, so that neither pandas nor pyarrow are required by the core
+library. Importing it registers the `alphabetic` accessor for pandas Series (if pandas is installed):
+
+    >>> import alphabetic.accessors
+    >>> df["name"].alphabetic.is_alphabet()
+    >>> df["name"].alphabetic.strip(languages=[ws.Language.German])
+    >>> df["name"].alphabetic.classify()
+
+The operations compile the script tables into regex character classes, which are evaluated by Arrow's compute kernels on
+the string buffers (if pyarrow is installed) or by pandas' vectorized string methods otherwise.
+"""
+import weakref
+from typing import Union
+
+from .core import WritingSystem, shared_writing_system
+from .ranges import CodepointRangeSet
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+CLASSIFICATION_ORDER = WritingSystem.classification_order
+
+# All whitespace characters lie below U+3001 (the last one is the ideographic space U+3000).
+WHITESPACE = CodepointRangeSet.from_characters(c for c in map(chr, range(0x3001)) if c.isspace())
+
+_pattern_cache = weakref.WeakKeyDictionary()
+
+
+def _inner(character_class: str) -> str:
+    """Returns the content of a character class without the brackets."""
+    return character_class[1:-1]
+
+
+def _cached_pattern(ws: WritingSystem, key: tuple, build) -> str:
+    """
+    Caches the patterns per instance. Registering a script replaces `writing_systems_to_scripts` of the instance,
+    which invalidates all patterns built before.
+    """
+    cache = _pattern_cache.setdefault(ws, {})
+    tables, pattern = cache.get(key, (None, None))
+    if tables is not ws.writing_systems_to_scripts:
+        tables, pattern = ws.writing_systems_to_scripts, build()
+        cache[key] = (tables, pattern)
+    return pattern
+
+
+def script_type_class(script_type: str, strip_spaces: bool = True, writing_system: Union[WritingSystem, None] = None) -> str:
+    """
+    Compiles the characters of a writing system type into a regex character class.
+
+    Parameters:
+        script_type (str): One of 'Abjad', 'Abugida', 'Alphabet', 'Syllabary', 'Logographic' or 'Featural'.
+        strip_spaces (bool, optional): Whether whitespace characters are part of the class. Defaults to True.
+        writing_system (WritingSystem | None, optional): The instance providing the script tables. Defaults to the shared instance.
+
+    Returns:
+        str: A character class such as "[A-Za-z...]".
+    """
+    ws = writing_system or shared_writing_system()
+
+    def build() -> str:
+        characters = ws.writing_systems_to_scripts.get(script_type)
+        if characters is None:
+            raise ValueError(f"Unknown writing system type: {script_type}")
+
+        characters = characters if isinstance(characters, CodepointRangeSet) else CodepointRangeSet.from_characters(characters)
+        if script_type == "Featural":
+            # Hangul syllables and conjoining Jamo (e.g., of NFD-normalized text) are mapped to their compatibility Jamo (see `is_writing_system`).
+            characters |= CodepointRangeSet.from_characters(chr(cp) for block in (range(0x1100, 0x1200), range(0xAC00, 0xD7A4)) for cp in block
+                                                           if all(c in characters for c in ws.decompose_korean_char_sequence(chr(cp))))
+        return (characters | WHITESPACE if strip_spaces else characters).to_regex_class()
+
+    return _cached_pattern(ws, ("type", script_type, strip_spaces), build)
+
+
+def languages_class(languages=None, writing_system: Union[WritingSystem, None] = None) -> str:
+    """
+    Compiles the characters retained by `strip_non_script_characters` for the given language(s) into a regex character class.
+
+    Parameters:
+        languages (Language | CodepointRangeSet | list[Language | CodepointRangeSet] | None, optional): The language(s) or
+            character ranges. If None, all supported script types are considered. Defaults to None.
+        writing_system (WritingSystem | None, optional): The instance providing the script tables. Defaults to the shared instance.
+
+    Returns:
+        str: A character class such as "[A-Za-z...]".
+    """
+    ws = writing_system or shared_writing_system()
+    languages = [languages] if isinstance(languages, (ws.Language, CodepointRangeSet)) else languages
+
+    def build() -> str:
+        if languages is None:
+            return CodepointRangeSet.from_characters(c for c in ws.all_script_characters() if len(c) == 1).to_regex_class()
+
+        characters, ranges = set(), CodepointRangeSet()
+        for language in languages:
+            if isinstance(language, CodepointRangeSet):
+                ranges |= language
+                continue
+            script = ws.by_language(language, as_list=True) or []
+            if isinstance(script, dict):
+                script = [c for chars in script[language.name].values() for c in chars]
+            characters.update(c for c in script if len(c) == 1)
+        return (CodepointRangeSet.from_characters(characters) | ranges).to_regex_class()
+
+    key = ("languages", None if languages is None else tuple(languages))
+    return _cached_pattern(ws, key, build)
+
+
+def _is_arrow(values) -> bool:
+    return pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray))
+
+
+def is_writing_system(values, script_type: str, strip_spaces: bool = True, writing_system: Union[WritingSystem, None] = None):
+    """
+    Checks for each string of an Arrow array whether all of its characters belong to the specified writing system type.
+
+    Parameters:
+        values (pyarrow.Array | pyarrow.ChunkedArray): The strings to be checked.
+        script_type (str): One of 'Abjad', 'Abugida', 'Alphabet', 'Syllabary', 'Logographic' or 'Featural'.
+        strip_spaces (bool, optional): Whether whitespace is ignored. Defaults to True.
+        writing_system (WritingSystem | None, optional): The instance providing the script tables. Defaults to the shared instance.
+
+    Returns:
+        pyarrow.BooleanArray | pyarrow.ChunkedArray: The results (null for null strings).
+    """
+    return pc.match_substring_regex(values, f"^{script_type_class(script_type, strip_spaces, writing_system)}*$")
+
+
+def strip_non_script_characters(values,
+                                languages=None,
+                                process_token_wise: bool = True,
+                                strip_spaces: bool = True,
+                                writing_system: Union[WritingSystem, None] = None):
+    """
+    Removes the characters of each string of an Arrow array that do not belong to the specified language(s), with the same
+    semantics as `WritingSystem.strip_non_script_characters`.
+
+    Parameters:
+        values (pyarrow.Array | pyarrow.ChunkedArray): The strings to be cleaned.
+        languages (Language | CodepointRangeSet | list[Language | CodepointRangeSet] | None, optional): The language(s) whose
+            characters are retained. If None, all supported script types are considered. Defaults to None.
+        process_token_wise (bool, optional): Whether the strings are processed token-wise. Defaults to True.
+        strip_spaces (bool, optional): Whether leading and trailing spaces are stripped from the results. Defaults to True.
+        writing_system (WritingSystem | None, optional): The instance providing the script tables. Defaults to the shared instance.
+
+    Returns:
+        pyarrow.StringArray | pyarrow.ChunkedArray: The cleaned strings.
+    """
+    replace = pc.replace_substring_regex if _is_arrow(values) else lambda s, pattern, replacement: s.str.replace(pattern, replacement, regex=True)
+    return _strip(values, replace, languages, process_token_wise, strip_spaces, writing_system)
+
+
+def _strip(values, replace, languages, process_token_wise: bool, strip_spaces: bool, writing_system: Union[WritingSystem, None]):
+    script_class = _inner(languages_class(languages, writing_system))
+    whitespace = WHITESPACE.to_regex_class()
+
+    if process_token_wise:
+        # Equivalent to " ".join(text.split()), followed by removing all non-script characters from the tokens.
+        values = replace(values, f"^{whitespace}+|{whitespace}+$", "")
+        values = replace(values, f"{whitespace}+", " ")
+        values = replace(values, f"[^{script_class} ]+", "")
+        return replace(values, "^ +| +$", "") if strip_spaces else values
+
+    values = replace(values, f"[^{script_class}]+", "")
+    return replace(values, f"^{whitespace}+|{whitespace}+$", "") if strip_spaces else values
+
+
+def classify(values, strip_spaces: bool = True, writing_system: Union[WritingSystem, None] = None):
+    """
+    Determines for each string of an Arrow array the most specific writing system type that covers all of its characters.
+
+    Parameters:
+        values (pyarrow.Array | pyarrow.ChunkedArray): The strings to be classified.
+        strip_spaces (bool, optional): Whether whitespace is ignored. Defaults to True.
+        writing_system (WritingSystem | None, optional): The instance providing the script tables. Defaults to the shared instance.
+
+    Returns:
+        pyarrow.StringArray: The writing system type per string, or null if no single type covers the string (or it is empty).
+    """
+    values = values.combine_chunks() if isinstance(values, pa.ChunkedArray) else values
+    result = pa.nulls(len(values), pa.string())
+    unclassified = pc.invert(pc.match_substring_regex(values, f"^{WHITESPACE.to_regex_class()}*$" if strip_spaces else "^$"))
+
+    for script_type in reversed(CLASSIFICATION_ORDER):
+        matches = pc.and_(unclassified, is_writing_system(values, script_type, strip_spaces, writing_system))
+        result = pc.if_else(matches, pa.scalar(script_type), result)
+    return result
+
+
+if pd is not None:
+
+    @pd.api.extensions.register_series_accessor("alphabetic")
+    class ScriptAccessor:
+        """
+        Provides vectorized script operations on a Series of strings via `series.alphabetic`.
+
+        Example:
+            >>> s = pd.Series(["Hallo", "שלום", "早上好"])
+            >>> s.alphabetic.is_alphabet()
+            0     True
+            1    False
+            2    False
+            dtype: bool
+            >>> s.alphabetic.classify()
+            0       Alphabet
+            1          Abjad
+            2    Logographic
+            dtype: object
+        """
+
+        def __init__(self, series: "pd.Series"):
+            self.__series = series
+            self.writing_system = shared_writing_system()
+
+
+        def using(self, writing_system: WritingSystem) -> "ScriptAccessor":
+            """Uses the script tables of the given instance (e.g., with overlays) instead of the shared instance."""
+            self.writing_system = writing_system
+            return self
+
+
+        def __to_arrow(self):
+            return pa.array(self.__series.astype(object).where(self.__series.notna(), None), type=pa.string())
+
+
+        def __from_arrow(self, values, dtype=None) -> "pd.Series":
+            result = pd.Series(values.to_pandas(), index=self.__series.index, name=self.__series.name)
+            return result.astype(dtype) if dtype is not None else result
+
+
+        def is_writing_system(self, script_type: str, strip_spaces: bool = True) -> "pd.Series":
+            # Both backends return a bool Series or, if the Series contains nulls, a "boolean" Series with NA for them.
+            dtype = "boolean" if self.__series.hasnans else bool
+            if pa is not None:
+                result = is_writing_system(self.__to_arrow(), script_type, strip_spaces, self.writing_system)
+                return self.__from_arrow(result, dtype)
+            result = self.__series.str.fullmatch(f"{script_type_class(script_type, strip_spaces, self.writing_system)}*")
+            return result.astype(dtype).mask(self.__series.isna())
+
+        def is_alphabet(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Alphabet", strip_spaces)
+
+        def is_abjad(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Abjad", strip_spaces)
+
+        def is_abugida(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Abugida", strip_spaces)
+
+        def is_syllabary(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Syllabary", strip_spaces)
+
+        def is_logographic(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Logographic", strip_spaces)
+
+        def is_featural(self, strip_spaces: bool = True) -> "pd.Series":
+            return self.is_writing_system("Featural", strip_spaces)
+
+
+        def strip(self, languages=None, process_token_wise: bool = True, strip_spaces: bool = True) -> "pd.Series":
+            if pa is not None:
+                result = strip_non_script_characters(self.__to_arrow(), languages, process_token_wise, strip_spaces, self.writing_system)
+                return self.__from_arrow(result)
+            return strip_non_script_characters(self.__series, languages, process_token_wise, strip_spaces, self.writing_system)
+
+
+        def classify(self, strip_spaces: bool = True) -> "pd.Series":
+            if pa is not None:
+                result = self.__from_arrow(classify(self.__to_arrow(), strip_spaces, self.writing_system), object)
+            else:
+                result = pd.Series(None, index=self.__series.index, name=self.__series.name, dtype=object)
+                whitespace = WHITESPACE.to_regex_class()
+                unclassified = ~self.__series.str.fullmatch(f"{whitespace}*" if strip_spaces else "").astype(bool) & self.__series.notna()
+
+                for script_type in CLASSIFICATION_ORDER:
+                    matches = unclassified & self.is_writing_system(script_type, strip_spaces).fillna(False).astype(bool)
+                    result[matches] = script_type
+                    unclassified &= ~matches
+            # Both backends return an object Series with None for null and unclassified strings.
+            return result.where(result.notna(), None)
@@ -0,0 +1,220 @@
+from typing import Iterable, Mapping
+
+
+# int.bit_count() is only available as of Python 3.10
+popcount = int.bit_count if hasattr(int, "bit_count") else lambda x: bin(x).count("1")
+
+
+class AlphabetBitsets:
+    """
+    Represents the alphabet (i.e., the set of characters) of each language and each script of the other writing system types 
+    (e.g., `Abugida.Devanagari`) as a bitset over all characters of all languages and scripts.
+
+    Each character is assigned a bit position, so that the alphabet of a language becomes a single integer. Overlaps between
+    alphabets are then computed by a bitwise AND and a population count, which processes an entire machine word of characters
+    per operation instead of a single character. The pairwise overlaps of all languages and scripts are computed once per metric
+    and cached.
+
+    Conversely, the inverted indexes map each character to a bitset over the languages whose alphabet contains it and to a
+    bitset over the scripts containing it. The languages covering a text are then determined by intersecting these bitsets
+    in a single pass over the distinct characters of the text.
+
+    Example:
+        >>> bitsets = AlphabetBitsets(ws)
+        >>> bitsets.nearest(ws.Language.German, k=1)
+        [(<Language.Swiss_German: ('gsw',)>, 0.9830508474576272)]
+    """
+
+    metrics = ("jaccard", "containment")
+
+    def __init__(self, writing_system):
+        """
+        Parameters:
+            writing_system (WritingSystem): The instance providing the alphabets of the languages and the scripts.
+        """
+        alphabets = {language: writing_system.language_characters(language) for language in writing_system.Language}
+        for script_enum in [writing_system.Abjad, writing_system.Abugida, writing_system.Syllabary,
+                            writing_system.Logographic, writing_system.Featural]:
+            for script in script_enum:
+                alphabets[script] = frozenset("".join(writing_system.by_script(script, as_list=True)))
+
+        self.languages = tuple(language for language in writing_system.Language if alphabets[language])
+        self.scripts = tuple(key for key in alphabets if not isinstance(key, writing_system.Language) and alphabets[key])
+        self.entries = self.languages + self.scripts
+        self.characters = tuple(sorted({c for entry in self.entries for c in alphabets[entry]}))
+        self.__positions = {c: i for i, c in enumerate(self.characters)}
+
+        self.alphabets = {}
+        for entry in self.entries:
+            bits = 0
+            for c in alphabets[entry]:
+                bits |= 1 << self.__positions[c]
+            self.alphabets[entry] = bits
+
+        self.__language_masks = self.__inverted_index(self.languages, alphabets)
+        self.__script_masks = self.__inverted_index(self.scripts, alphabets)
+
+        self.sizes = {entry: popcount(bits) for entry, bits in self.alphabets.items()}
+        self.__matrices = {}
+
+
+    @staticmethod
+    def __inverted_index(entries: tuple, alphabets: dict) -> dict[str, int]:
+        """Maps each character to the bitset over the given entries whose alphabet contains it."""
+        masks = {}
+        for i, entry in enumerate(entries):
+            for c in alphabets[entry]:
+                masks[c] = masks.get(c, 0) | 1 << i
+        return masks
+
+
+    def similarity(self, a, b, metric: str = "jaccard") -> float:
+        """
+        Computes the overlap between the alphabets of two languages or scripts.
+
+        Parameters:
+            a (Language | Abjad | Abugida | Syllabary | Logographic | Featural): The first language or script.
+            b (Language | Abjad | Abugida | Syllabary | Logographic | Featural): The second language or script.
+            metric (str, optional): Either "jaccard" (|A ∩ B| / |A ∪ B|) or "containment" (|A ∩ B| / |A|, i.e., the share
+                of the characters of `a` that are covered by `b`). Defaults to "jaccard".
+
+        Returns:
+            float: The overlap within [0; 1], where 0 is returned if a language or script has no characters.
+        """
+        if metric not in self.metrics:
+            raise ValueError(f"Unknown metric: {metric}. Must be one of the following: {self.metrics}")
+
+        bits_a, bits_b = self.alphabets.get(a, 0), self.alphabets.get(b, 0)
+        shared = popcount(bits_a & bits_b)
+        total = popcount(bits_a | bits_b) if metric == "jaccard" else self.sizes.get(a, 0)
+        return shared / total if total else 0.0
+
+
+    def matrix(self, metric: str = "jaccard") -> list[list[float]]:
+        """
+        Computes (once per metric) the pairwise overlaps of all languages and scripts in the order of `entries`.
+
+        Parameters:
+            metric (str, optional): Either "jaccard" or "containment" (see `similarity`). Defaults to "jaccard".
+
+        Returns:
+            list[list[float]]: The matrix, where entry [i][j] is the overlap of `entries[i]` with `entries[j]`.
+        """
+        matrix = self.__matrices.get(metric)
+        if matrix is None:
+            matrix = [[self.similarity(a, b, metric) for b in self.entries] for a in self.entries]
+            self.__matrices[metric] = matrix
+        return matrix
+
+
+    def nearest(self, entry, k: int = 5, metric: str = "jaccard", include_scripts: bool = False) -> list[tuple]:
+        """
+        Retrieves the k languages (and optionally scripts) whose alphabets overlap most with the alphabet of the given language or script.
+
+        Parameters:
+            entry (Language | Abjad | Abugida | Syllabary | Logographic | Featural): The language or script to be compared.
+            k (int, optional): The number of entries to be returned. Defaults to 5.
+            metric (str, optional): Either "jaccard" or "containment" (see `similarity`). Defaults to "jaccard".
+            include_scripts (bool, optional): Whether the scripts are ranked alongside the languages. Defaults to False.
+
+        Returns:
+            list[tuple[Language | Abjad | Abugida | Syllabary | Logographic | Featural, float]]: The entries (except the
+            given one) and their overlaps, sorted in descending order.
+        """
+        if entry not in self.alphabets:
+            return []
+
+        candidates = self.entries if include_scripts else self.languages
+        row = self.matrix(metric)[self.entries.index(entry)]
+        ranked = sorted(((other, overlap) for other, overlap in zip(candidates, row) if other != entry),
+                        key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+
+    def language_mask(self, c: str) -> int:
+        """Returns the bitset over `languages` whose alphabet contains the given character (0 for unknown characters)."""
+        return self.__language_masks.get(c, 0)
+
+
+    def script_mask(self, c: str) -> int:
+        """Returns the bitset over `scripts` containing the given character (0 for unknown characters)."""
+        return self.__script_masks.get(c, 0)
+
+
+    @staticmethod
+    def __select(entries: tuple, mask: int) -> list:
+        selected = []
+        while mask:
+            lowest = mask & -mask
+            selected.append(entries[lowest.bit_length() - 1])
+            mask ^= lowest
+        return selected
+
+
+    def to_languages(self, mask: int) -> list:
+        """Converts a bitset over `languages` into the respective languages."""
+        return self.__select(self.languages, mask)
+
+
+    def to_scripts(self, mask: int) -> list:
+        """Converts a bitset over `scripts` into the respective scripts."""
+        return self.__select(self.scripts, mask)
+
+
+    def sharing(self, characters: Iterable[str]) -> list:
+        """
+        Retrieves all languages whose alphabet contains all of the given characters.
+
+        Parameters:
+            characters (Iterable[str]): The characters (e.g., a string).
+
+        Returns:
+            list[Language]: The languages in the order of the `Language` enum.
+        """
+        mask = (1 << len(self.languages)) - 1
+        for c in set(characters):
+            mask &= self.__language_masks.get(c, 0)
+            if not mask:
+                break
+        return self.to_languages(mask)
+
+
+    def best_languages(self, mask_counts: Mapping[int, int]) -> tuple[int, bool]:
+        """
+        Determines the languages whose alphabets cover the most characters of a multiset of characters, which is given
+        by the counts of the characters' bitsets over `languages` (see `language_mask`).
+
+        If at least one language covers all characters, the result is the intersection of the bitsets, which costs a
+        single AND per distinct bitset. Otherwise, the number of covered characters is counted per language.
+
+        Parameters:
+            mask_counts (Mapping[int, int]): The number of characters per bitset. Characters of no alphabet (bitset 0) are ignored.
+
+        Returns:
+            tuple[int, bool]: The bitset of the best languages (0 if no character belongs to any alphabet) and whether
+            these languages cover all characters.
+        """
+        masks = [mask for mask in mask_counts if mask]
+        if not masks:
+            return 0, True
+
+        common = (1 << len(self.languages)) - 1
+        for mask in masks:
+            common &= mask
+            if not common:
+                break
+        if common:
+            return common, True
+
+        scores = [0] * len(self.languages)
+        for mask, n in mask_counts.items():
+            while mask:
+                lowest = mask & -mask
+                scores[lowest.bit_length() - 1] += n
+                mask ^= lowest
+
+        best, result = max(scores), 0
+        for i, score in enumerate(scores):
+            if score == best:
+                result |= 1 << i
+        return result, False
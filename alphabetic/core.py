@@ -1,17 +1,56 @@
+import gc
 import os
 import re
+import sys
 import dcl
 import json
+import functools
+import hashlib
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_right
+from types import MappingProxyType
 from jamo import h2j, j2hcj
 from pathlib import Path
 from enum import Enum, auto
-from typing import Union, NoReturn
+from collections import Counter
+from collections.abc import Mapping
+from typing import Iterable, Union, NoReturn
 from .errors import Non_Existing_ISO_639_2_Langcode
+from .statistics import ScriptStatistics
+from .incremental import IncrementalClassifier
+from .ranges import CodepointRangeSet
+from .trie import LetterTrie
+from .bitsets import AlphabetBitsets
+from .encoding import AlphabetEncoder
+from .pipeline import Pipeline
+from .sampling import sample_windows, cluster_wilson_interval
+from .shared import pack_range_sets, load_range_sets
+from .iso_index import CodeIndex, build_code_index, index_is_current
 
 module_dir = os.path.dirname(os.path.abspath(__file__))
 
 class JsonUtils:
-    """Provides utility functions for working with writing systems and scripts embeddedd in JSON data."""
+    """
+    Provides utility functions for working with writing systems and scripts embeddedd in JSON data.
+
+    Thread safety: Writing functions (`update_lang_json_file`, `del_entry_from_jsonfile`) are serialized by a 
+    class-wide lock and replace the json file atomically, so concurrent readers never observe a partially written file.
+    Note that already constructed `WritingSystem` instances do not see such changes. To add or replace scripts without 
+    modifying the installed package (e.g., on read-only file systems), use overlay directories or 
+    `WritingSystem.register_script` instead.
+    """
+
+    __file_lock = threading.Lock()
+
+    # Backend of the ISO 639-3 table (~7,900 entries): "json" loads it as a dictionary, whereas "mmap" binary-searches 
+    # a memory-mapped index file without materializing the dictionary (e.g., for memory-constrained deployments).
+    iso_639_3_backends = ("json", "mmap")
+    iso_639_3_backend = os.environ.get("ALPHABETIC_ISO_639_3_BACKEND", "json")
+    iso_639_3_index_path = os.environ.get("ALPHABETIC_ISO_639_3_INDEX")
+    __iso_639_3_index = None
+    __iso_639_3_index_lock = threading.Lock()
     
     class FilePath(Enum):
         """An enumeration containing file paths for internal JSON data on specific writing systems."""
@@ -26,6 +65,8 @@ class JsonUtils:
         ISO_639_1_2_Language_Code = os.path.normpath(os.path.join(module_dir, "data/iso_639_1-2_codes_en_de_fr.json")),
         ISO_639_3_Language_Code = os.path.normpath(os.path.join(module_dir, "data/iso_639_3_codes_en.json")),
         ISO_15924_Code = os.path.normpath(os.path.join(module_dir, "data/iso_15924_codes.json")),
+        Unicode_Block = os.path.normpath(os.path.join(module_dir, "data/unicode_blocks.json")),
+        Confusables = os.path.normpath(os.path.join(module_dir, "data/confusables.json")),
 
 
     @staticmethod
@@ -111,6 +152,113 @@ class JsonUtils:
 
         json_data = Path(json_fname).read_text(encoding="utf8")
         return json.loads(json_data)
+
+
+    @staticmethod
+    def set_iso_639_3_backend(backend: str, index_path: Union[str, Path, None] = None) -> None:
+        """
+        Selects how the ISO 639-3 table is loaded (alternatively, via the environment variables `ALPHABETIC_ISO_639_3_BACKEND` 
+        and `ALPHABETIC_ISO_639_3_INDEX`).
+
+        Parameters:
+            backend (str): Either "json" (the table is loaded as a dictionary) or "mmap" (the table is looked up in a 
+                sorted, fixed-width binary index file, which is memory-mapped and binary-searched).
+            index_path (str | Path | None, optional): The index file for the "mmap" backend. It is (re)built from the json 
+                file if it does not exist or the json file has changed since. If None, it is placed next to the json file (or 
+                in the cache directory of the user, if the package directory is read-only). Defaults to None.
+
+        Raises:
+            ValueError: If an unknown backend is provided.
+        """
+        if backend not in JsonUtils.iso_639_3_backends:
+            raise ValueError(f"Unknown backend: {backend}. Must be one of the following: {JsonUtils.iso_639_3_backends}")
+
+        with JsonUtils.__iso_639_3_index_lock:
+            JsonUtils.iso_639_3_backend = backend
+            JsonUtils.iso_639_3_index_path = None if index_path is None else str(index_path)
+            JsonUtils.__iso_639_3_index = None
+
+
+    @staticmethod
+    def load_iso_639_3_table() -> Mapping:
+        """
+        Loads the ISO 639-3 table (language code --> language name) via the configured backend (see `set_iso_639_3_backend`).
+
+        Returns:
+            Mapping: A dictionary (backend "json") or a read-only `CodeIndex` (backend "mmap"), which is opened once per process.
+        """
+        if JsonUtils.iso_639_3_backend != "mmap":
+            return JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_3_Language_Code)
+
+        index = JsonUtils.__iso_639_3_index
+        if index is not None:
+            return index
+
+        with JsonUtils.__iso_639_3_index_lock:
+            if JsonUtils.__iso_639_3_index is None:
+                json_path = JsonUtils.FilePath.ISO_639_3_Language_Code.value[0]
+                index_path = JsonUtils.iso_639_3_index_path or str(Path(json_path).with_suffix(".idx"))
+
+                if not index_is_current(index_path, json_path):
+                    try:
+                        build_code_index(json_path, index_path)
+                    except OSError:
+                        if JsonUtils.iso_639_3_index_path is not None:
+                            raise
+                        # One index per installation, so that different versions of the package never share an index.
+                        installation = hashlib.sha1(str(Path(json_path).resolve()).encode("utf8")).hexdigest()[:12]
+                        cache_dir = JsonUtils.__user_cache_dir()
+                        index_path = os.path.join(cache_dir, f"{Path(json_path).stem}.{installation}.idx")
+                        if not index_is_current(index_path, json_path):
+                            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+                            build_code_index(json_path, index_path)
+                JsonUtils.__iso_639_3_index = CodeIndex(index_path)
+            return JsonUtils.__iso_639_3_index
+
+
+    @staticmethod
+    def __user_cache_dir() -> str:
+        """Returns the cache directory of the current user for derived files, e.g., ~/.cache/alphabetic on Linux."""
+        if os.name == "nt":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+        elif sys.platform == "darwin":
+            base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+        return os.path.join(base, "alphabetic")
+
+
+    @staticmethod
+    def language_code_exists(iso_name: str) -> bool:
+        """
+        Checks whether the given ISO 639-2/3 language code exists in the internal ISO 639-1/2 or ISO 639-3 databases.
+
+        Parameters:
+            iso_name (str): The ISO 639-2/3 language code to check.
+
+        Returns:
+            bool: True if the language code exists in one of both databases, False otherwise.
+        """
+        return (iso_name in JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_1_2_Language_Code) or
+                iso_name in JsonUtils.load_iso_639_3_table())
+
+
+    @staticmethod
+    def __write_dict_to_jsonfile(json_filename: FilePath, _dict: dict) -> None:
+        """
+        Atomically replaces the content of the given JSON file with the given dictionary.
+
+        The dictionary is first written to a temporary file in the same directory, which then replaces the original file. 
+        Hence, readers either see the old or the new content, but never a partially written file.
+
+        Parameters:
+            json_filename (FilePath): A `FilePath` object containing the path to the (internal) JSON file.
+            _dict (dict): The dictionary to be written.
+        """
+        json_fname = json_filename.value[0]
+        tmp_fname = f"{json_fname}.{os.getpid()}.{threading.get_ident()}.tmp"
+        Path(tmp_fname).write_text(json.dumps(_dict, ensure_ascii=False), encoding="utf8")
+        os.replace(tmp_fname, json_fname)
      
 
     @staticmethod
@@ -130,19 +278,24 @@ class JsonUtils:
             Non_Existing_ISO_639_2_Langcode: If the specified language code does not exist in both the ISO 639-1/2 and ISO 639-3 databases.
         """
             
+        with JsonUtils.__file_lock:
+            JsonUtils.__update_lang_json_file(iso_name, script)
+
+
+    @staticmethod
+    def __update_lang_json_file(iso_name: str, script: list[str]) -> None:
         iso_639_2_language_code_db = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_1_2_Language_Code)
         if iso_name not in iso_639_2_language_code_db:
             print(f"Specified language code: [{iso_name}] does not exist in the internal ISO 639-1/2 database. Switching to ISO 639-3 database...")
-            iso_639_3_language_code_db = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_3_Language_Code)
+            iso_639_3_language_code_db = JsonUtils.load_iso_639_3_table()
 
             if iso_name not in iso_639_3_language_code_db:
                 raise Non_Existing_ISO_639_2_Langcode(f"Specified language code: [{iso_name}] does not exist in both the ISO 639-1/2 and ISO 639-3 databases.")
 
-        json_filename = JsonUtils.FilePath.Alphabet.value[0]
         alphabet_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Alphabet)
         alphabet_dict[iso_name] = {"script": script}
-        Path(json_filename).write_text(json.dumps(alphabet_dict, ensure_ascii=False), encoding="utf8")
-        created_dict = json.loads(Path(json_filename).read_text(encoding="utf8"))
+        JsonUtils.__write_dict_to_jsonfile(JsonUtils.FilePath.Alphabet, alphabet_dict)
+        created_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Alphabet)
 
         if iso_name in created_dict:
             if iso_name in iso_639_2_language_code_db:
@@ -178,16 +331,16 @@ class JsonUtils:
 
         This will delete the entry with the specified key (Hawaiian language code) from the JSON file if it exists.
         """
-        _dict = JsonUtils.load_dict_from_jsonfile(json_file)
+        with JsonUtils.__file_lock:
+            _dict = JsonUtils.load_dict_from_jsonfile(json_file)
 
-        if key not in _dict:
-            raise Non_Existing_ISO_639_2_Langcode(f"❌ Specified key: [{key}] does not exist in the given json file.")
+            if key not in _dict:
+                raise Non_Existing_ISO_639_2_Langcode(f"❌ Specified key: [{key}] does not exist in the given json file.")
+
+            _dict.pop(key, None)
+            JsonUtils.__write_dict_to_jsonfile(json_file, _dict)
+            check = JsonUtils.load_dict_from_jsonfile(json_file)
 
-        _dict.pop(key, None)
-        json_content = json.dumps(_dict, ensure_ascii=False)
-        Path(json_file.value[0]).write_text(json_content, encoding="utf8")
-    
-        check = JsonUtils.load_dict_from_jsonfile(json_file)
         if key not in check:
             print(f"✅ Sucessfully deleted the key [{key}] from the json file: {json_file.value[0]}.")
         else:
@@ -253,6 +406,13 @@ class JsonUtils:
 
 
 class WritingSystem:
+    """
+    Provides access to the writing systems, scripts and languages supported by Alphabetic.
+
+    Thread safety: A single instance can be shared across threads. All lookup tables are read-only once built 
+    (`writing_systems_to_scripts` and `iso_15924_to_iso_639_2_3` are immutable mappings of frozensets) and 
+    lazily built caches are guarded by a lock. Use `shared_writing_system()` to obtain a process-wide instance.
+    """
     
     class Language(Enum):
         Abkhazian = "abk", # Script type: Alphabet; Writing system: Cyrillic script
@@ -496,36 +656,366 @@ class WritingSystem:
             raise FileNotFoundError(f"The following json files: {missing_jsonfiles} were not found. Ensure these files exists before performing the instantiation.")
  
 
+    __script_files = [
+        JsonUtils.FilePath.Abjad,
+        JsonUtils.FilePath.Abugida,
+        JsonUtils.FilePath.Alphabet,
+        JsonUtils.FilePath.Syllabary,
+        JsonUtils.FilePath.Logographic,
+        JsonUtils.FilePath.Featural]
+
+
+    def __load_script_data(self, json_file: JsonUtils.FilePath) -> dict:
+        """
+        Loads the entries of a script JSON file merged with the entries of all overlay directories and registrations.
+
+        The bundled file is loaded once per instance and cached. Entries of overlay files with the same file name 
+        (e.g., `alphabet.json`) replace or extend the bundled entries, where later overlay directories take precedence.
+
+        Parameters:
+            json_file (FilePath): A `FilePath` object referring to a script JSON file.
+
+        Returns:
+            dict: The merged entries of the JSON file. The dictionary must not be modified.
+        """
+        data = self.__script_data.get(json_file)
+        if data is not None:
+            return data
+
+        with self.__lock:
+            if json_file not in self.__script_data:
+                data = JsonUtils.load_dict_from_jsonfile(json_file)
+                json_fname = Path(json_file.value[0]).name
+
+                for overlay_dir in self.__overlay_dirs:
+                    overlay_file = overlay_dir / json_fname
+                    if overlay_file.exists():
+                        data.update(json.loads(overlay_file.read_text(encoding="utf8")))
+                self.__script_data[json_file] = data
+            return self.__script_data[json_file]
+
+
     def __mapping_writing_systems_to_scripts(self) -> dict:
         """Generates a dictionary mapping of writing systems to sets of unique script characters.
 
         This method retrieves data from pre-defined JSON files associated with different writing systems 
-        (defined in the `FilePath` enum of the `JsonUtils` class) and processes it to create the final dictionary.
+        (defined in the `FilePath` enum of the `JsonUtils` class) including all overlays and processes it to create the final dictionary.
 
         Returns:
-            dict: A dictionary where keys are writing system names (obtained from the file paths) and 
-            values are sets containing unique characters from all scripts within that writing system.
+            dict: A read-only mapping where keys are writing system names (obtained from the file paths) and 
+            values are frozensets containing unique characters from all scripts within that writing system.
 
         Raises:
             (Implicit) Any exceptions raised by the `load_dict_from_jsonfile` function used for loading JSON data. 
         """
 
-        writing_systen_json_filepaths = [
-            JsonUtils.FilePath.Abjad,
-            JsonUtils.FilePath.Abugida,
-            JsonUtils.FilePath.Alphabet,
-            JsonUtils.FilePath.Syllabary,
-            JsonUtils.FilePath.Logographic,
-            JsonUtils.FilePath.Featural]
+        writing_systen_map_script = {w.name:list(self.__load_script_data(w).values()) for w in self.__script_files}
+        return MappingProxyType({ws_name:self.__script_type_characters(script) for ws_name, script in writing_systen_map_script.items()})
+
+
+    @staticmethod
+    def __script_type_characters(entries: list[dict]) -> Union[frozenset[str], CodepointRangeSet]:
+        """
+        Combines the characters of all script entries of a writing system type.
+
+        Returns:
+            frozenset[str] | CodepointRangeSet: A frozenset of all characters or, if at least one script was registered
+            as a `CodepointRangeSet`, a range set, so that large ranges (e.g., CJK blocks) are never materialized.
+        """
+        ranges = [d["script"] for d in entries if isinstance(d["script"], CodepointRangeSet)]
+        characters = frozenset("".join(["".join(d["script"]) for d in entries if not isinstance(d["script"], CodepointRangeSet)]))
         
-        writing_systen_map_script = {w.name:list(JsonUtils.load_dict_from_jsonfile(w).values()) for w in writing_systen_json_filepaths}
-        return {ws_name:set(list("".join(["".join(d['script']) for d in script]))) for ws_name, script in writing_systen_map_script.items()}
+        if not ranges:
+            return characters
+        
+        combined = CodepointRangeSet.from_characters(characters)
+        for range_set in ranges:
+            combined |= range_set
+        return combined
+
+
+    # Required for fallback strategy (ISO 639-2/3 language code --> ISO 15924)
+    __iso_15924_to_iso_639_2_3 = MappingProxyType({ "Hang" : frozenset(["kor", "jje"]), })
+    __language_routing = None
+    __language_routing_lock = threading.Lock()
+    __unicode_blocks = None
+    __unicode_blocks_lock = threading.Lock()
+    __confusables = None
+    __confusables_lock = threading.Lock()
+
+    # From most to least specific, e.g., Arabic letters that are part of alphabets are classified as Abjad.
+    classification_order = ("Featural", "Logographic", "Syllabary", "Abugida", "Abjad", "Alphabet")
+
+    # Combinations of scripts that are commonly used together (UTS #39, "Highly Restrictive")
+    __single_script_sets = (frozenset(["Latn", "Hani", "Hira", "Kana"]), frozenset(["Latn", "Hani", "Bopo"]), frozenset(["Latn", "Hani", "Hang"]))
+
+
+    @classmethod
+    def language_routing(cls) -> MappingProxyType:
+        """
+        Retrieve the routing table used by `by_language` for languages without an entry in the alphabet json file.
+
+        The table maps each such language to the script(s) it is written in, e.g., `Language.Hindi` --> `(Abugida.Hindi,)`, 
+        `Language.Korean` --> `(Featural.Hangul,)` (via the ISO 15924 --> ISO 639-2/3 mapping) or `Language.Japanese` --> 
+        `(Syllabary.Hiragana, Syllabary.Katakana, Logographic.Kanji)`. It is computed once per process from the script enums, 
+        so that fallback lookups are a single dictionary access. Languages without any matching script are not contained.
+
+        Returns:
+            MappingProxyType: A read-only mapping of `Language` to a tuple of script enum members.
+        """
+        if cls.__language_routing is not None:
+            return cls.__language_routing
+
+        with cls.__language_routing_lock:
+            if cls.__language_routing is None:
+                # Special case for languages that have *multiple* writing systems and non-mapable language codes.
+                routing = {cls.Language.Japanese: (cls.Syllabary.Hiragana, cls.Syllabary.Katakana, cls.Logographic.Kanji)}
+                
+                # ISO 15924 groups take precedence over the script names (Note: Add other writing systems only when needed..)
+                for iso_15924_group, language_codes in cls.__iso_15924_to_iso_639_2_3.items():
+                    for script_type in [cls.Abugida, cls.Featural]:
+                        scripts = [s for s in script_type if s.value[0] == iso_15924_group]
+                        for language in cls.Language:
+                            if scripts and language.value[0] in language_codes:
+                                routing.setdefault(language, (scripts[0],))
 
+                for script_type in [cls.Syllabary, cls.Logographic, cls.Featural, cls.Abjad, cls.Abugida]:
+                    for language in cls.Language:
+                        if language.name in script_type.__members__:
+                            routing.setdefault(language, (script_type[language.name],))
 
-    def __init__(self) -> NoReturn:
+                cls.__language_routing = MappingProxyType(routing)
+            return cls.__language_routing
+
+
+    def __init__(self, overlay_dirs: Union[str, Path, list[Union[str, Path]], None] = None, token_cache_size: int = 0) -> NoReturn:
+        """
+        Parameters:
+            overlay_dirs (str | Path | list[str | Path] | None, optional): Directories containing user-provided script 
+                JSON files (e.g., `alphabet.json`) in the same format as the internal files. Their entries are merged 
+                with the internal data, where later directories take precedence. Defaults to None.
+            token_cache_size (int, optional): The maximum number of entries of the LRU cache for the results of 
+                `strip_non_script_characters` (per token, if processed token-wise) and the `is_*` checks (per sequence). 
+                Since the frequencies of tokens in natural language follow a Zipfian distribution, most of them are 
+                then processed only once. Defaults to 0 (disabled).
+
+        Raises:
+            FileNotFoundError: If an internal JSON file or one of the given overlay directories does not exist.
+        """
         self.__jsonfiles_present()
+
+        if overlay_dirs is None:
+            overlay_dirs = []
+        elif isinstance(overlay_dirs, (str, Path)):
+            overlay_dirs = [overlay_dirs]
+        self.__overlay_dirs = [Path(d) for d in overlay_dirs]
+
+        missing_dirs = [str(d) for d in self.__overlay_dirs if not d.is_dir()]
+        if missing_dirs:
+            raise FileNotFoundError(f"The following overlay directories were not found: {missing_dirs}")
+
+        self.__lock = threading.RLock() # Guards the lazily built caches below
+        self.__script_data = {}
         self.writing_systems_to_scripts = self.__mapping_writing_systems_to_scripts()
-        self.iso_15924_to_iso_639_2_3 = { "Hang" : set(["kor", "jje"]), } # Required for fallback strategy (ISO 639-2/3 language code --> ISO 15924)
+        self.iso_15924_to_iso_639_2_3 = self.__iso_15924_to_iso_639_2_3
+        self.__language_characters = {}
+        self.__character_profiles = {}
+        self.__segmentation_tables = {}
+        self.__script_fallbacks = {}
+        self.__confusable_scripts = None
+        self.__letter_tries = {}
+        self.__sort_keys = {}
+        self.__alphabet_encoders = {}
+        self.__alphabet_bitsets = None
+        self.__validation_patterns = {}
+        self.__strip_filters = {}
+        self.__token_cache_size = token_cache_size
+        self.__token_cache = functools.lru_cache(maxsize=token_cache_size)(self.__process_token) if token_cache_size > 0 else None
+
+
+    def register_script(self, json_file: JsonUtils.FilePath, key: str, script: Union[list[str], CodepointRangeSet]) -> None:
+        """
+        Adds or replaces a script in memory, without modifying the internal JSON files.
+
+        Only the derived entries affected by the registration are rebuilt: the character set of the respective writing 
+        system type, the cached characters of the languages using the script and the cached profiles of the characters 
+        of the old and new script. All other tables and JSON files are not reloaded.
+
+        Parameters:
+            json_file (FilePath): The script JSON file the entry belongs to (e.g., `JsonUtils.FilePath.Alphabet`).
+            key (str): The key of the entry, i.e., an ISO 639-2/3 language code for alphabets, otherwise an ISO 15924 
+                (or ISO 639-2/3) code as used in the respective enum (e.g., `Abugida`).
+            script (list[str] | CodepointRangeSet): The characters (and multigraphs) of the script. Large scripts such as 
+                entire Unicode blocks can be given as a `CodepointRangeSet`, which is then used without materializing its characters 
+                by the membership checks (`is_*`, `validate`, `strip_non_script_characters`, `language_characters`). Note that 
+                methods that enumerate the characters of a script still iterate all of its codepoints, i.e., `by_language`, 
+                `by_script`, the tables of `segment_by_script`, `alphabet_bitsets` (and the methods based on it), `sort_key` 
+                and `alphabet_encoder`.
+
+        Raises:
+            ValueError: If the given file is not a script JSON file.
+            Non_Existing_ISO_639_2_Langcode: If an alphabet is registered for a non-existing ISO 639-2/3 language code.
+
+        Example:
+            >>> ws.register_script(JsonUtils.FilePath.Alphabet, "haw", ["A", "E", "H", ..., "ʻ"])
+            >>> ws.by_language(ws.Language.Hawaiian, as_list=True)
+            ['A', 'E', 'H', ..., 'ʻ']
+        """
+        if json_file not in self.__script_files:
+            raise ValueError(f"Scripts can only be registered for the following json files: {[f.name for f in self.__script_files]}")
+
+        if json_file == JsonUtils.FilePath.Alphabet and not JsonUtils.language_code_exists(key):
+            raise Non_Existing_ISO_639_2_Langcode(f"Specified language code: [{key}] does not exist in both the ISO 639-1/2 and ISO 639-3 databases.")
+
+        with self.__lock:
+            # Copy-on-write, so that concurrent readers never observe a partially updated table.
+            data = dict(self.__load_script_data(json_file))
+            old_script = data.get(key, {}).get("script", [])
+            data[key] = {"script": script if isinstance(script, CodepointRangeSet) else list(script)}
+            self.__script_data[json_file] = data
+
+            # Alphabets are registered per language code, whereas all other scripts are reached via the fallback routing.
+            routing = self.language_routing()
+            for language_cache in [self.__language_characters, self.__letter_tries, self.__sort_keys, self.__alphabet_encoders]:
+                for language in list(language_cache):
+                    if language.value[0] == key or any(type(script).__name__ == json_file.name and script.value[0] == key 
+                                                       for script in routing.get(language, ())):
+                        del language_cache[language]
+
+            self.__segmentation_tables.clear()
+            self.__script_fallbacks.clear()
+            self.__confusable_scripts = None
+            self.__alphabet_bitsets = None
+            self.__validation_patterns.clear()
+            self.__strip_filters.clear()
+            self.clear_token_cache()
+
+            if isinstance(old_script, CodepointRangeSet) or isinstance(script, CodepointRangeSet):
+                self.__character_profiles.clear()
+            else:
+                for c in set("".join(old_script)) | set("".join(script)):
+                    self.__character_profiles.pop(c, None)
+
+            # Replaced last, since external caches (e.g., pipelines and accessor patterns) are invalidated by its identity, 
+            # so that they are never rebuilt from derived entries that are about to be cleared.
+            if json_file.name in self.writing_systems_to_scripts:
+                mapping = dict(self.writing_systems_to_scripts)
+                mapping[json_file.name] = self.__script_type_characters(list(data.values()))
+                self.writing_systems_to_scripts = MappingProxyType(mapping)
+
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["writing_systems_to_scripts"] = dict(self.writing_systems_to_scripts)
+        state["iso_15924_to_iso_639_2_3"] = dict(self.iso_15924_to_iso_639_2_3)
+        del state["_WritingSystem__lock"]
+        del state["_WritingSystem__token_cache"]
+        state["_WritingSystem__strip_filters"] = {} # Contains lambdas, which cannot be pickled
+        return state
+
+
+    def __setstate__(self, state: dict) -> None:
+        state["writing_systems_to_scripts"] = MappingProxyType(state["writing_systems_to_scripts"])
+        state["iso_15924_to_iso_639_2_3"] = MappingProxyType(state["iso_15924_to_iso_639_2_3"])
+        self.__dict__.update(state)
+        self.__lock = threading.RLock()
+        self.__token_cache = functools.lru_cache(maxsize=self.__token_cache_size)(self.__process_token) if self.__token_cache_size > 0 else None
+
+
+    def preload_for_fork(self, path: Union[str, Path, None] = None, freeze: bool = True) -> None:
+        """
+        Build all lazily loaded tables up front, so that forked worker processes (e.g., of pre-fork web servers or 
+        Celery pools) share them with the parent process instead of building private copies.
+
+        Python writes to every object it touches (reference counts and garbage collector headers), which breaks the 
+        copy-on-write sharing of the pages holding the tables. Two measures counteract this:
+            - With `freeze`, all objects are moved into the permanent generation of the garbage collector (`gc.freeze`), 
+              so that collections in the workers no longer write to them.
+            - With a `path`, the character tables of all writing system types (`writing_systems_to_scripts`) and of all 
+              languages (`language_characters`) are written as packed codepoint ranges into a single file, which is 
+              memory-mapped read-only. The lookups of the `is_*` methods and `language_characters` then read directly 
+              from the shared mapping. In exchange, each membership test is a binary search instead of a hash lookup, 
+              which makes the `is_*` methods about 7-8x and membership tests on `language_characters` about 2-3x slower 
+              per character (see `benchmarks/packed_membership.py`). The regex-based paths (`validate`, the `*_bulk` 
+              methods) and `strip_non_script_characters` are not affected.
+
+        Only these tables are packed. The script data of `by_language`, the ISO tables, the filters of 
+        `strip_non_script_characters` and the bitsets of `alphabet_bitsets` remain regular Python objects, which are 
+        built up front (and frozen) but still become private to a worker as soon as it touches their pages. The ISO 639-3 
+        table can be shared with the memory-mapped backend of `JsonUtils.set_iso_639_3_backend`.
+
+        Call this method in the parent process right before forking (e.g., in the `preload_app` phase of gunicorn).
+
+        Parameters:
+            path (str | Path | None, optional): The file for the packed tables (e.g., on a tmpfs such as /dev/shm). If None, 
+                the tables remain regular Python objects. Defaults to None.
+            freeze (bool, optional): Whether to call `gc.freeze()` after preloading. Note that this affects all objects of 
+                the process, not only those of this instance. Defaults to True.
+        """
+        with self.__lock:
+            for json_file in self.__script_files:
+                self.__load_script_data(json_file)
+            self.language_routing()
+            self.unicode_block(" ")
+            for language in self.Language:
+                self.language_characters(language)
+            self.alphabet_bitsets()
+
+            if path is not None:
+                as_range_set = lambda characters: characters if isinstance(characters, CodepointRangeSet) else CodepointRangeSet.from_characters(characters)
+                tables = {f"type:{name}": as_range_set(characters) for name, characters in self.writing_systems_to_scripts.items()}
+                tables.update({f"language:{language.name}": as_range_set(characters) for language, characters in self.__language_characters.items()})
+                pack_range_sets(tables, path)
+
+                shared = load_range_sets(path)
+                self.writing_systems_to_scripts = MappingProxyType({name: shared[f"type:{name}"] for name in self.writing_systems_to_scripts})
+                self.__language_characters = {language: shared[f"language:{language.name}"] for language in self.__language_characters}
+                self.__validation_patterns.clear()
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
+
+
+    def __process_token(self, operation: str, filter_key: tuple, token: str) -> Union[str, bool]:
+        """
+        Computes the (cached) result of a single token, where the operation is either "strip" (with the key of a 
+        precompiled filter) or a writing system type (with the arguments of `is_writing_system`).
+        """
+        if operation == "strip":
+            languages, decomposed = filter_key
+            return self.__strip_sequence(token, self.__strip_filter(languages), decomposed)
+        return self.__check_writing_system(token, operation, *filter_key)
+
+
+    def token_cache_info(self) -> Union[dict, None]:
+        """
+        Retrieve the statistics of the token cache (see the `token_cache_size` parameter of the constructor).
+
+        Returns:
+            dict | None: A dictionary with the entries "hits", "misses", "hit_rate", "size" and "maxsize", or None if 
+            the token cache is disabled.
+
+        Example:
+            >>> ws = WritingSystem(token_cache_size=10_000)
+            >>> ws.strip_non_script_characters("der Hund und der Hund", ws.Language.German)
+            'der Hund und der Hund'
+            >>> ws.token_cache_info()
+            {'hits': 2, 'misses': 3, 'hit_rate': 0.4, 'size': 3, 'maxsize': 10000}
+        """
+        if self.__token_cache is None:
+            return None
+
+        info = self.__token_cache.cache_info()
+        lookups = info.hits + info.misses
+        return {"hits": info.hits, "misses": info.misses, "hit_rate": info.hits / lookups if lookups else 0.0, 
+                "size": info.currsize, "maxsize": info.maxsize}
+
+
+    def clear_token_cache(self) -> None:
+        """Discards all entries and statistics of the token cache (if enabled)."""
+        if self.__token_cache is not None:
+            self.__token_cache.cache_clear()
 
 
     def iso_code_to_name(self, iso_code: str) -> str:
@@ -559,7 +1049,7 @@ class WritingSystem:
         # Assume we are given an ISO 639-2/3 code.
         if len(iso_code) == 3:
             iso_639_1_2_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_1_2_Language_Code)
-            iso_639_3_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_3_Language_Code)
+            iso_639_3_dict = JsonUtils.load_iso_639_3_table()
 
             if iso_code in iso_639_1_2_dict:
                 return iso_639_1_2_dict[iso_code][1]
@@ -576,6 +1066,112 @@ class WritingSystem:
             raise ValueError(f"The specified string [{iso_code}] does not appear to represent a valid ISO 639-2/3 or ISO 15924 code.")
 
 
+    @staticmethod
+    def __combining_sequences(text: str) -> Iterable[str]:
+        """
+        Splits a text into its combining character sequences, i.e., a character followed by all marks (and Hangul vowel or 
+        trailing Jamo) that may compose with it under NFC. Marks following whitespace form a sequence on their own.
+        """
+        start = 0
+        for i in range(1, len(text)):
+            c = text[i]
+            if text[start].isspace() or not (unicodedata.category(c)[0] == "M" or "\u1160" <= c <= "\u11FF" or "\uD7B0" <= c <= "\uD7FF"):
+                yield text[start:i]
+                start = i
+        if text:
+            yield text[start:]
+
+
+    @classmethod
+    def __retained_indices(cls, text: str, keep, decomposed: bool, offset: int = 0) -> list[int]:
+        """
+        Returns the indices (shifted by `offset`) of the characters of the text that are retained by the membership test.
+
+        If `decomposed` is True and the text is not NFC-normalized, each combining character sequence is composed on its 
+        own and retained (in its original form) only if all characters of its composition belong to the script(s), so 
+        that the result corresponds to the result of the normalized text. Otherwise, each character is tested on its own.
+        """
+        if not decomposed or unicodedata.is_normalized("NFC", text):
+            return [i for i, c in enumerate(text, offset) if keep(c)]
+
+        indices, start = [], offset
+        for sequence in cls.__combining_sequences(text):
+            composed = unicodedata.normalize("NFC", sequence)
+            if composed == sequence:
+                indices.extend([i for i, c in enumerate(sequence, start) if keep(c)])
+            elif all(map(keep, composed)):
+                indices.extend(range(start, start + len(sequence)))
+            start += len(sequence)
+        return indices
+
+
+    @classmethod
+    def __strip_sequence(cls, text: str, keep, decomposed: bool) -> str:
+        """Removes the characters of the text that are not retained by the membership test (see `__retained_indices`)."""
+        if not decomposed or unicodedata.is_normalized("NFC", text):
+            return "".join([c for c in text if keep(c)])
+        return "".join([text[i] for i in cls.__retained_indices(text, keep, decomposed)])
+
+
+    @classmethod
+    def __strip_with_offsets(cls, input_text: str, keep, decomposed: bool, process_token_wise: bool, strip_spaces: bool) -> tuple[str, array]:
+        """Filters the input text as `strip_non_script_characters` does, while recording the original index of each retained character."""
+        if process_token_wise:
+            offsets = array("I")
+            previous_end = None
+
+            for token in re.finditer(r"\S+", input_text):
+                if previous_end is not None:
+                    offsets.append(previous_end)
+                offsets.extend(cls.__retained_indices(token.group(), keep, decomposed, token.start()))
+                previous_end = token.end()
+            # Joining tokens inserts a single space, whereas the original whitespace may differ (e.g., tabs or line breaks).
+            characters = [input_text[i] if not input_text[i].isspace() else " " for i in offsets]
+        else:
+            offsets = array("I", cls.__retained_indices(input_text, keep, decomposed))
+            characters = [input_text[i] for i in offsets]
+
+        start, end = 0, len(characters)
+        if strip_spaces:
+            while start < end and characters[start].isspace():
+                start += 1
+            while end > start and characters[end - 1].isspace():
+                end -= 1
+        return "".join(characters[start:end]), offsets[start:end]
+
+
+    def __strip_filter(self, languages: Union[tuple, None]):
+        """Builds (once per tuple of languages or None) the membership test used by `strip_non_script_characters`."""
+        keep = self.__strip_filters.get(languages)
+        if keep is not None:
+            return keep
+
+        with self.__lock:
+            if languages not in self.__strip_filters:
+                # If no language is given, all characters of all supported script types 
+                # (abjad, abugida, alphabet, syllabary, logographic and featural) will be used.
+                script_characters = set()
+                script_ranges = []
+
+                if languages is None:
+                    script_characters.update(self.all_script_characters())
+                else:
+                    for language in languages:
+                        if isinstance(language, CodepointRangeSet):
+                            script_ranges.append(language)
+                        else:
+                            script_characters.update(self.by_language(language, as_list=True))
+
+                script_characters = frozenset(script_characters)
+
+                if script_ranges:
+                    keep = lambda c: c in script_characters or any(c in r for r in script_ranges)
+                else:
+                    keep = script_characters.__contains__
+                self.__strip_filters[languages] = keep
+            return self.__strip_filters[languages]
+
+
     def decompose_korean_char_sequence(self, sequence: str) -> str:
         """
         Decompose a sequence of Korean characters into their constituent Hangul Jamo components.
@@ -597,7 +1193,7 @@ class WritingSystem:
         return j2hcj(h2j(sequence))
 
 
-    def is_writing_system(self, sequence: str, script_type: str, strip_spaces: bool = True) -> bool:
+    def is_writing_system(self, sequence: str, script_type: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
         """
         Check if a sequence of characters belongs to a specified writing system.
 
@@ -611,6 +1207,9 @@ class WritingSystem:
         script_type (str): The type of writing system to check against. This should be one of 
                         'Abjad', 'Abugida', 'Alphabet', 'Syllabary', 'Logographic', or 'Featural'.
         strip_spaces (bool): Whether to strip spaces from the input string before checking. Default is True.
+        normalize (bool): Whether to take Unicode normalization into account, so that decomposed (NFD) input, e.g., from 
+                        macOS file names, matches the composed (NFC) script data. If the sequence is already NFC-normalized 
+                        (checked via `unicodedata.is_normalized`), it is checked as is. Otherwise, it is NFC-normalized first. Default is False.
 
         Returns:
         bool: True if all characters in the sequence belong to the specified writing system, False otherwise.
@@ -628,8 +1227,18 @@ class WritingSystem:
         >>> is_writing_system('안녕하세요', 'Featural')
         True
         """
+        if self.__token_cache is not None and script_type in self.writing_systems_to_scripts:
+            return self.__token_cache(script_type, (strip_spaces, normalize), sequence)
+        return self.__check_writing_system(sequence, script_type, strip_spaces, normalize)
+
+
+    def __check_writing_system(self, sequence: str, script_type: str, strip_spaces: bool, normalize: bool) -> bool:
         if sequence and strip_spaces:
             sequence = re.sub(r"\s+", "", sequence)
+
+        # Fast path: NFC input (the common case) is matched against the script data as it is.
+        if normalize and not unicodedata.is_normalized("NFC", sequence):
+            sequence = unicodedata.normalize("NFC", sequence)
         
         # Special case for Hangul (each character must be decomposed into its constituents)
         if script_type == "Featural":
@@ -639,27 +1248,250 @@ class WritingSystem:
         
         if system_key is None:
             raise ValueError(f"Unknown writing system type: {script_type}")
-        
+
         return all(c in system_key for c in sequence)
 
 
-    def is_alphabet(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, 'Alphabet', strip_spaces)
+    def is_alphabet(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, 'Alphabet', strip_spaces, normalize)
     
-    def is_abjad(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, self.Abjad.__name__, strip_spaces)
+    def is_abjad(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, self.Abjad.__name__, strip_spaces, normalize)
+
+    def is_abugida(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, self.Abugida.__name__, strip_spaces, normalize)
+
+    def is_syllabary(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, self.Syllabary.__name__, strip_spaces, normalize)
+
+    def is_logographic(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, self.Logographic.__name__, strip_spaces, normalize)
+
+    def is_featural(self, sequence: str, strip_spaces: bool = True, normalize: bool = False) -> bool:
+        return self.is_writing_system(sequence, self.Featural.__name__, strip_spaces, normalize)
+
+
+    def is_writing_system_bulk(self, sequences: Iterable[str], script_type: str, strip_spaces: bool = True) -> list[bool]:
+        """
+        Check each of the given sequences against a writing system type (see `is_writing_system`). Each check is a single 
+        regex search for a character outside the type, where the regex is compiled once per type and cached.
+
+        Returns:
+            list[bool]: The result of each sequence.
+
+        Raises:
+            ValueError: If an unknown writing system type is provided.
+        """
+        if script_type not in self.writing_systems_to_scripts:
+            raise ValueError(f"Unknown writing system type: {script_type}")
+        search = self.__validation_pattern(script_type, strip_spaces).search
+        return [search(sequence) is None for sequence in sequences]
+
+
+    def classify(self, sequence: str, strip_spaces: bool = True) -> Union[str, None]:
+        """
+        Determine the most specific writing system type that covers all characters of a sequence, in the order of 
+        `classification_order` (e.g., Arabic letters that are also part of alphabets are classified as 'Abjad').
+
+        Parameters:
+            sequence (str): The input string to be classified.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+
+        Returns:
+            str | None: The writing system type, or None if no single type covers the sequence (or it is empty).
+
+        Example:
+            >>> ws.classify("مرحبا")
+            'Abjad'
+        """
+        return self.classify_bulk([sequence], strip_spaces)[0]
+
+
+    def classify_bulk(self, sequences: Iterable[str], strip_spaces: bool = True) -> list[Union[str, None]]:
+        """
+        Determine the most specific writing system type of each of the given sequences (see `classify`), where each type 
+        only checks the sequences that were not yet classified.
+
+        Returns:
+            list[str | None]: The writing system type of each sequence.
+        """
+        sequences = list(sequences)
+        results = [None] * len(sequences)
+        blank = re.compile(r"\s*" if strip_spaces else "")
+        unclassified = [i for i, sequence in enumerate(sequences) if not blank.fullmatch(sequence)]
+
+        for script_type in self.classification_order:
+            search = self.__validation_pattern(script_type, strip_spaces).search
+            remaining = []
+            for i in unclassified:
+                if search(sequences[i]) is None:
+                    results[i] = script_type
+                else:
+                    remaining.append(i)
+            unclassified = remaining
+        return results
+
+
+    def is_script(self, sequence: str, script: Union[Abjad, Abugida, Syllabary, Logographic, Featural], strip_spaces: bool = True) -> bool:
+        """
+        Check if a sequence of characters belongs to a specific script, e.g., `Abugida.Devanagari`.
+
+        In contrast to the `is_*` methods of the writing system types (e.g., `is_abugida`), which accept any mix of the 
+        scripts of a type, only the characters of the given script are accepted. The check is a single regex search for 
+        a character outside the script, where the regex is compiled once per script and cached. Hangul syllables are 
+        accepted if all of their Jamo constituents belong to the script.
+
+        Parameters:
+            sequence (str): The input string to be checked.
+            script (Abjad | Abugida | Syllabary | Logographic | Featural): The script to check against.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+
+        Returns:
+            bool: True if all characters in the sequence belong to the script, False otherwise.
+
+        Example:
+            >>> ws.is_script("नमस्ते", ws.Abugida.Devanagari)
+            True
+            >>> ws.is_script("नमस्ते ሰላም", ws.Abugida.Devanagari)
+            False
+        """
+        return self.__validation_pattern(script, strip_spaces).search(sequence) is None
+
+
+    def is_script_bulk(self, sequences: Iterable[str], script: Union[Abjad, Abugida, Syllabary, Logographic, Featural], strip_spaces: bool = True) -> list[bool]:
+        """
+        Check each of the given sequences against a specific script (see `is_script`).
+
+        Returns:
+            list[bool]: The result of each sequence.
+        """
+        search = self.__validation_pattern(script, strip_spaces).search
+        return [search(sequence) is None for sequence in sequences]
+
+
+    def is_language(self, sequence: str, language: Language, strip_spaces: bool = True) -> bool:
+        """
+        Check if a sequence of characters belongs to the script(s) of a specific language, e.g., `Language.German`.
+
+        Multigraphs are split into their constituent characters, and for languages with multiple scripts (e.g., Japanese), 
+        the characters of all of them are accepted (see `language_characters`). The check is a single regex search for a 
+        character outside the script(s), where the regex is compiled once per language and cached.
+
+        Parameters:
+            sequence (str): The input string to be checked.
+            language (Language): The language to check against.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+
+        Returns:
+            bool: True if all characters in the sequence belong to the script(s) of the language, False otherwise.
+
+        Example:
+            >>> ws.is_language("Grüße", ws.Language.German)
+            True
+            >>> ws.is_language("Grüße", ws.Language.English)
+            False
+        """
+        return self.__validation_pattern(language, strip_spaces).search(sequence) is None
+
+
+    def is_language_bulk(self, sequences: Iterable[str], language: Language, strip_spaces: bool = True) -> list[bool]:
+        """
+        Check each of the given sequences against the script(s) of a specific language (see `is_language`).
+
+        Returns:
+            list[bool]: The result of each sequence.
+        """
+        search = self.__validation_pattern(language, strip_spaces).search
+        return [search(sequence) is None for sequence in sequences]
+
+
+    def estimate_writing_system(self,
+                                sequence: str,
+                                script_type: str,
+                                sample_size: int = 4096,
+                                window_size: int = 64,
+                                confidence: float = 0.95,
+                                early_stop: bool = True,
+                                strip_spaces: bool = True,
+                                seed: Union[int, None] = None) -> dict:
+        """
+        Estimate whether (and to which extent) a very long sequence belongs to a specified writing system, based on a random sample.
+
+        Instead of scanning the entire sequence as `is_writing_system` does, only randomly positioned windows of contiguous 
+        characters are checked. The share of in-script characters is then estimated together with a confidence interval, 
+        for which the windows (not the characters, which are strongly correlated within a window) are the sampling unit, 
+        see `cluster_wilson_interval`. Hence, the interval of a sample of n windows is never narrower than the one of n 
+        independent characters. With `early_stop`, the scan stops at the first out-of-script character, since the sequence then certainly does not 
+        belong (entirely) to the writing system.
+
+        Parameters:
+            sequence (str): The input string to be checked.
+            script_type (str): The type of writing system to check against ('Abjad', 'Abugida', 'Alphabet', 'Syllabary', 
+                'Logographic' or 'Featural').
+            sample_size (int, optional): The number of characters to be sampled. Sequences that are not longer are checked 
+                entirely. Defaults to 4096.
+            window_size (int, optional): The number of contiguous characters per sampled window. Defaults to 64.
+            confidence (float, optional): The confidence level of the interval within (0; 1). Defaults to 0.95.
+            early_stop (bool, optional): Whether to stop at the first out-of-script character. Defaults to True.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+            seed (int | None, optional): The seed for reproducible samples. Defaults to None.
 
-    def is_abugida(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, self.Abugida.__name__, strip_spaces)
+        Returns:
+            dict: A dictionary with the following entries:
+                - "verdict": True if no out-of-script character was found, otherwise False.
+                - "certain": Whether the verdict is certain, i.e., an out-of-script character was found or the entire sequence was checked.
+                - "share": The share of in-script characters among the checked characters.
+                - "lower"/"upper": The bounds of the (Wilson) confidence interval for the share of in-script characters 
+                  of the entire sequence, based on the effective sample size of the windows (equal to "share" if the 
+                  entire sequence was checked).
+                - "sampled": The number of checked (non-whitespace) characters.
 
-    def is_syllabary(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, self.Syllabary.__name__, strip_spaces)
+        Raises:
+            ValueError: If an unknown writing system type or an invalid sample size, window size or confidence is provided.
 
-    def is_logographic(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, self.Logographic.__name__, strip_spaces)
+        Example:
+            >>> result = ws.estimate_writing_system("Hallo Welt " * 1_000_000, "Alphabet", seed=0)
+            >>> result["verdict"], result["certain"], round(result["lower"], 3)
+            (True, False, 0.999)
+        """
+        system_key = self.writing_systems_to_scripts.get(script_type)
+        if system_key is None:
+            raise ValueError(f"Unknown writing system type: {script_type}")
 
-    def is_featural(self, sequence: str, strip_spaces: bool = True) -> bool:
-        return self.is_writing_system(sequence, self.Featural.__name__, strip_spaces)
+        windows = sample_windows(sequence, sample_size, window_size, seed)
+        exhaustive = len(windows) == 1 and windows[0] is sequence
+        sizes, in_script = [], []  # The number of checked and in-script characters per window
+
+        for window in windows:
+            if script_type == "Featural":
+                window = self.decompose_korean_char_sequence(window)
+            if strip_spaces:
+                window = re.sub(r"\s+", "", window)
+
+            if early_stop:
+                offending = next((i for i, c in enumerate(window) if c not in system_key), None)
+                if offending is not None:
+                    sizes.append(offending + 1)
+                    in_script.append(offending)
+                    break
+                sizes.append(len(window))
+                in_script.append(len(window))
+            else:
+                sizes.append(len(window))
+                in_script.append(sum(1 for c in window if c in system_key))
+
+        sampled = sum(sizes)
+        out_of_script = sampled - sum(in_script)
+        share = (sampled - out_of_script) / sampled if sampled else 1.0
+        lower, upper = (share, share) if exhaustive and not (early_stop and out_of_script) else cluster_wilson_interval(in_script, sizes, confidence)
+        return {
+            "verdict": out_of_script == 0,
+            "certain": exhaustive or out_of_script > 0,
+            "share": share,
+            "lower": lower,
+            "upper": upper,
+            "sampled": sampled,
+        }
 
 
     def pretty_print(self, script_dict: dict, show_script_key: bool = False) -> NoReturn:
@@ -720,6 +1552,11 @@ class WritingSystem:
         NATO_Phonetic_Alphabet = auto()
 
 
+    class SegmentationLevel(Enum):
+        Script = auto(), # ISO 15924 script (e.g., Latn, Arab, Hira)
+        Type = auto() # Writing system type (e.g., Alphabet, Abjad, Syllabary)
+
+
     def text_to_latin_script_code(self,
                                   word_2_translate: str,
                                   latin_script_code: LatinScriptCode,
@@ -801,13 +1638,13 @@ class WritingSystem:
         }
         
         script_class = type(script_type)
-        _dict = JsonUtils.load_dict_from_jsonfile(file_path_mapping[script_class])
+        _dict = self.__load_script_data(file_path_mapping[script_class])
         
         if script_class is self.LatinScriptCode:
-            return {script_type.name: _dict[script_type.name]["script"]}
+            return {script_type.name: dict(_dict[script_type.name]["script"])}
                         
         iso_name = script_type.value[0]
-        script = _dict[iso_name]["script"]
+        script = list(_dict[iso_name]["script"])
         
         return script if as_list else {iso_name: script}
 
@@ -972,7 +1809,7 @@ class WritingSystem:
        
         # Check if the accociated language code exists within the internal JsonFile.Alphabet file.
         # If the key is not present, perform a fallback to the other script types contained in the json files and return the respective script.
-        alphabet_json = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Alphabet)
+        alphabet_json = self.__load_script_data(JsonUtils.FilePath.Alphabet)
         language_code = language.value[0]
 
         alphabet = None
@@ -983,50 +1820,18 @@ class WritingSystem:
             # Note that for such languages such as Japanese none of the filters below can be applied. 
             # Also, the parameter *as_list* is ignored, as otherwise it is difficult to understand which list refers to which writing system.
             # Thus, the respective writing system type(s) is/are returned as they are.
-            if language == self.Language.Japanese:
-                return {self.Language.Japanese.name: {self.Syllabary.Hiragana.name: self.by_syllabary(self.Syllabary.Hiragana, as_list=True),
-                        self.Syllabary.Katakana.name : self.by_syllabary(self.Syllabary.Katakana, as_list=True),
-                        self.Logographic.Kanji.name : self.by_logographic(self.Logographic.Kanji, as_list=True)}}
-            # ---------------------------------------------------------------------------------------
+            route = self.language_routing().get(language)
+            if route is None:
+                return None
 
-            abjad_dict = dict([(a.name, a.value[0]) for a in self.Abjad])
-            abugida_dict = dict([(a.name, a.value[0]) for a in self.Abugida])
-            syllabary_dict = dict([(s.name, s.value[0]) for s in self.Syllabary])
-            logographic_dict = dict([(l.name, l.value[0]) for l in self.Logographic])
-            featural_dict = dict([(l.name, l.value[0]) for l in self.Featural])
-            
-            # Note: Add other writing systems only when needed..
-            for iso_15924_group, languages in self.iso_15924_to_iso_639_2_3.items():
-                if language_code in languages:
-                    if iso_15924_group in set([a.value[0] for a in self.Abugida]):
-                        script = self.by_abugida(self.Abugida[self.retrieve_iso_formal_name(iso_15924_group, self.Abugida)], as_list=True)
-                        return script if as_list else {language.name : script}
-                    
-                    elif iso_15924_group in set([a.value[0] for a in self.Featural]):
-                        script = self.by_featural(self.Featural[self.retrieve_iso_formal_name(iso_15924_group, self.Featural)], as_list=True)
-                        return script if as_list else {language.name : script}
-
-            if language.name in syllabary_dict:
-                script = self.by_syllabary(self.Syllabary[language.name], as_list=True)
-                return script if as_list else {language.name : script}
-
-            if language.name in logographic_dict:
-                script = self.by_logographic(self.Logographic[language.name], as_list=True)
-                return script if as_list else {language.name : script}
-            
-            if language.name in featural_dict:
-                script = self.by_featural(self.Featural[language.name], as_list=True)
-                return script if as_list else {language.name : script}
-
-            if language.name in abjad_dict:
-                script = self.by_abjad(self.Abjad[language.name], as_list=True)
-                return script if as_list else {language.name : script}
+            if len(route) > 1:
+                return {language.name: {script.name: self.by_script(script, as_list=True) for script in route}}
+            # ---------------------------------------------------------------------------------------
 
-            if language.name in abugida_dict:
-                script = self.by_abugida(self.Abugida[language.name], as_list=True)
-                return script if as_list else {language.name : script}
+            script = self.by_script(route[0], as_list=True)
+            return script if as_list else {language.name : script}
         else:
-            alphabet = alphabet_json[language_code]["script"]
+            alphabet = list(alphabet_json[language_code]["script"])
 
         # In case the given language has an alphabet, the following filters are optional.
         # ---------------------------------------------------------------------------------------
@@ -1071,7 +1876,7 @@ class WritingSystem:
                 for _, chars in jap_scripts.items():
                     script_characters.extend(chars)
             else:
-                script_characters.extend(self.by_language(language, as_list=True))
+                script_characters.extend(self.by_language(language, as_list=True) or [])
 
         return sorted(set(script_characters))
 
@@ -1080,7 +1885,9 @@ class WritingSystem:
                                     input_text: str,
                                     languages: Union[Language, list[Language], None] = None,
                                     process_token_wise: bool = True,
-                                    strip_spaces: bool = True) -> str:
+                                    strip_spaces: bool = True,
+                                    normalize: bool = False,
+                                    return_offsets: bool = False) -> Union[str, tuple[str, array]]:
         """
             Remove characters from the input string that do not belong to the specified language(s) or script types.
 
@@ -1093,9 +1900,10 @@ class WritingSystem:
             input_text : str
                 The text from which non-script characters will be removed.
             
-            languages : Language | list[Language] | None, optional
-                The language(s) whose script characters are to be retained in the input text. If None, all supported script 
-                types will be considered. Defaults to None.
+            languages : Language | CodepointRangeSet | list[Language | CodepointRangeSet] | None, optional
+                The language(s) whose script characters are to be retained in the input text. Character ranges (e.g., entire 
+                Unicode blocks) can be given as `CodepointRangeSet`, which are checked without materializing their characters.
+                If None, all supported script types will be considered. Defaults to None.
             
             process_token_wise : bool, optional
                 If True, the text will be processed token-wise (word by word). If False, the text will be processed as a whole 
@@ -1104,15 +1912,30 @@ class WritingSystem:
             strip_spaces : bool, optional
                 If True, leading and trailing spaces will be stripped from the final result. Defaults to True.
 
+            normalize : bool, optional
+                If True, decomposed (NFD) characters, e.g., "u" followed by a combining diaeresis, are retained if their 
+                composed form belongs to the script(s). NFC-normalized input (and each NFC-normalized token) takes a fast 
+                path. Otherwise, only the combining character sequences are composed, each of which is retained or removed 
+                as a whole, so that the output corresponds to the output of the NFC-normalized input, while the retained 
+                characters keep their original (decomposed) form. Defaults to False.
+
+            return_offsets : bool, optional
+                If True, an offset map is computed in the same pass as the filtering, which maps each position of the 
+                processed text to its position in the input text (e.g., to project annotations back onto the input). 
+                In token-wise mode, the space joining two tokens is mapped to the first whitespace character following 
+                the former token. Defaults to False.
+
             Returns:
             --------
-            str
-                The processed text with only the characters belonging to the specified script(s) retained.
+            str | tuple[str, array]
+                The processed text with only the characters belonging to the specified script(s) retained. With 
+                `return_offsets`, a tuple of the processed text and an `array('I')` of the same length containing 
+                the original index of each character.
 
             Raises:
             -------
             ValueError
-                If the 'languages' argument is not of the expected type (None, Language, or list of Language).
+                If the 'languages' argument is not of the expected type (None, Language, CodepointRangeSet or a list of these).
 
             Examples:
             ---------
@@ -1121,66 +1944,1117 @@ class WritingSystem:
 
             >>> strip_non_script_characters("Schönes클라 Wetter*+/ heute!தமி חדשים", languages=[Language.German, Language.Hebrew])
             'Schönes Wetter heute חדשים'
+
+            >>> strip_non_script_characters("¡Hola, señor!", languages=Language.Spanish, return_offsets=True)
+            ('Hola señor', array('I', [1, 2, 3, 4, 6, 7, 8, 9, 10, 11]))
             """
 
-        # If no language is given, all characters of all supported script types 
-        # (abjad, abugida, alphabet, syllabary, logographic and featural) will be used.
-        script_characters = []
+        if isinstance(languages, (self.Language, CodepointRangeSet)):
+            languages = [languages]
         
-        if languages is None:
-            script_characters = self.all_script_characters()
-        elif isinstance(languages, self.Language):
-            script_characters = self.by_language(languages, as_list=True)
-        elif isinstance(languages, list) and all([isinstance(language, self.Language) for language in languages]):
-            for language in languages:
-                script_characters.extend(self.by_language(language, as_list=True))
-        else:
-            raise ValueError("Invalid 'languages' argument. Must be one of the following: None|Language|list[Language]")
+        if isinstance(languages, list) and all([isinstance(language, (self.Language, CodepointRangeSet)) for language in languages]):
+            languages = tuple(languages)
+        elif languages is not None:
+            raise ValueError("Invalid 'languages' argument. Must be one of the following: None|Language|CodepointRangeSet|list[Language|CodepointRangeSet]")
+
+        decomposed = normalize and not unicodedata.is_normalized("NFC", input_text)
+        filter_key = (languages, decomposed)
+        keep = self.__strip_filter(languages)
+
+        if return_offsets:
+            return self.__strip_with_offsets(input_text, keep, decomposed, process_token_wise, strip_spaces)
             
         if process_token_wise:
             result = []
             tokens = input_text.split()
             
-            for token in tokens:
-                cleaned_token = "".join([c for c in token if c in script_characters])
-                result.append(cleaned_token)
+            if self.__token_cache is not None:
+                result = [self.__token_cache("strip", filter_key, token) for token in tokens]
+            else:
+                for token in tokens:
+                    cleaned_token = self.__strip_sequence(token, keep, decomposed)
+                    result.append(cleaned_token)
             joined = " ".join(result)
         else:
-            joined = "".join([c for c in input_text if c in script_characters])
+            joined = self.__strip_sequence(input_text, keep, decomposed)
         return joined.strip() if strip_spaces else joined
 
 
-    def generate_all_characters_in_range(self, unicode_range: str) -> list[str]:
+    def language_characters(self, language: Language) -> Union[frozenset[str], CodepointRangeSet]:
         """
-        Generate a list of all characters within a specified Unicode range.
+        Retrieve the set of unique characters used by the script(s) of a given language.
 
-        This function takes a string representing a Unicode range and returns a list
-        of characters that fall within this range. The input string should specify
-        the range in the format '\\uXXXX-\\uYYYY', where XXXX and YYYY are hexadecimal
-        Unicode code points. The function will include both the start and end points
-        in the resulting list.
+        Multigraphs are split into their constituent characters and, in case of languages with multiple 
+        writing systems (e.g., Japanese), the characters of all scripts are combined. The result is computed 
+        once per language and cached, so that repeated lookups do not reload the json files.
 
         Parameters:
-            unicode_range (str): A string representing the Unicode range in the 
-                                format "\\uXXXX-\\uYYYY". For example, "\\u0061-\\u007A"
-                                represents the range from 'a' to 'z'.
+            language (Language): The language for which to retrieve the characters.
 
         Returns:
-            list[str]: A list of characters within the specified Unicode range.
+            frozenset[str] | CodepointRangeSet: The unique characters of the language's script(s). Empty, if no script is 
+            available for the language. If the alphabet was registered as a `CodepointRangeSet`, the range set itself is returned.
+        """
+        characters = self.__language_characters.get(language)
+        if characters is not None:
+            return characters
 
-        Example:
-            >>> generate_all_characters_in_range("\u0061-\u007A")
-            ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 
-            'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
+        with self.__lock:
+            if language not in self.__language_characters:
+                registered = self.__load_script_data(JsonUtils.FilePath.Alphabet).get(language.value[0], {}).get("script")
+                if isinstance(registered, CodepointRangeSet):
+                    self.__language_characters[language] = registered
+                    return registered
 
-        Notes:
-            - The function assumes that the input string is properly formatted.
-            - The input range is inclusive of both the start and end points.
-            - Only one range should be specified in the input string. Multiple ranges
-            or individual characters are not supported by this function.
+                script = self.by_language(language, as_list=True) or []
+                if isinstance(script, dict):
+                    script = [c for chars in script[language.name].values() for c in chars]
+                self.__language_characters[language] = frozenset("".join(script))
+            return self.__language_characters[language]
+
+
+    def character_profile(self, char: str) -> tuple[frozenset[str], frozenset[Language]]:
         """
+        Determine the writing system types and languages a single character belongs to.
 
-        range_start, range_end = unicode_range.split("-")
-        start = ord(range_start)
-        end = ord(range_end) + 1  # +1 to include the end character
-        return [chr(codepoint) for codepoint in range(start, end)]
+        The membership is checked in the same way as in `is_writing_system` and `by_language`. Hangul characters are 
+        decomposed into their Jamo constituents, which then all must be part of the respective script. The profile 
+        of each character is computed once and cached.
+
+        Parameters:
+            char (str): A single character.
+
+        Returns:
+            tuple[frozenset[str], frozenset[Language]]: The names of the writing system types ('Abjad', 'Alphabet', ...)
+            and the languages whose script contains the character.
+
+        Example:
+            >>> ws.character_profile("ß")
+            (frozenset({'Alphabet'}), frozenset({<Language.German: ('deu',)>, ...}))
+        """
+        profile = self.__character_profiles.get(char)
+        if profile is not None:
+            return profile
+
+        with self.__lock:
+            if char not in self.__character_profiles:
+                decomposed = self.decompose_korean_char_sequence(char)
+
+                script_types = frozenset(script_type for script_type, characters in self.writing_systems_to_scripts.items()
+                                         if all(c in characters for c in (decomposed if script_type == "Featural" else char)))
+                languages = frozenset(self.languages_for_char(char))
+                self.__character_profiles[char] = (script_types, languages)
+            return self.__character_profiles[char]
+
+
+    def __iso_15924_by_unicode_name(self) -> dict[str, str]:
+        """
+        Maps upper-cased ISO 15924 script names (e.g., "LATIN", "OLD ITALIC") to their codes. Variants (e.g., "Latf" for 
+        Latin in Fraktur) and special codes (Zxxx) are skipped, so that each name refers to the canonical script code.
+        """
+        iso_15924_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_15924_Code)
+        
+        name_map = {}
+        for code, name in iso_15924_dict.items():
+            base_name = re.sub(r"\(.*?\)", "", name).split(",")[0].strip().upper()
+            if code.startswith("Z") or ("variant" in name and base_name in name_map):
+                continue
+            if base_name not in name_map or "variant" in iso_15924_dict[name_map[base_name]]:
+                name_map[base_name] = code
+        return name_map
+
+
+    def __segmentation_table(self, level: SegmentationLevel) -> dict[str, str]:
+        """
+        Builds (once per level) the codepoint --> script table used by `segment_by_script`.
+
+        For the script level, the ISO 15924 code is derived from the character's Unicode name (e.g., "LATIN SMALL LETTER A" --> "Latn"), 
+        otherwise from the key of the script file containing the character, where variants are mapped to their base script (e.g., "Hans" --> "Hani"). 
+        For the type level, a character contained in multiple types is assigned to the most specific one (e.g., Arabic letters 
+        used in alphabets are assigned to Abjad). Punctuation, separators, numbers and control characters are not part of the table.
+        """
+        table = self.__segmentation_tables.get(level)
+        if table is not None:
+            return table
+
+        with self.__lock:
+            if level in self.__segmentation_tables:
+                return self.__segmentation_tables[level]
+
+            name_map = self.__iso_15924_by_unicode_name()
+            iso_15924_dict = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_15924_Code)
+
+            def script_of(c: str, key: Union[str, None]) -> Union[str, None]:
+                words = unicodedata.name(c, "").split()
+                for n in range(min(len(words), 4), 0, -1):
+                    if (name := " ".join(words[:n])) in name_map:
+                        return name_map[name]
+                if key in iso_15924_dict:
+                    return name_map.get(re.sub(r"\(.*?\)", "", iso_15924_dict[key]).split(",")[0].strip().upper(), key)
+                return key
+
+            # From least to most specific, so that more specific types overwrite less specific ones.
+            precedence = [JsonUtils.FilePath.Alphabet, JsonUtils.FilePath.Abjad, JsonUtils.FilePath.Abugida,
+                          JsonUtils.FilePath.Syllabary, JsonUtils.FilePath.Logographic, JsonUtils.FilePath.Featural]
+            script_enums = {JsonUtils.FilePath.Abjad: self.Abjad, JsonUtils.FilePath.Abugida: self.Abugida,
+                            JsonUtils.FilePath.Syllabary: self.Syllabary, JsonUtils.FilePath.Logographic: self.Logographic,
+                            JsonUtils.FilePath.Featural: self.Featural}
+
+            table = {}
+            for json_file in precedence:
+                data = self.__load_script_data(json_file)
+                enum_keys = [e.value[0] for e in script_enums.get(json_file, [])]
+
+                # ISO 15924 keys (in enum order) are processed last, so that they are preferred over ISO 639-2/3 keys of the same script.
+                keys = sorted(data, key=lambda k: (len(k) == 4, -enum_keys.index(k) if k in enum_keys else 0))
+                for key in keys:
+                    for c in set("".join(data[key]["script"])):
+                        if unicodedata.category(c)[0] in "PZCN":
+                            continue
+                        if level == self.SegmentationLevel.Type:
+                            table[c] = json_file.name
+                        elif json_file == JsonUtils.FilePath.Alphabet:
+                            if (script := script_of(c, None)) is not None:
+                                table[c] = script
+                        else:
+                            table[c] = script_of(c, key)
+
+            # Hangul syllables are decomposed into Jamo, hence they belong to the featural script.
+            for cp in range(0xAC00, 0xD7A4):
+                table[chr(cp)] = JsonUtils.FilePath.Featural.name if level == self.SegmentationLevel.Type else "Hang"
+
+            self.__segmentation_tables[level] = table
+            return table
+
+
+    def segment_by_script(self,
+                          text: str,
+                          level: SegmentationLevel = SegmentationLevel.Script,
+                          merge_common: bool = True) -> list[tuple[int, int, Union[str, None]]]:
+        """
+        Split a text into maximal runs of the same ISO 15924 script or writing system type.
+
+        This function is useful for routing the parts of mixed-script documents (e.g., Japanese with Latin or Arabic with digits) 
+        to different tokenizers. The scan is a single table-driven pass over the text, where the codepoint --> script table 
+        is built once from the internal script data.
+
+        Parameters:
+            text (str): The text to be segmented.
+            level (SegmentationLevel, optional): Whether runs are formed by ISO 15924 script (e.g., "Latn", "Hira") or by 
+                writing system type (e.g., "Alphabet", "Syllabary"). Defaults to SegmentationLevel.Script.
+            merge_common (bool, optional): If True, characters without a script (e.g., spaces, digits, punctuation) are 
+                merged into the preceding run (or the following run at the beginning of the text). Otherwise, they form 
+                runs of their own with the script None. Defaults to True.
+
+        Returns:
+            list[tuple[int, int, str | None]]: The (start, end, script) spans, where `text[start:end]` is the span's text.
+
+        Example:
+            >>> ws.segment_by_script("東京タワーとTokyo")
+            [(0, 2, 'Hani'), (2, 5, 'Kana'), (5, 6, 'Hira'), (6, 11, 'Latn')]
+            >>> ws.segment_by_script("مرحبا 123 hello", level=ws.SegmentationLevel.Type)
+            [(0, 10, 'Abjad'), (10, 15, 'Alphabet')]
+        """
+        table = self.__segmentation_table(level)
+
+        spans = []
+        run_start, run_script = 0, None
+        for i, script in enumerate(map(table.get, text)):
+            if script is None and merge_common:
+                continue
+            if script != run_script:
+                if i > run_start and (run_script is not None or not merge_common):
+                    spans.append((run_start, i, run_script))
+                    run_start = i
+                run_script = script
+
+        if len(text) > run_start:
+            spans.append((run_start, len(text), run_script))
+        return spans
+
+
+    @classmethod
+    def skeleton(cls, text: str) -> str:
+        """
+        Compute the skeleton of a text, i.e., a form in which confusable characters (homoglyphs) are mapped to a common 
+        prototype, so that two texts that look alike have the same skeleton (following UTS #39).
+
+        The text is decomposed (NFKD, which also maps compatibility characters such as fullwidth letters), each character 
+        is mapped to its prototype and the result is decomposed again (NFD). The confusables table is loaded once per process 
+        from the internal json file and covers the common lookalikes of Latin letters in Cyrillic, Greek, Armenian and Cherokee.
+
+        Parameters:
+            text (str): The text (e.g., a username or domain).
+
+        Returns:
+            str: The skeleton, which is only meant for comparisons, not for display.
+
+        Example:
+            >>> ws.skeleton("pаypal") == ws.skeleton("paypal")  # The first "а" is Cyrillic
+            True
+        """
+        if cls.__confusables is None:
+            with cls.__confusables_lock:
+                if cls.__confusables is None:
+                    cls.__confusables = str.maketrans(JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Confusables))
+        return unicodedata.normalize("NFD", unicodedata.normalize("NFKD", text).translate(cls.__confusables))
+
+
+    def __script_of(self, c: str, table: dict[str, str]) -> Union[str, None]:
+        """
+        Returns the ISO 15924 script of a character from the segmentation table or, for letters outside the script data, 
+        from the script of its compatibility decomposition (e.g., fullwidth "ｐ" --> "p") or its Unicode name (e.g., "ɑ"). 
+        Characters without a script (e.g., digits or combining marks) yield None.
+        """
+        script = table.get(c)
+        if script is not None or not unicodedata.category(c).startswith("L"):
+            return script
+
+        if c not in self.__script_fallbacks:
+            compatibility = unicodedata.normalize("NFKC", c)
+            if compatibility != c:
+                scripts = {self.__script_of(x, table) for x in compatibility} - {None}
+                self.__script_fallbacks[c] = scripts.pop() if len(scripts) == 1 else None
+            else:
+                name_map = self.__iso_15924_by_unicode_name()
+                words = unicodedata.name(c, "").split()
+                self.__script_fallbacks[c] = next((name_map[" ".join(words[:n])] for n in range(min(len(words), 4), 0, -1) 
+                                                   if " ".join(words[:n]) in name_map), None)
+        return self.__script_fallbacks[c]
+
+
+    def __confusable_script_index(self) -> dict[str, frozenset[str]]:
+        """Maps each prototype of the confusables table to the scripts containing a character with this prototype."""
+        index = self.__confusable_scripts
+        if index is not None:
+            return index
+
+        with self.__lock:
+            if self.__confusable_scripts is None:
+                table = self.__segmentation_table(self.SegmentationLevel.Script)
+                index = {}
+                for c, prototype in JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Confusables).items():
+                    for character in (c, prototype):
+                        if len(character) == 1 and (script := self.__script_of(character, table)) is not None:
+                            index.setdefault(prototype, set()).add(script)
+                self.__confusable_scripts = {prototype: frozenset(scripts) for prototype, scripts in index.items()}
+            return self.__confusable_scripts
+
+
+    def detect_mixed_script(self, text: str) -> dict:
+        """
+        Detect whether a text mixes multiple scripts, e.g., a Cyrillic "а" inside a Latin word, as used for spoofing 
+        usernames and domains.
+
+        The scripts are determined in a single pass over the text via the codepoint --> script table of `segment_by_script`. 
+        Characters without a script (e.g., digits, punctuation or combining marks) are ignored. Combinations of scripts 
+        that are commonly used together (Latin with Han and Hiragana/Katakana, Bopomofo or Hangul) are not considered mixed. 
+        Characters outside the dominant script are marked as confusable if they look like a character of the dominant script.
+
+        Parameters:
+            text (str): The text to be checked (e.g., a username, domain or URL).
+
+        Returns:
+            dict: A dictionary with the following entries:
+                - "mixed": True if the scripts of the text are not commonly used together, otherwise False.
+                - "scripts": The number of characters per ISO 15924 script, in the order of their first occurrence.
+                - "dominant": The script with the most characters (None, if the text contains no script characters).
+                - "positions": The offsets of the characters per script, except for the dominant script.
+                - "confusables": The offsets of the characters outside the dominant script that look like characters of it.
+                - "skeleton": The skeleton of the text (see `skeleton`), to be compared with known names.
+
+        Example:
+            >>> ws.detect_mixed_script("pаypal")  # The first "а" is Cyrillic
+            {'mixed': True, 'scripts': {'Latn': 5, 'Cyrl': 1}, 'dominant': 'Latn', 'positions': {'Cyrl': [1]}, 'confusables': [1], 'skeleton': 'paypal'}
+        """
+        table = self.__segmentation_table(self.SegmentationLevel.Script)
+
+        positions = {}
+        for i, c in enumerate(text):
+            script = self.__script_of(c, table)
+            if script is not None:
+                positions.setdefault(script, []).append(i)
+
+        scripts = {script: len(offsets) for script, offsets in positions.items()}
+        dominant = max(scripts, key=scripts.get) if scripts else None
+        mixed = len(scripts) > 1 and not any(allowed.issuperset(scripts) for allowed in self.__single_script_sets)
+
+        index = self.__confusable_script_index()
+        skeleton = self.skeleton(text)
+        confusables = sorted(i for script, offsets in positions.items() if script != dominant for i in offsets 
+                             if dominant in index.get(self.skeleton(text[i]), ()))
+
+        return {
+            "mixed": mixed,
+            "scripts": scripts,
+            "dominant": dominant,
+            "positions": {script: offsets for script, offsets in positions.items() if script != dominant},
+            "confusables": confusables,
+            "skeleton": skeleton,
+        }
+
+
+    def detect_mixed_script_bulk(self, texts: Iterable[str]) -> list[dict]:
+        """
+        Detect mixed scripts in each of the given texts (see `detect_mixed_script`).
+
+        Returns:
+            list[dict]: The report of each text.
+        """
+        return [self.detect_mixed_script(text) for text in texts]
+
+
+    def incremental(self, strip_spaces: bool = True) -> IncrementalClassifier:
+        """
+        Create a stateful classifier that keeps a running verdict on text received in chunks (e.g., chat messages).
+
+        Parameters:
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+
+        Returns:
+            IncrementalClassifier: A classifier with `feed(chunk)` and `result()` methods.
+
+        Example:
+            >>> clf = ws.incremental()
+            >>> for chunk in ["좋은 ", "아", "침"]:
+            ...     clf.feed(chunk)
+            >>> clf.result()["script_types"]
+            ['Featural']
+        """
+        return IncrementalClassifier(self, strip_spaces)
+
+
+    def pipeline(self) -> Pipeline:
+        """
+        Create an empty preprocessing pipeline, whose stages are compiled into as few passes over the input as possible.
+
+        Returns:
+            Pipeline: A pipeline with the methods `normalize`, `decompose_hangul`, `strip` and `classify` (each returning 
+            an extended pipeline), which is applied to strings, batches and streams via `run`, `run_batch` and `stream`.
+
+        Example:
+            >>> pipeline = ws.pipeline().normalize().strip(languages=ws.Language.German).classify()
+            >>> pipeline.run("Gru\u0308ße!")
+            ['Alphabet']
+        """
+        return Pipeline(self)
+
+
+    def statistics(self, chunk_size: int = 1 << 20, use_numpy: bool = True) -> ScriptStatistics:
+        """
+        Create a statistics engine that accumulates a codepoint histogram over a corpus.
+
+        Parameters:
+            chunk_size (int, optional): Number of characters (or bytes for files) counted per chunk. Defaults to 1 MiB.
+            use_numpy (bool, optional): If True and NumPy is installed, chunks are counted vectorized. Defaults to True.
+
+        Returns:
+            ScriptStatistics: An empty statistics engine backed by the script tables of this instance.
+
+        Example:
+            >>> stats = ws.statistics().update_from_file("corpus.txt")
+            >>> stats.script_type_shares()
+            {'Abjad': 0.0, 'Abugida': 0.01, 'Alphabet': 0.97, ...}
+            >>> stats.language_coverage([ws.Language.German, ws.Language.English])
+            {'German': 0.97, 'English': 0.95}
+        """
+        return ScriptStatistics(self, chunk_size, use_numpy)
+
+
+    def letter_trie(self, language: Language) -> LetterTrie:
+        """
+        Retrieve the (cached) trie over the letters, including multigraphs, of a given language.
+
+        Parameters:
+            language (Language): The language whose letters are to be used.
+
+        Returns:
+            LetterTrie: The trie, which is built and compiled once per language.
+        """
+        trie = self.__letter_tries.get(language)
+        if trie is not None:
+            return trie
+
+        with self.__lock:
+            if language not in self.__letter_tries:
+                self.__letter_tries[language] = LetterTrie(self.__letters(language))
+            return self.__letter_tries[language]
+
+
+    def __letters(self, language: Language) -> list[str]:
+        """Returns the letters (including multigraphs) of a language in the order of the script file(s)."""
+        script = self.by_language(language, as_list=True) or []
+        if isinstance(script, dict):
+            script = [c for chars in script[language.name].values() for c in chars]
+        return script
+
+
+    def sort_key(self, language: Language):
+        """
+        Retrieve a key function (for `sorted`, `list.sort`, `min`, ...) that orders words by the alphabet order of a given language.
+
+        The letters of each word, where multigraphs take precedence by greedy longest match (see `tokenize_letters`), are 
+        mapped to their positions in the language's script (i.e., the order of `by_language`). Multigraphs are matched 
+        case-insensitively, so that, e.g., "NG" is ranked like "Ng" and "ng". Words are compared by the positions of the 
+        lowercase letters first, and only words that differ in case are ordered by the positions of the letters themselves, 
+        i.e., in the order in which the case variants appear in the script data. Characters that are not part of the 
+        alphabet (e.g., digits or punctuation) are ordered before all letters by their codepoints.
+
+        Each key is a pair of tuples of integers (the case-folded ranks and the exact ranks), where the letters are ranked 
+        from 0x110000 upwards, i.e., above all codepoints, and all other characters by their codepoints. Hence, the ranks 
+        never collide with the characters of the input, and `sorted` compares the keys natively. The exact ranks are looked 
+        up by `map` over the characters or, if the alphabet contains multigraphs, over the tokens of a trie over them. The 
+        tables are precompiled once per language and cached.
+
+        Parameters:
+            language (Language): The language whose alphabet order is used.
+
+        Returns:
+            Callable[[str], tuple[tuple[int, ...], tuple[int, ...]]]: The key function.
+
+        Example:
+            >>> sorted(["ngoko", "Nyai", "nasi", "obah"], key=ws.sort_key(ws.Language.Javanese))
+            ['nasi', 'ngoko', 'Nyai', 'obah']
+        """
+        key = self.__sort_keys.get(language)
+        if key is not None:
+            return key
+
+        with self.__lock:
+            if language not in self.__sort_keys:
+                positions = {}
+                for letter in self.__letters(language):
+                    positions.setdefault(letter, 0x110000 + len(positions))
+
+                exact = {letter: rank for letter, rank in positions.items() if len(letter) == 1}
+                folded = {letter: positions.get(letter.lower(), rank) for letter, rank in positions.items() if len(letter) == 1}
+                multigraphs = [letter for letter in positions if len(letter) > 1]
+
+                if multigraphs:
+                    # Case variants missing from the script data (e.g., "NG") take the rank of the capitalized or lowercase 
+                    # multigraph. Variants that cannot be ranked at all are ordered after all letters.
+                    tokenize = re.compile(LetterTrie(multigraphs).pattern_with_unknown.pattern, re.IGNORECASE | re.DOTALL).findall
+                    to_folded = {rank: positions.get(letter.lower(), rank) for letter, rank in positions.items()}
+                    folded_multigraphs = {}
+                    for letter in multigraphs:
+                        folded_multigraphs.setdefault(letter.lower(), positions.get(letter.lower(), positions[letter]))
+
+                    def rank_of(token: str) -> int:
+                        if len(token) == 1:
+                            return ord(token)
+                        return positions.get(token[0] + token[1:].lower()) or folded_multigraphs.get(token.lower(), 0x110000 + len(positions))
+
+                    def key(word: str) -> tuple:
+                        ranks = tuple(positions.get(token) or rank_of(token) for token in tokenize(word))
+                        return tuple(map(to_folded.get, ranks, ranks)), ranks
+                else:
+                    def key(word: str) -> tuple:
+                        codepoints = tuple(map(ord, word))
+                        return tuple(map(folded.get, word, codepoints)), tuple(map(exact.get, word, codepoints))
+
+                self.__sort_keys[language] = key
+            return self.__sort_keys[language]
+
+
+    def sorted_by_alphabet(self, words: Iterable[str], language: Language, reverse: bool = False) -> list[str]:
+        """
+        Sort words by the alphabet order of a given language (see `sort_key`), independent of the locale of the host.
+
+        Parameters:
+            words (Iterable[str]): The words to be sorted.
+            language (Language): The language whose alphabet order is used.
+            reverse (bool, optional): Whether to sort in descending order. Defaults to False.
+
+        Returns:
+            list[str]: The sorted words.
+
+        Example:
+            >>> ws.sorted_by_alphabet(["Zebra", "apfel", "Ähre", "Affe"], ws.Language.German)
+            ['Affe', 'apfel', 'Zebra', 'Ähre']
+        """
+        return sorted(words, key=self.sort_key(language), reverse=reverse)
+
+
+    def alphabet_encoder(self, language: Language, multigraphs: bool = False, use_numpy: bool = True) -> AlphabetEncoder:
+        """
+        Retrieve the (cached) encoder that maps texts to the IDs of their letters in the alphabet of a given language and back.
+
+        The ID of a letter is its position in the alphabet (see `by_language`) plus one, whereas 0 is reserved for 
+        characters outside the alphabet. The lookup tables are built once per language and cached.
+
+        Parameters:
+            language (Language): The language whose alphabet is used.
+            multigraphs (bool, optional): Whether multigraphs are encoded as single tokens. Defaults to False.
+            use_numpy (bool, optional): If True and NumPy is installed, the IDs are returned as NumPy arrays. Otherwise, 
+                as `array('H')`. Defaults to True.
+
+        Returns:
+            AlphabetEncoder: The encoder, providing `encode`, `encode_batch`, `decode` and `decode_batch`.
+
+        Example:
+            >>> encoder = ws.alphabet_encoder(ws.Language.Javanese, multigraphs=True)
+            >>> encoder.decode(encoder.encode("Nyanyi"))
+            'Nyanyi'
+        """
+        encoder = self.__alphabet_encoders.get(language, {}).get((multigraphs, use_numpy))
+        if encoder is not None:
+            return encoder
+
+        with self.__lock:
+            encoders = self.__alphabet_encoders.setdefault(language, {})
+            if (multigraphs, use_numpy) not in encoders:
+                encoders[(multigraphs, use_numpy)] = AlphabetEncoder(self.__letters(language), multigraphs, use_numpy)
+            return encoders[(multigraphs, use_numpy)]
+
+
+    def tokenize_letters(self, text: str, language: Language, keep_unknown: bool = False) -> list[str]:
+        """
+        Split a text into the letters of a given language's alphabet, where multigraphs are treated as single letters.
+
+        The segmentation is performed by greedy longest match, e.g., the Javanese word "Nyanyi" is split into 
+        ['Ny', 'a', 'ny', 'i'], since "Ny" and "ny" are letters of the Javanese alphabet. The underlying trie 
+        is precompiled per language and cached.
+
+        Parameters:
+            text (str): The text (e.g., a word) to be split.
+            language (Language): The language whose alphabet is used.
+            keep_unknown (bool, optional): If True, characters that are not part of the alphabet (e.g., spaces or digits) 
+                are returned as single-character tokens. Otherwise, they are skipped. Defaults to False.
+
+        Returns:
+            list[str]: The letters of the text.
+
+        Example:
+            >>> ws.tokenize_letters("Nyanyi", ws.Language.Javanese)
+            ['Ny', 'a', 'ny', 'i']
+        """
+        return self.letter_trie(language).tokenize(text, keep_unknown)
+
+
+    def tokenize_letters_bulk(self, words: Iterable[str], language: Language, keep_unknown: bool = False) -> list[list[str]]:
+        """
+        Split each of the given words into the letters of a given language's alphabet (see `tokenize_letters`).
+
+        Parameters:
+            words (Iterable[str]): The words to be split.
+            language (Language): The language whose alphabet is used.
+            keep_unknown (bool, optional): If True, characters that are not part of the alphabet are returned as 
+                single-character tokens. Otherwise, they are skipped. Defaults to False.
+
+        Returns:
+            list[list[str]]: The letters of each word.
+        """
+        trie = self.letter_trie(language)
+        findall = (trie.pattern_with_unknown if keep_unknown else trie.pattern).findall
+        return [findall(word) for word in words]
+
+
+    @classmethod
+    def unicode_block(cls, char: str) -> str:
+        """
+        Retrieve the name of the Unicode block a character belongs to.
+
+        The block table is loaded once per process from the internal json file, and each lookup is a binary search.
+
+        Parameters:
+            char (str): A single character.
+
+        Returns:
+            str: The name of the block (e.g., "Latin-1 Supplement"), or "No_Block" if the character is not part of any block.
+
+        Example:
+            >>> ws.unicode_block("ß")
+            'Latin-1 Supplement'
+        """
+        if cls.__unicode_blocks is None:
+            with cls.__unicode_blocks_lock:
+                if cls.__unicode_blocks is None:
+                    blocks = []
+                    for block_range, name in JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.Unicode_Block).items():
+                        start, end = block_range.split("..")
+                        blocks.append((int(start, 16), int(end, 16), name))
+                    blocks.sort()
+                    cls.__unicode_blocks = ([start for start, _, _ in blocks], blocks)
+
+        starts, blocks = cls.__unicode_blocks
+        i = bisect_right(starts, ord(char)) - 1
+        return blocks[i][2] if i >= 0 and ord(char) <= blocks[i][1] else "No_Block"
+
+
+    def __validation_pattern(self, target: Union[str, Language, Abjad, Abugida, Syllabary, Logographic, Featural, CodepointRangeSet], strip_spaces: bool) -> re.Pattern:
+        """
+        Compiles (once per target) a regex matching all characters that do not belong to the given writing system type, 
+        language, script or character ranges. Hangul syllables and conjoining Jamo are considered valid if all of their 
+        (compatibility) Jamo constituents are valid.
+        """
+        key = (target, strip_spaces)
+        pattern = self.__validation_patterns.get(key)
+        if pattern is not None:
+            return pattern
+
+        with self.__lock:
+            if key not in self.__validation_patterns:
+                if isinstance(target, CodepointRangeSet):
+                    characters = target
+                elif isinstance(target, self.Language):
+                    characters = self.language_characters(target)
+                elif isinstance(target, (self.Abjad, self.Abugida, self.Syllabary, self.Logographic, self.Featural)):
+                    script = self.__load_script_data(JsonUtils.FilePath[type(target).__name__])[target.value[0]]["script"]
+                    characters = script if isinstance(script, CodepointRangeSet) else frozenset("".join(script))
+                elif isinstance(target, str) and target in self.writing_systems_to_scripts:
+                    characters = self.writing_systems_to_scripts[target]
+                else:
+                    raise ValueError(f"Invalid target: {target}. Must be a writing system type ({list(self.writing_systems_to_scripts)}), a Language, a script (e.g., Abugida.Devanagari) or a CodepointRangeSet.")
+
+                if not isinstance(characters, CodepointRangeSet):
+                    characters = CodepointRangeSet.from_characters(characters)
+                if characters & CodepointRangeSet([(0x3131, 0x318E)]):  # Hangul Compatibility Jamo
+                    # Conjoining Jamo (e.g., of NFD-normalized text) are mapped to compatibility Jamo as well (see `is_featural`).
+                    characters |= CodepointRangeSet.from_characters(chr(cp) for block in (range(0x1100, 0x1200), range(0xAC00, 0xD7A4)) for cp in block
+                                                                    if all(c in characters for c in self.decompose_korean_char_sequence(chr(cp))))
+                if strip_spaces:
+                    # All whitespace characters lie below U+3001 (the last one being the ideographic space U+3000).
+                    characters |= CodepointRangeSet.from_characters(c for c in map(chr, range(0x3001)) if c.isspace())
+                # An empty set of characters (e.g., a language without a script) renders every character invalid.
+                self.__validation_patterns[key] = re.compile(f"[^{characters.to_regex_class()[1:-1]}]" if characters else r"[\s\S]")
+            return self.__validation_patterns[key]
+
+
+    def validate(self, sequence: str, script_type_or_language: Union[str, Language, CodepointRangeSet], strip_spaces: bool = True) -> dict:
+        """
+        Determine all characters of a sequence that do not belong to a given writing system type or language, including their positions.
+
+        In contrast to the `is_*` methods, which only report whether a sequence is valid, this function reports why it is not. 
+        The offending characters are found in a single pass of a precompiled regex, which is built once per writing system type or language.
+
+        Parameters:
+            sequence (str): The input string to be validated.
+            script_type_or_language (str | Language | CodepointRangeSet): A writing system type ('Abjad', 'Abugida', 'Alphabet', 
+                'Syllabary', 'Logographic' or 'Featural'), a language, a script (e.g., `Abugida.Devanagari`) or character ranges.
+            strip_spaces (bool, optional): Whether whitespace characters are considered valid. Defaults to True.
+
+        Returns:
+            dict: A dictionary with the following entries:
+                - "valid": True if all characters belong to the writing system type or language, otherwise False.
+                - "offsets": The offsets of all offending characters within the sequence.
+                - "characters": The offending characters (in the same order as the offsets).
+                - "blocks": The number of offending characters per Unicode block, sorted in descending order.
+
+        Raises:
+            ValueError: If an unknown writing system type is provided.
+
+        Example:
+            >>> ws.validate("Grüße, Ωmega!", ws.Language.German)
+            {'valid': False, 'offsets': [5, 7, 12], 'characters': [',', 'Ω', '!'], 'blocks': {'Basic Latin': 2, 'Greek and Coptic': 1}}
+        """
+        return self.validate_bulk([sequence], script_type_or_language, strip_spaces)[0]
+
+
+    def validate_bulk(self, sequences: Iterable[str], script_type_or_language: Union[str, Language, CodepointRangeSet], strip_spaces: bool = True) -> list[dict]:
+        """
+        Validate each of the given sequences (see `validate`), where the regex is compiled only once for all of them.
+
+        Parameters:
+            sequences (Iterable[str]): The input strings to be validated.
+            script_type_or_language (str | Language | CodepointRangeSet): A writing system type, a language, a script or character ranges.
+            strip_spaces (bool, optional): Whether whitespace characters are considered valid. Defaults to True.
+
+        Returns:
+            list[dict]: The validation report of each sequence.
+        """
+        finditer = self.__validation_pattern(script_type_or_language, strip_spaces).finditer
+
+        reports = []
+        for sequence in sequences:
+            offsets, characters = [], []
+            for match in finditer(sequence):
+                offsets.append(match.start())
+                characters.append(match.group())
+
+            blocks = Counter(self.unicode_block(c) for c in characters)
+            reports.append({"valid": not offsets, "offsets": offsets, "characters": characters, "blocks": dict(blocks.most_common())})
+        return reports
+
+
+    def alphabet_bitsets(self) -> AlphabetBitsets:
+        """
+        Retrieve the (cached) bitset representation of the alphabets of all languages and of all scripts of the other writing 
+        system types (e.g., `Abugida.Devanagari`), which is used to compute their overlaps.
+
+        Returns:
+            AlphabetBitsets: The bitsets, which are built once per instance. Its `matrix(metric)` method returns the 
+            pairwise overlaps of all languages and scripts in the order of its `entries` attribute.
+        """
+        bitsets = self.__alphabet_bitsets
+        if bitsets is not None:
+            return bitsets
+
+        with self.__lock:
+            if self.__alphabet_bitsets is None:
+                self.__alphabet_bitsets = AlphabetBitsets(self)
+            return self.__alphabet_bitsets
+
+
+    def nearest_alphabets(self,
+                          language: Union[Language, Abjad, Abugida, Syllabary, Logographic, Featural],
+                          k: int = 5,
+                          metric: str = "jaccard",
+                          include_scripts: bool = False) -> list[tuple[Union[Language, Abjad, Abugida, Syllabary, Logographic, Featural], float]]:
+        """
+        Retrieve the languages whose alphabets overlap most with the alphabet of a given language or script (e.g., to pick 
+        fallback languages).
+
+        Parameters:
+            language (Language | Abjad | Abugida | Syllabary | Logographic | Featural): The language or script to be compared.
+            k (int, optional): The number of languages to be returned. Defaults to 5.
+            metric (str, optional): Either "jaccard" (|A ∩ B| / |A ∪ B|) or "containment" (|A ∩ B| / |A|, i.e., the share of 
+                the characters of the given language that are covered by the other language). Defaults to "jaccard".
+            include_scripts (bool, optional): Whether the scripts of the other writing system types are ranked alongside 
+                the languages. Defaults to False.
+
+        Returns:
+            list[tuple[Language | Abjad | Abugida | Syllabary | Logographic | Featural, float]]: The k most similar 
+            languages (and scripts) and their overlaps within [0; 1], sorted in descending order.
+
+        Raises:
+            ValueError: If an unknown metric is provided.
+
+        Example:
+            >>> ws.nearest_alphabets(ws.Language.Russian, k=1)
+            [(<Language.Kumyk: ('kum',)>, 1.0)]
+            >>> ws.nearest_alphabets(ws.Language.Hindi, k=1, include_scripts=True)
+            [(<Abugida.Hindi: ('hin',)>, 1.0)]
+        """
+        return self.alphabet_bitsets().nearest(language, k, metric, include_scripts)
+
+
+    def languages_sharing(self, characters: Iterable[str]) -> list[Language]:
+        """
+        Retrieve all languages whose alphabet contains all of the given characters.
+
+        Parameters:
+            characters (Iterable[str]): The characters (e.g., a string). Hangul syllables are decomposed into their Jamo constituents.
+
+        Returns:
+            list[Language]: The languages in the order of the `Language` enum.
+
+        Example:
+            >>> ws.languages_sharing("ßü")
+            [<Language.German: ('deu',)>]
+        """
+        return self.alphabet_bitsets().sharing(self.decompose_korean_char_sequence("".join(characters)))
+
+
+    def languages_for_char(self, char: str) -> list[Language]:
+        """
+        Retrieve all languages whose alphabet contains a given character.
+
+        The lookup is a single access to an inverted index (character --> bitset over all languages), which is built once 
+        per instance from the script files. Hangul syllables are decomposed into their Jamo constituents, which then all 
+        must be part of the respective alphabet.
+
+        Parameters:
+            char (str): A single character.
+
+        Returns:
+            list[Language]: The languages in the order of the `Language` enum.
+
+        Example:
+            >>> ws.languages_for_char("đ")
+            [<Language.Croatian: ('hrv',)>, <Language.Istro_Romanian: ('ruo',)>]
+        """
+        bitsets = self.alphabet_bitsets()
+        return bitsets.to_languages(self.__char_mask(char, bitsets.language_mask, len(bitsets.languages)))
+
+
+    def scripts_for_char(self, char: str) -> list[Union[Abjad, Abugida, Syllabary, Logographic, Featural]]:
+        """
+        Retrieve all scripts of the other writing system types (abjads, abugidas, syllabaries, logographic and featural 
+        scripts) that contain a given character, e.g., to complement `languages_for_char` for characters outside alphabets.
+
+        The lookup is a single access to an inverted index (character --> bitset over all scripts), which is built once per 
+        instance from the script files. Hangul syllables are decomposed into their Jamo constituents.
+
+        Parameters:
+            char (str): A single character.
+
+        Returns:
+            list[Abjad | Abugida | Syllabary | Logographic | Featural]: The scripts in the order of their enums 
+            (Abjad, Abugida, Syllabary, Logographic, Featural).
+
+        Example:
+            >>> ws.scripts_for_char("ह")
+            [<Abugida.Sanskrit: ('san',)>, <Abugida.Nepali: ('nep',)>, ...]
+        """
+        bitsets = self.alphabet_bitsets()
+        return bitsets.to_scripts(self.__char_mask(char, bitsets.script_mask, len(bitsets.scripts)))
+
+
+    def __char_mask(self, char: str, mask_of, size: int) -> int:
+        """Returns the bitset of a character, where a Hangul syllable matches if all of its Jamo constituents match."""
+        mask = mask_of(char)
+
+        decomposed = self.decompose_korean_char_sequence(char)
+        if decomposed != char:
+            decomposed_mask = (1 << size) - 1
+            for c in decomposed:
+                decomposed_mask &= mask_of(c)
+            mask |= decomposed_mask
+        return mask
+
+
+    def segment_by_language(self,
+                            text: str,
+                            languages: Union[list[Language], None] = None,
+                            window_size: int = 64,
+                            step: int = 16) -> list[tuple[int, int, list[Language]]]:
+        """
+        Split a text into spans labeled with the most likely languages, e.g., to detect code-switching between languages 
+        that share a script (such as German and Turkish), which `segment_by_script` cannot tell apart.
+
+        A window of `window_size` characters slides over the text in steps of `step` characters, where each step is labeled 
+        with the languages whose alphabets cover the most characters of the window centered on it (see `alphabet_bitsets`). 
+        The window keeps the counts of the characters' bitsets over all languages, which are updated incrementally for the 
+        characters entering and leaving it, so that the cost is linear in the length of the text. Consecutive steps are merged 
+        into one span as long as their labels do not contradict each other, e.g., an ambiguous step (a German word that 
+        could also be Turkish) extends the current span. Spans start at word boundaries, and characters outside all 
+        alphabets as well as digits and punctuation never start a span. Finally, each span is labeled with the languages 
+        whose alphabets cover the most of its own characters, so that the labels do not depend on how the steps align 
+        with the text.
+
+        Parameters:
+            text (str): The text to be segmented.
+            languages (list[Language] | None, optional): The candidate languages. If None, all languages with an alphabet. Defaults to None.
+            window_size (int, optional): The number of characters per window. Defaults to 64.
+            step (int, optional): The number of characters between consecutive windows. Defaults to 16.
+
+        Returns:
+            list[tuple[int, int, list[Language]]]: The (start, end, languages) spans, where `text[start:end]` is the span's text 
+            and the languages are in the order of the `Language` enum. Text without any alphabet characters is labeled with [].
+
+        Raises:
+            ValueError: If the window size or step is not positive or the step exceeds the window size.
+
+        Example:
+            >>> ws.segment_by_language("Wir waren gestern in der Stadt. Şimdi çok güzel bir ağaç görüyorum.", 
+            ...                        [ws.Language.German, ws.Language.Turkish], window_size=32, step=8)
+            [(0, 18, [<Language.German: ('deu',)>]), (18, 67, [<Language.Turkish: ('tur',)>])]
+        """
+        if step <= 0 or window_size < step:
+            raise ValueError(f"Invalid window size: {window_size} or step: {step}. Both must be positive, and the step must not exceed the window size.")
+
+        bitsets = self.alphabet_bitsets()
+        candidates = (1 << len(bitsets.languages)) - 1
+        if languages is not None:
+            candidates = 0
+            for language in languages:
+                if language in bitsets.alphabets:
+                    candidates |= 1 << bitsets.languages.index(language)
+
+        # The bitset of each distinct character is computed once (Hangul syllables via their Jamo constituents). As in 
+        # `segment_by_script`, punctuation, separators, numbers and control characters are ignored, even if some alphabets contain them.
+        char_masks = {}
+        for c in set(text):
+            if unicodedata.category(c)[0] in "PZCN":
+                char_masks[c] = 0
+                continue
+            mask = bitsets.language_mask(c)
+            decomposed = self.decompose_korean_char_sequence(c)
+            if decomposed != c:
+                decomposed_mask = candidates
+                for jamo in decomposed:
+                    decomposed_mask &= bitsets.language_mask(jamo)
+                mask |= decomposed_mask
+            char_masks[c] = mask & candidates
+        masks = list(map(char_masks.__getitem__, text))
+
+        spans = []  # [start, end, labels], where the labels are those of the step that started the span
+        window, low, high = Counter(), 0, 0
+        margin = (window_size - step) // 2
+        transition = None  # The first of the current run of steps whose windows are not covered by any language
+        for start in range(0, len(text), step):
+            new_low, new_high = max(0, start - margin), min(len(text), start + step + margin)
+            window.update(masks[high:new_high])
+            window.subtract(masks[low:new_low])
+            low, high = new_low, new_high
+
+            best, exact = bitsets.best_languages(+window)
+            if not best:
+                continue
+            if not spans:
+                spans.append([0, len(text), best])
+                continue
+
+            current = spans[-1][2]
+            if not exact:
+                # The window straddles a switch of languages (or mixes them), hence the switch is decided by the next exact step.
+                transition = start if transition is None else transition
+                continue
+            if best | current in (best, current):
+                transition = None  # An ambiguous or unambiguous step of the same languages extends the span.
+                continue
+
+            # The switch lies in the middle of the steps whose windows straddle it. The boundary is moved back to the 
+            # start of the word, but not beyond the preceding step.
+            switch = start if transition is None else (transition + start) // 2
+            boundary = switch
+            while boundary > max(switch - step, spans[-1][0] + 1) and not text[boundary - 1].isspace():
+                boundary -= 1
+            if not text[boundary - 1].isspace():
+                boundary = switch
+            if boundary <= spans[-1][0]:
+                spans[-1][2] = best
+            else:
+                spans[-1][1] = boundary
+                spans.append([boundary, len(text), best])
+            transition = None
+
+        if not spans:
+            return [(0, len(text), [])] if text else []
+
+        # The steps only decide the boundaries. A window that straddles a switch may be covered by a third language, 
+        # hence each span is labeled by the counts of its own characters, and neighbors with the same labels are merged.
+        segments = []
+        for start, end, _ in spans:
+            labels, _ = bitsets.best_languages(Counter(masks[start:end]))
+            if segments and segments[-1][2] == labels:
+                segments[-1][1] = end
+            else:
+                segments.append([start, end, labels])
+        return [(start, end, bitsets.to_languages(labels)) for start, end, labels in segments]
+
+
+    def languages_that_can_write(self, text: str, strip_spaces: bool = True) -> list[Language]:
+        """
+        Retrieve all languages whose alphabet covers every character of a given text.
+
+        The bitsets of the inverted index (see `languages_for_char`) are intersected in a single pass over the distinct 
+        characters of the text, where the pass stops as soon as no language is left.
+
+        Parameters:
+            text (str): The text to be checked.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+
+        Returns:
+            list[Language]: The languages in the order of the `Language` enum. For an empty text, all languages with an alphabet are returned.
+
+        Example:
+            >>> ws.languages_that_can_write("Grüße aus Köln")
+            [<Language.German: ('deu',)>]
+        """
+        if strip_spaces:
+            text = re.sub(r"\s+", "", text)
+        return self.alphabet_bitsets().sharing(self.decompose_korean_char_sequence(text))
+
+
+    def generate_all_characters_in_range(self, unicode_range: str) -> list[str]:
+        """
+        Generate a list of all characters within a specified Unicode range.
+
+        This function takes a string representing a Unicode range and returns a list
+        of characters that fall within this range. The input string should specify
+        the range in the format '\\uXXXX-\\uYYYY', where XXXX and YYYY are hexadecimal
+        Unicode code points. The function will include both the start and end points
+        in the resulting list.
+
+        Parameters:
+            unicode_range (str): A string representing the Unicode range in the 
+                                format "\\uXXXX-\\uYYYY". For example, "\\u0061-\\u007A"
+                                represents the range from 'a' to 'z'.
+
+        Returns:
+            list[str]: A list of characters within the specified Unicode range.
+
+        Example:
+            >>> generate_all_characters_in_range("\u0061-\u007A")
+            ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 
+            'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
+
+        Notes:
+            - For large ranges, consider `character_range`, which does not materialize the characters.
+            - The function assumes that the input string is properly formatted.
+            - The input range is inclusive of both the start and end points.
+            - Only one range should be specified in the input string. Multiple ranges
+            or individual characters are not supported by this function.
+        """
+
+        range_start, range_end = unicode_range.split("-")
+        start = ord(range_start)
+        end = ord(range_end) + 1  # +1 to include the end character
+        return [chr(codepoint) for codepoint in range(start, end)]
+
+
+    def character_range(self, unicode_range: str) -> CodepointRangeSet:
+        """
+        Create a compact, lazily iterable set of all characters within the specified Unicode range(s).
+
+        In contrast to `generate_all_characters_in_range`, no list of characters is materialized, which makes this function
+        suitable for large blocks such as CJK. The result supports union (`|`), intersection (`&`), difference (`-`) and 
+        membership tests and can be passed directly to `strip_non_script_characters` or `register_script`.
+
+        Parameters:
+            unicode_range (str): One or more ranges and/or single characters in the style of a regex character class
+                                (without brackets), e.g., "\u0061-\u007A" or "\u4E00-\u9FFF\u3400-\u4DBF".
+
+        Returns:
+            CodepointRangeSet: The set of all characters within the specified range(s).
+
+        Example:
+            >>> cjk = ws.character_range("\u4E00-\u9FFF")
+            >>> len(cjk), "好" in cjk
+            (20992, True)
+            >>> ws.strip_non_script_characters("Hello 你好!", [ws.Language.English, cjk])
+            'Hello 你好'
+        """
+        return CodepointRangeSet.parse(unicode_range)
+
+
+_shared_writing_system = None
+_shared_writing_system_lock = threading.Lock()
+
+def shared_writing_system() -> WritingSystem:
+    """
+    Return a process-wide `WritingSystem` instance that is safe to share across threads.
+
+    The instance is constructed on first use (guarded by a lock, so that concurrent first calls construct it only once).
+    Sharing it avoids that each thread of a pool loads the json files and builds the lookup tables on its own.
+
+    Returns:
+        WritingSystem: The shared instance.
+
+    Example:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> ws = shared_writing_system()
+        >>> with ThreadPoolExecutor() as pool:
+        ...     list(pool.map(ws.is_alphabet, ["Hallo", "שלום"]))
+        [True, False]
+    """
+    global _shared_writing_system
+
+    if _shared_writing_system is None:
+        with _shared_writing_system_lock:
+            if _shared_writing_system is None:
+                _shared_writing_system = WritingSystem()
+    return _shared_writing_system
+
+
+def preload_for_fork(path: Union[str, Path, None] = None, freeze: bool = True) -> WritingSystem:
+    """
+    Preload the process-wide `WritingSystem` instance (see `shared_writing_system`) before forking worker processes.
+
+    Parameters:
+        path (str | Path | None, optional): The file for the packed, memory-mapped tables (see `WritingSystem.preload_for_fork`). Defaults to None.
+        freeze (bool, optional): Whether to call `gc.freeze()` after preloading. Defaults to True.
+
+    Returns:
+        WritingSystem: The shared instance.
+
+    Example:
+        >>> # gunicorn.conf.py
+        >>> preload_app = True
+        >>> def on_starting(server):
+        ...     preload_for_fork("/dev/shm/alphabetic.bin")
+    """
+    ws = shared_writing_system()
+    ws.preload_for_fork(path, freeze)
+    return ws
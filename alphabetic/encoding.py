@@ -0,0 +1,190 @@
+import sys
+from array import array
+from typing import Iterable
+
+from .trie import LetterTrie
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the arrays of the standard library are used instead.
+    np = None
+
+
+UNKNOWN_ID = 0
+# The IDs are passed through str.translate as characters and converted to 16-bit integers by the UTF-16 codec.
+CODEC = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
+# Supplementary Private Use Area-B, used for multigraphs before the translation. Since IDs start at 1, the base itself is
+# never a placeholder and replaces all characters of the input that coincide with a placeholder.
+PLACEHOLDER_BASE = 0x100000
+
+
+class _Ids(dict):
+    """Translation table, where characters that are not part of the alphabet are mapped to the unknown ID."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return chr(UNKNOWN_ID)
+
+
+class AlphabetEncoder:
+    """
+    Maps texts to the IDs of their letters in the alphabet of a language and back, e.g., for the features of ML pipelines.
+
+    The ID of a letter is its position in the alphabet (i.e., the order of `by_language`, without duplicates) plus one,
+    whereas the ID 0 is reserved for characters that are not part of the alphabet. If multigraphs are enabled, they are
+    encoded as single tokens by greedy longest match (see `tokenize_letters`). Otherwise, each character becomes one ID.
+
+    The IDs are looked up in precomputed tables: a lookup array indexed by codepoint if NumPy is installed, otherwise a
+    translation table for `str.translate`, whose result is converted by the UTF-16 codec. In both cases, the text is
+    processed in C instead of a Python loop. Batches are joined and encoded at once.
+
+    Example:
+        >>> encoder = ws.alphabet_encoder(ws.Language.German)
+        >>> encoder.encode("Hallo!")
+        array([ 8, 27, 38, 38, 41,  0], dtype=uint16)
+        >>> encoder.decode(encoder.encode("Hallo!"))
+        'Hallo�'
+    """
+
+    def __init__(self, letters: Iterable[str], multigraphs: bool = False, use_numpy: bool = True):
+        """
+        Parameters:
+            letters (Iterable[str]): The letters (including multigraphs) of the alphabet in their order.
+            multigraphs (bool, optional): Whether multigraphs are encoded as single tokens. Defaults to False.
+            use_numpy (bool, optional): If True and NumPy is installed, NumPy arrays are returned. Otherwise, `array('H')`.
+                Defaults to True.
+
+        Raises:
+            ValueError: If the alphabet has more letters than 16-bit IDs can represent or, with multigraphs, letters of the
+                Supplementary Private Use Area-B (which holds the placeholders of the multigraphs).
+        """
+        self.letters = tuple(dict.fromkeys(letter for letter in letters if letter))
+        if len(self.letters) >= 1 << 16:
+            raise ValueError(f"Invalid alphabet: it has {len(self.letters)} letters, whereas at most {(1 << 16) - 1} can be encoded.")
+
+        self.ids = {letter: i for i, letter in enumerate(self.letters, start=1)}
+        self.use_numpy = use_numpy and np is not None
+
+        singles = {letter: i for letter, i in self.ids.items() if len(letter) == 1}
+        self.__ids = _Ids({ord(letter): chr(i) for letter, i in singles.items()})
+        self.__multigraphs = None
+        if multigraphs and len(singles) < len(self.ids):
+            # Multigraphs are replaced by placeholders first, which are then translated like single characters.
+            if any(ord(letter) >= PLACEHOLDER_BASE for letter in singles):
+                raise ValueError("Invalid alphabet: with multigraphs, letters of the Supplementary Private Use Area-B cannot be encoded.")
+            self.__multigraphs = LetterTrie(letter for letter in self.ids if len(letter) > 1).pattern
+            self.__placeholders = {letter: chr(PLACEHOLDER_BASE + i) for letter, i in self.ids.items() if len(letter) > 1}
+            self.__ids.update({ord(placeholder): chr(self.ids[letter]) for letter, placeholder in self.__placeholders.items()})
+            self.__escapes = {ord(placeholder): chr(PLACEHOLDER_BASE) for placeholder in self.__placeholders.values()}
+
+        if self.use_numpy:
+            # The last entry (beyond the largest codepoint of the alphabet) is the target of all other codepoints.
+            self.__table = np.zeros(max(map(ord, singles), default=0) + 2, dtype=np.uint16)
+            for letter, i in singles.items():
+                self.__table[ord(letter)] = i
+            # Reverse table, where multigraphs are marked by 0, since they cannot be decoded to a single codepoint.
+            self.__codepoints = np.zeros(len(self.letters) + 1, dtype="<u4")
+            for letter, i in singles.items():
+                self.__codepoints[i] = ord(letter)
+
+        self.__letters = {UNKNOWN_ID: "�", **{i: letter for letter, i in self.ids.items()}}
+
+
+    def __prepare(self, text: str) -> str:
+        """
+        Replaces the multigraphs (if enabled) by placeholders, so that each character of the result is one token. Characters
+        of the input that coincide with a placeholder are escaped first, so that they are encoded as unknown.
+        """
+        if self.__multigraphs is None:
+            return text
+        return self.__multigraphs.sub(lambda match: self.__placeholders[match.group()], text.translate(self.__escapes))
+
+
+    def __encode_prepared(self, text: str):
+        if self.use_numpy and self.__multigraphs is None:
+            codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+            return self.__table[np.minimum(codepoints, len(self.__table) - 1)]
+
+        encoded = text.translate(self.__ids).encode(CODEC, "surrogatepass")
+        if self.use_numpy:
+            return np.frombuffer(encoded, dtype=np.uint16).copy()
+        ids = array("H")
+        ids.frombytes(encoded)
+        return ids
+
+
+    def encode(self, text: str):
+        """
+        Maps a text to the IDs of its letters.
+
+        Parameters:
+            text (str): The text to be encoded.
+
+        Returns:
+            numpy.ndarray | array: The IDs (unsigned 16-bit integers), where 0 represents characters outside the alphabet.
+        """
+        return self.__encode_prepared(self.__prepare(text))
+
+
+    def encode_batch(self, texts: Iterable[str]) -> list:
+        """
+        Maps each of the given texts to the IDs of its letters (see `encode`). The texts are joined and encoded at once.
+
+        Parameters:
+            texts (Iterable[str]): The texts to be encoded.
+
+        Returns:
+            list[numpy.ndarray | array]: The IDs of each text. NumPy arrays are views into one array of the entire batch.
+        """
+        prepared = [self.__prepare(text) for text in texts]
+        ids = self.__encode_prepared("".join(prepared))
+
+        batch, start = [], 0
+        for text in prepared:
+            batch.append(ids[start:start + len(text)])
+            start += len(text)
+        return batch
+
+
+    def decode(self, ids, unknown: str = "�") -> str:
+        """
+        Maps IDs back to the letters of the alphabet.
+
+        Parameters:
+            ids (numpy.ndarray | array | Iterable[int]): The IDs, e.g., as returned by `encode`.
+            unknown (str, optional): The replacement of the unknown ID 0. Defaults to "�" (replacement character).
+
+        Returns:
+            str: The decoded text.
+
+        Raises:
+            ValueError: If an ID does not belong to the alphabet.
+        """
+        is_ndarray = np is not None and isinstance(ids, np.ndarray)
+        if is_ndarray:
+            invalid = ids.size and (ids.min() < 0 or ids.max() > len(self.letters))
+        else:
+            ids = ids if isinstance(ids, array) and ids.typecode == "H" else array("H", ids)
+            invalid = len(ids) and max(ids) > len(self.letters)
+        if invalid:
+            raise ValueError(f"Invalid IDs. The alphabet only has {len(self.letters)} letters, i.e., IDs must lie within [0; {len(self.letters)}].")
+
+        if is_ndarray and self.use_numpy and len(unknown) == 1:
+            # Fast path for single characters: the IDs are mapped to codepoints, which are decoded by the UTF-32 codec.
+            codepoints = self.__codepoints[ids]
+            codepoints[ids == UNKNOWN_ID] = ord(unknown)
+            if codepoints.all():
+                return codepoints.tobytes().decode("utf-32-le", "surrogatepass")
+
+        encoded = ids.astype(np.uint16).tobytes() if is_ndarray else ids.tobytes()
+        letters = self.__letters if unknown == "�" else {**self.__letters, UNKNOWN_ID: unknown}
+        return encoded.decode(CODEC, "surrogatepass").translate(letters)
+
+
+    def decode_batch(self, batch: Iterable, unknown: str = "�") -> list[str]:
+        """
+        Maps the IDs of each text back to the letters of the alphabet (see `decode`).
+
+        Returns:
+            list[str]: The decoded texts.
+        """
+        return [self.decode(ids, unknown) for ids in batch]
@@ -0,0 +1,88 @@
+from collections import Counter
+
+
+class IncrementalClassifier:
+    """
+    Keeps a running verdict on the script type(s) and language candidates of text that arrives in chunks.
+
+    Each call of `feed` only processes the given chunk. Instead of keeping the text itself, the classifier
+    keeps running counters per character profile (the writing system types and languages a character belongs to),
+    so that `result` never has to re-scan previously fed chunks. Whitespace is skipped and Hangul syllables are
+    decomposed per character, hence splitting a text into arbitrary chunks yields the same result as feeding it at once.
+
+    Example:
+        >>> clf = ws.incremental()
+        >>> clf.feed("Guten ").feed("Mor").feed("gen")
+        >>> clf.result()["script_types"]
+        ['Alphabet']
+        >>> "German" in clf.result()["languages"]
+        True
+    """
+
+    def __init__(self, writing_system, strip_spaces: bool = True):
+        """
+        Parameters:
+            writing_system (WritingSystem): The instance providing the script tables.
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+        """
+        self.writing_system = writing_system
+        self.strip_spaces = strip_spaces
+        self.reset()
+
+
+    def reset(self) -> None:
+        """Discards all counters, so that the classifier can be reused for a new message."""
+        self.length = 0
+        self.__profile_counts = Counter()
+
+
+    def feed(self, chunk: str) -> "IncrementalClassifier":
+        """
+        Updates the running counters with the characters of the given chunk.
+
+        Parameters:
+            chunk (str): The next fragment of the text.
+
+        Returns:
+            IncrementalClassifier: The instance itself, so that calls can be chained.
+        """
+        character_profile = self.writing_system.character_profile
+
+        for c, n in Counter(chunk).items():
+            if self.strip_spaces and c.isspace():
+                continue
+            self.__profile_counts[character_profile(c)] += n
+            self.length += n
+        return self
+
+
+    def result(self) -> dict:
+        """
+        Returns the current verdict based on all chunks fed so far.
+
+        Returns:
+            dict: A dictionary with the following entries:
+                - "length": The number of (non-whitespace) characters fed so far.
+                - "script_types": The writing system types covering all characters (as `is_writing_system` would report).
+                - "script_type_shares": The share of characters within [0; 1] per writing system type.
+                - "languages": The names of all languages whose script covers all characters.
+                - "language_shares": The share of characters per language (only languages with a share > 0),
+                  sorted in descending order.
+            For an empty input, "script_types" and "languages" are empty.
+        """
+        type_counts, language_counts = Counter(), Counter()
+        for (script_types, languages), n in self.__profile_counts.items():
+            type_counts.update(dict.fromkeys(script_types, n))
+            language_counts.update(dict.fromkeys(languages, n))
+
+        script_types = self.writing_system.writing_systems_to_scripts.keys()
+        total = self.length
+        language_shares = {language.name: n / total for language, n in language_counts.most_common()}
+
+        return {
+            "length": total,
+            "script_types": [t for t in script_types if total and type_counts[t] == total],
+            "script_type_shares": {t: type_counts[t] / total if total else 0.0 for t in script_types},
+            "languages": sorted(language.name for language, n in language_counts.items() if n == total),
+            "language_shares": language_shares,
+        }
@@ -0,0 +1,145 @@
+import os
+import mmap
+import json
+import struct
+import threading
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Iterator, Union
+
+
+MAGIC = b"ISO6393\1"
+HEADER = struct.Struct("=8sIIQQ")  # Magic, number of records, offset of the names, size and mtime (ns) of the json file
+RECORD = struct.Struct("=3sxII")  # Code, padding, offset and length of the (UTF-8 encoded) name
+
+
+def source_fingerprint(json_path: Union[str, Path]) -> tuple[int, int]:
+    """Returns the size and modification time (in nanoseconds) of the json file an index is built from."""
+    stat = os.stat(json_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def index_is_current(index_path: Union[str, Path], json_path: Union[str, Path]) -> bool:
+    """
+    Checks whether an index file exists and was built by `build_code_index` from the current version of the json file,
+    based on the size and modification time of the json file recorded in its header.
+
+    Parameters:
+        index_path (str | Path): The index file.
+        json_path (str | Path): The json file the index is supposed to be built from.
+
+    Returns:
+        bool: False if the index file is missing, unreadable, of another format or outdated.
+    """
+    try:
+        with open(index_path, "rb") as f:
+            magic, _, _, size, mtime_ns = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return False
+    return magic == MAGIC and (size, mtime_ns) == source_fingerprint(json_path)
+
+
+def build_code_index(json_path: Union[str, Path], index_path: Union[str, Path]) -> None:
+    """
+    Converts a json file of three-letter codes (e.g., the ISO 639-3 table) into a sorted, fixed-width binary index file.
+
+    Layout: a header (magic bytes, number of records, offset of the names, size and modification time of the json file),
+    followed by one fixed-width record per code in ascending order (code, offset and length of its name) and, finally,
+    the concatenated names.
+
+    Parameters:
+        json_path (str | Path): The json file mapping three-letter (ASCII) codes to names.
+        index_path (str | Path): The target file, which is replaced atomically.
+    """
+    fingerprint = source_fingerprint(json_path)
+    entries = sorted(json.loads(Path(json_path).read_text(encoding="utf8")).items())
+    names_offset = HEADER.size + RECORD.size * len(entries)
+
+    records, names, offset = [], [], 0
+    for code, name in entries:
+        encoded = name.encode("utf8")
+        records.append(RECORD.pack(code.encode("ascii"), offset, len(encoded)))
+        names.append(encoded)
+        offset += len(encoded)
+
+    tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    Path(tmp_path).write_bytes(HEADER.pack(MAGIC, len(entries), names_offset, *fingerprint) + b"".join(records) + b"".join(names))
+    os.replace(tmp_path, index_path)
+
+
+class CodeIndex(Mapping):
+    """
+    A read-only mapping of three-letter codes to names, backed by a memory-mapped index file (see `build_code_index`).
+
+    Lookups are binary searches over the fixed-width records, so neither a dictionary nor any string objects are
+    materialized besides the requested name. The pages of the file are shared between processes and can be evicted
+    by the operating system, which keeps the resident memory low.
+
+    Example:
+        >>> index = CodeIndex("iso_639_3_codes_en.idx")
+        >>> index["deu"], "xyz" in index
+        ('German', False)
+    """
+
+    def __init__(self, index_path: Union[str, Path]):
+        """
+        Parameters:
+            index_path (str | Path): The index file written by `build_code_index`.
+
+        Raises:
+            ValueError: If the file was not written by `build_code_index`.
+        """
+        with open(index_path, "rb") as f:
+            self.__mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.__count, self.__names_offset, *_ = HEADER.unpack_from(self.__mapping, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid index file: [{index_path}]. It was not written by build_code_index.")
+
+
+    def __code(self, i: int) -> bytes:
+        start = HEADER.size + RECORD.size * i
+        return self.__mapping[start:start + 3]
+
+
+    def __find(self, code) -> int:
+        """Returns the position of the record of the given code, or -1 if it does not exist."""
+        if not isinstance(code, str) or len(code) != 3 or not code.isascii():
+            return -1
+        key = code.encode("ascii")
+        i = self.__bisect(key)
+        return i if i < self.__count and self.__code(i) == key else -1
+
+
+    def __bisect(self, key: bytes) -> int:
+        # bisect only supports a key function as of Python 3.10
+        low, high = 0, self.__count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__code(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+    def __getitem__(self, code: str) -> str:
+        i = self.__find(code)
+        if i < 0:
+            raise KeyError(code)
+        _, offset, length = RECORD.unpack_from(self.__mapping, HEADER.size + RECORD.size * i)
+        start = self.__names_offset + offset
+        return self.__mapping[start:start + length].decode("utf8")
+
+
+    def __contains__(self, code) -> bool:
+        return self.__find(code) >= 0
+
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.__count):
+            yield self.__code(i).decode("ascii")
+
+
+    def __len__(self) -> int:
+        return self.__count
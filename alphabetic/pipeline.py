@@ -0,0 +1,217 @@
+import unicodedata
+from typing import Callable, Iterable, Iterator, Union
+
+from .ranges import CodepointRangeSet
+
+
+class _CharacterMap(dict):
+    """
+    Translation table for `str.translate` that composes the character-wise stages of a pipeline.
+
+    The output of a character is computed on its first occurrence and then stored in the table itself, so that all
+    further occurrences are looked up by `str.translate` in C.
+    """
+
+    def __init__(self, stages: list[Callable[[str], str]]):
+        super().__init__()
+        self.__stages = stages
+
+    def __missing__(self, codepoint: int) -> str:
+        output = chr(codepoint)
+        for stage in self.__stages:
+            output = "".join(map(stage, output))
+        self[codepoint] = output
+        return output
+
+
+class Pipeline:
+    """
+    A declarative chain of preprocessing stages, which is compiled into as few passes over the input as possible.
+
+    Consecutive character-wise stages (`decompose_hangul` and `strip`) are fused into a single translation table, so that
+    they are applied in one `str.translate` pass without intermediate strings. The table is filled lazily per distinct
+    character from the (cached) script tables of the writing system. Normalization is applied in a separate pass, which
+    is skipped for already normalized input. The optional final `classify` stage reduces the result to the writing
+    system types covering it, based on its distinct characters only.
+
+    Each method returns a new pipeline, so that a configured pipeline can be shared and extended safely. The compiled
+    passes are rebuilt whenever a script is registered in the writing system (which replaces its `writing_systems_to_scripts`).
+
+    Example:
+        >>> clean = ws.pipeline().normalize().strip(languages=ws.Language.German)
+        >>> clean("  Gru\\u0308ße, Ωmega!")
+        'Grüße mega'
+        >>> ws.pipeline().normalize().classify().run_batch(["Gru\\u0308ße", "مرحبا"])
+        [['Alphabet'], ['Abjad', 'Alphabet']]
+    """
+
+    def __init__(self, writing_system, stages: tuple = ()):
+        """
+        Parameters:
+            writing_system (WritingSystem): The instance providing the script tables.
+            stages (tuple, optional): The configured stages. Use the methods of the pipeline instead. Defaults to ().
+        """
+        self.writing_system = writing_system
+        self.stages = stages
+        self.__compiled = None
+        self.__tables = None
+
+
+    def __extend(self, stage: tuple) -> "Pipeline":
+        if self.stages and self.stages[-1][0] == "classify":
+            raise ValueError("Invalid pipeline: no stage can follow 'classify', since it reduces the text to its script types.")
+        return Pipeline(self.writing_system, self.stages + (stage,))
+
+
+    def normalize(self, form: str = "NFC") -> "Pipeline":
+        """
+        Adds a Unicode normalization stage. Input that is already normalized takes a fast path.
+
+        Parameters:
+            form (str, optional): The normalization form ("NFC", "NFD", "NFKC" or "NFKD"). Defaults to "NFC".
+        """
+        if form not in ("NFC", "NFD", "NFKC", "NFKD"):
+            raise ValueError(f"Invalid normalization form: {form}. Must be one of the following: ['NFC', 'NFD', 'NFKC', 'NFKD']")
+        return self.__extend(("normalize", form))
+
+
+    def decompose_hangul(self) -> "Pipeline":
+        """Adds a stage that decomposes Hangul syllables into their Jamo constituents (see `decompose_korean_char_sequence`)."""
+        return self.__extend(("decompose_hangul",))
+
+
+    def strip(self,
+              languages=None,
+              process_token_wise: bool = True,
+              strip_spaces: bool = True) -> "Pipeline":
+        """
+        Adds a stage that removes all characters not belonging to the given language(s), with the same semantics as
+        `strip_non_script_characters`.
+
+        Parameters:
+            languages (Language | CodepointRangeSet | list[Language | CodepointRangeSet] | None, optional): The language(s)
+                whose characters are retained. If None, the characters of all supported script types. Defaults to None.
+            process_token_wise (bool, optional): If True, tokens are separated by single spaces. Otherwise, whitespace is
+                removed like any other character outside the script(s). Defaults to True.
+            strip_spaces (bool, optional): Whether leading and trailing whitespace is removed from the result. Defaults to True.
+        """
+        ws = self.writing_system
+        if isinstance(languages, (ws.Language, CodepointRangeSet)):
+            languages = [languages]
+        if isinstance(languages, list) and all(isinstance(language, (ws.Language, CodepointRangeSet)) for language in languages):
+            languages = tuple(languages)
+        elif languages is not None:
+            raise ValueError("Invalid 'languages' argument. Must be one of the following: None|Language|CodepointRangeSet|list[Language|CodepointRangeSet]")
+        return self.__extend(("strip", languages, process_token_wise, strip_spaces))
+
+
+    def classify(self, strip_spaces: bool = True) -> "Pipeline":
+        """
+        Adds the final stage, which reduces the text to the writing system types covering all of its characters, as
+        `is_writing_system` would report them.
+
+        Parameters:
+            strip_spaces (bool, optional): Whether whitespace characters are ignored. Defaults to True.
+        """
+        return self.__extend(("classify", strip_spaces))
+
+
+    def __keep(self, languages) -> Callable[[str], bool]:
+        """
+        Returns the membership test of the characters to be retained by a strip stage. It is delegated to
+        `strip_non_script_characters`, which is called once per distinct character when the translation table is filled,
+        so that both retain exactly the same characters (multigraphs are not split into their letters).
+        """
+        ws = self.writing_system
+        languages = None if languages is None else list(languages)
+        return lambda c: ws.strip_non_script_characters(c, languages, process_token_wise=False, strip_spaces=False) == c
+
+
+    def __classify(self, text: str, strip_spaces: bool) -> list[str]:
+        ws = self.writing_system
+        characters = {c for c in set(text) if not (strip_spaces and c.isspace())}
+        script_types = []
+        for script_type, table in ws.writing_systems_to_scripts.items():
+            if script_type == "Featural":
+                candidates = set(ws.decompose_korean_char_sequence("".join(characters)))
+            else:
+                candidates = characters
+            if all(c in table for c in candidates):
+                script_types.append(script_type)
+        return script_types
+
+
+    def __compile(self) -> list[Callable]:
+        """
+        Compiles the stages into a list of passes: normalization passes, a whitespace collapse (for token-wise stripping),
+        one translation per run of character-wise stages, the removal of leading and trailing whitespace and the classification.
+        """
+        passes, character_stages, strip_ends = [], [], False
+
+        def flush():
+            if character_stages:
+                passes.append(lambda text, table=_CharacterMap(list(character_stages)): text.translate(table))
+                character_stages.clear()
+
+        for name, *params in self.stages:
+            if name == "normalize":
+                flush()
+                (form,) = params
+                passes.append(lambda text, form=form: text if unicodedata.is_normalized(form, text) else unicodedata.normalize(form, text))
+            elif name == "decompose_hangul":
+                character_stages.append(self.writing_system.decompose_korean_char_sequence)
+            elif name == "strip":
+                languages, process_token_wise, strip_spaces = params
+                keep = self.__keep(languages)
+                if process_token_wise:
+                    # Character-wise stages never produce whitespace, hence tokens can be separated before the translation.
+                    passes.append(lambda text: " ".join(text.split()))
+                    character_stages.append(lambda c, keep=keep: c if c == " " or keep(c) else "")
+                else:
+                    character_stages.append(lambda c, keep=keep: c if keep(c) else "")
+                strip_ends = strip_ends or strip_spaces
+            else:
+                flush()
+                if strip_ends:
+                    passes.append(str.strip)
+                    strip_ends = False
+                (strip_spaces,) = params
+                passes.append(lambda text, strip_spaces=strip_spaces: self.__classify(text, strip_spaces))
+
+        flush()
+        if strip_ends:
+            passes.append(str.strip)
+        return passes
+
+
+    def run(self, text: str) -> Union[str, list[str]]:
+        """
+        Applies the pipeline to a text.
+
+        Returns:
+            str | list[str]: The processed text or, if the pipeline ends with `classify`, the writing system types.
+        """
+        compiled, tables = self.__compiled, self.writing_system.writing_systems_to_scripts
+        if compiled is None or self.__tables is not tables:
+            compiled = self.__compile()
+            self.__compiled, self.__tables = compiled, tables
+        for step in compiled:
+            text = step(text)
+        return text
+
+
+    __call__ = run
+
+
+    def run_batch(self, texts: Iterable[str]) -> list:
+        """Applies the pipeline to each of the given texts, where the pipeline is compiled only once."""
+        return [self.run(text) for text in texts]
+
+
+    def stream(self, chunks: Iterable[str]) -> Iterator:
+        """
+        Lazily applies the pipeline to each chunk of a stream (e.g., the lines of a file), so that the stream is never
+        loaded entirely. The chunks are processed independently, hence they should not split tokens or combining sequences.
+        """
+        for chunk in chunks:
+            yield self.run(chunk)
@@ -0,0 +1,252 @@
+import re
+from bisect import bisect_right
+from itertools import chain
+from typing import Iterable, Iterator, Union
+
+
+class CodepointRangeSet:
+    """
+    An immutable, compact set of Unicode codepoints represented by sorted, disjoint ranges.
+
+    In contrast to a list or set of characters, the size of a range set only depends on the number of ranges, not on the
+    number of characters they contain. Hence, entire Unicode blocks (e.g., the 20,992 CJK Unified Ideographs) can be
+    combined via union (`|`), intersection (`&`) and difference (`-`), tested for membership in O(log n) and iterated lazily.
+
+    Example:
+        >>> cjk = CodepointRangeSet.parse("\\u4E00-\\u9FFF")
+        >>> latin = CodepointRangeSet.parse("a-zA-Z")
+        >>> len(cjk | latin), "好" in cjk, "a" in cjk
+        (21044, True, False)
+        >>> (latin - CodepointRangeSet.parse("b-y")).ranges
+        [('A', 'Z'), ('a', 'a'), ('z', 'z')]
+    """
+
+    def __init__(self, ranges: Iterable[tuple[Union[str, int], Union[str, int]]] = ()):
+        """
+        Parameters:
+            ranges (Iterable[tuple[str | int, str | int]], optional): Inclusive (start, end) pairs, given either as
+                characters or as codepoints. The ranges may overlap and do not need to be sorted.
+        """
+        intervals = sorted((self.__codepoint(start), self.__codepoint(end) + 1) for start, end in ranges)
+
+        starts, ends = [], []
+        for start, end in intervals:
+            if start >= end:
+                raise ValueError(f"Invalid range: [{start}; {end - 1}]. The start must not be greater than the end.")
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        # Half-open intervals [start; end)
+        self.__starts = tuple(starts)
+        self.__ends = tuple(ends)
+
+
+    @staticmethod
+    def __codepoint(c: Union[str, int]) -> int:
+        return c if isinstance(c, int) else ord(c)
+
+
+    @classmethod
+    def from_characters(cls, characters: Iterable[str]) -> "CodepointRangeSet":
+        """
+        Creates a range set from arbitrary single characters, where consecutive codepoints are merged into ranges.
+
+        Parameters:
+            characters (Iterable[str]): The characters (e.g., a script as returned by `by_language`). Multigraphs are
+                split into their constituent characters.
+
+        Returns:
+            CodepointRangeSet: The range set containing all given characters.
+        """
+        codepoints = sorted(set(map(ord, "".join(characters))))
+
+        ranges = []
+        for cp in codepoints:
+            if ranges and ranges[-1][1] == cp - 1:
+                ranges[-1][1] = cp
+            else:
+                ranges.append([cp, cp])
+        return cls(ranges)
+
+
+    @classmethod
+    def from_buffers(cls, starts, ends) -> "CodepointRangeSet":
+        """
+        Creates a range set over existing buffers (e.g., memoryviews of a memory-mapped file) without copying them.
+
+        Parameters:
+            starts (Sequence[int]): The sorted starts of disjoint ranges.
+            ends (Sequence[int]): The (exclusive) ends of the ranges, i.e., each range covers [start; end).
+
+        Returns:
+            CodepointRangeSet: The range set backed by the given buffers.
+        """
+        range_set = cls.__new__(cls)
+        range_set.__starts = starts
+        range_set.__ends = ends
+        return range_set
+
+
+    @classmethod
+    def parse(cls, spec: str) -> "CodepointRangeSet":
+        """
+        Creates a range set from a specification in the style of a regex character class (without brackets).
+
+        Each element is either a single character or a range "X-Y". A hyphen at the beginning or end is taken literally.
+
+        Parameters:
+            spec (str): The specification, e.g., "\\u0061-\\u007A" or "a-zA-ZäöüÄÖÜß".
+
+        Returns:
+            CodepointRangeSet: The range set containing all specified characters.
+        """
+        ranges, i = [], 0
+        while i < len(spec):
+            if i + 2 < len(spec) and spec[i + 1] == "-":
+                ranges.append((spec[i], spec[i + 2]))
+                i += 3
+            else:
+                ranges.append((spec[i], spec[i]))
+                i += 1
+        return cls(ranges)
+
+
+    @property
+    def ranges(self) -> list[tuple[str, str]]:
+        """The inclusive (start, end) character pairs of all ranges."""
+        return [(chr(start), chr(end - 1)) for start, end in zip(self.__starts, self.__ends)]
+
+
+    def to_regex_class(self) -> str:
+        """
+        Converts the range set into a regex character class.
+
+        Returns:
+            str: A character class such as "[a-zA-Z]", which matches exactly the characters of this set.
+        """
+        if not self.__starts:
+            return "[^\\s\\S]"  # Matches nothing
+
+        parts = []
+        for start, end in zip(self.__starts, self.__ends):
+            parts.append(re.escape(chr(start)) if end - start == 1 else f"{re.escape(chr(start))}-{re.escape(chr(end - 1))}")
+        return f"[{''.join(parts)}]"
+
+
+    def __contains__(self, c: Union[str, int]) -> bool:
+        if isinstance(c, str) and len(c) != 1:
+            return False
+        cp = self.__codepoint(c)
+        i = bisect_right(self.__starts, cp) - 1
+        return i >= 0 and cp < self.__ends[i]
+
+
+    def __iter__(self) -> Iterator[str]:
+        for start, end in zip(self.__starts, self.__ends):
+            for cp in range(start, end):
+                yield chr(cp)
+
+
+    def __len__(self) -> int:
+        return sum(end - start for start, end in zip(self.__starts, self.__ends))
+
+
+    def __bool__(self) -> bool:
+        return bool(self.__starts)
+
+
+    def __eq__(self, other) -> bool:
+        # Only range sets are compared, since a set of the same characters would have to share the hash of the range set.
+        if isinstance(other, CodepointRangeSet):
+            return tuple(self.__starts) == tuple(other.__starts) and tuple(self.__ends) == tuple(other.__ends)
+        return NotImplemented
+
+
+    def __hash__(self) -> int:
+        return hash((tuple(self.__starts), tuple(self.__ends)))
+
+
+    def __repr__(self) -> str:
+        return f"CodepointRangeSet({[(f'U+{s:04X}', f'U+{e - 1:04X}') for s, e in zip(self.__starts, self.__ends)]})"
+
+
+    def __reduce__(self):
+        return (CodepointRangeSet, ([(s, e - 1) for s, e in zip(self.__starts, self.__ends)],))
+
+
+    @staticmethod
+    def __coerce(other) -> "CodepointRangeSet":
+        if isinstance(other, CodepointRangeSet):
+            return other
+        if isinstance(other, (set, frozenset, list, tuple, str)):
+            return CodepointRangeSet.from_characters(other)
+        return None
+
+
+    @staticmethod
+    def __operand(other) -> "CodepointRangeSet":
+        coerced = CodepointRangeSet.__coerce(other)
+        if coerced is None:
+            raise TypeError(f"Invalid operand of type {type(other).__name__}. Must be a CodepointRangeSet or a set, frozenset, list, tuple or str of characters.")
+        return coerced
+
+
+    def union(self, other: Union["CodepointRangeSet", Iterable[str]]) -> "CodepointRangeSet":
+        other = self.__operand(other)
+        return CodepointRangeSet([(s, e - 1) for s, e in zip(chain(self.__starts, other.__starts), chain(self.__ends, other.__ends))])
+
+
+    def intersection(self, other: Union["CodepointRangeSet", Iterable[str]]) -> "CodepointRangeSet":
+        other = self.__operand(other)
+        result, i, j = [], 0, 0
+        a, b = list(zip(self.__starts, self.__ends)), list(zip(other.__starts, other.__ends))
+
+        while i < len(a) and j < len(b):
+            start, end = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+            if start < end:
+                result.append((start, end - 1))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return CodepointRangeSet(result)
+
+
+    def difference(self, other: Union["CodepointRangeSet", Iterable[str]]) -> "CodepointRangeSet":
+        other = self.__operand(other)
+        result, j = [], 0
+        b = list(zip(other.__starts, other.__ends))
+
+        for start, end in zip(self.__starts, self.__ends):
+            # Skip ranges of the other set that end before the current range starts.
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(b) and b[k][0] < end:
+                if b[k][0] > start:
+                    result.append((start, b[k][0] - 1))
+                start = max(start, b[k][1])
+                k += 1
+            if start < end:
+                result.append((start, end - 1))
+        return CodepointRangeSet(result)
+
+
+    def __or__(self, other):
+        return self.union(other) if self.__coerce(other) is not None else NotImplemented
+
+    def __and__(self, other):
+        return self.intersection(other) if self.__coerce(other) is not None else NotImplemented
+
+    def __sub__(self, other):
+        return self.difference(other) if self.__coerce(other) is not None else NotImplemented
+
+    def __rsub__(self, other):
+        other = self.__coerce(other)
+        return other.difference(self) if other is not None else NotImplemented
+
+    __ror__ = __or__
+    __rand__ = __and__
@@ -0,0 +1,92 @@
+import math
+import random
+from statistics import NormalDist
+from typing import Union
+
+
+def wilson_interval(successes: float, n: float, confidence: float = 0.95) -> tuple[float, float]:
+    """
+    Computes the Wilson score interval for a binomial proportion, which (unlike the normal approximation) remains
+    valid for proportions close to 0 or 1, i.e., the typical case of (almost) entirely in-script texts.
+
+    Parameters:
+        successes (float): The number of successes (e.g., in-script characters). Fractional for effective sample sizes.
+        n (float): The number of independent trials (e.g., sampled characters). Fractional for effective sample sizes.
+        confidence (float, optional): The confidence level within (0; 1). Defaults to 0.95.
+
+    Returns:
+        tuple[float, float]: The lower and upper bound of the interval. For n = 0, the interval is [0; 1].
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"Invalid confidence: {confidence}. It must lie within (0; 1).")
+    if n == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def cluster_wilson_interval(successes: list[int], sizes: list[int], confidence: float = 0.95) -> tuple[float, float]:
+    """
+    Computes the Wilson score interval for a proportion estimated from a cluster sample, e.g., from windows of contiguous
+    characters, where neighboring characters are strongly correlated and hence not independent trials.
+
+    The windows are the sampling unit: the number of trials is replaced by the effective sample size n / deff, where the
+    design effect deff is estimated from the variance of the ratio estimator over the windows. The effective sample size
+    is bounded by the number of windows (all characters of a window agree) and the number of characters (independent
+    characters). If the correlation cannot be estimated, since all windows agree (a proportion of 0 or 1) or only one
+    window was sampled, each window counts as a single trial.
+
+    Parameters:
+        successes (list[int]): The number of successes per window (e.g., in-script characters).
+        sizes (list[int]): The number of trials per window (e.g., sampled characters).
+        confidence (float, optional): The confidence level within (0; 1). Defaults to 0.95.
+
+    Returns:
+        tuple[float, float]: The lower and upper bound of the interval. Without any trial, the interval is [0; 1].
+    """
+    n, windows = sum(sizes), sum(1 for size in sizes if size)
+    if n == 0:
+        return wilson_interval(0, 0, confidence)
+
+    p = sum(successes) / n
+    if windows < 2 or p in (0, 1):
+        effective = windows
+    else:
+        mean_size = n / windows
+        variance = sum((k - p * m) ** 2 for k, m in zip(successes, sizes)) / (windows * (windows - 1) * mean_size ** 2)
+        effective = n if variance == 0 else min(n, max(windows, p * (1 - p) / variance))
+    return wilson_interval(p * effective, effective, confidence)
+
+
+def sample_windows(sequence: str, sample_size: int, window_size: int, seed: Union[int, None] = None) -> list[str]:
+    """
+    Draws non-overlapping windows of contiguous characters at random positions of a sequence, where each character of the
+    sequence is equally likely to be sampled.
+
+    Contiguous windows (instead of single characters) keep the memory access local and never split the text within a
+    window, whereas the random positions spread the sample over the entire sequence.
+
+    Parameters:
+        sequence (str): The sequence to be sampled.
+        sample_size (int): The (approximate) number of characters to be sampled.
+        window_size (int): The number of characters per window.
+        seed (int | None, optional): The seed of the random number generator, for reproducible samples. Defaults to None.
+
+    Returns:
+        list[str]: The windows in the order of their positions. If the sequence is not longer than the sample size,
+        the entire sequence is returned as a single window.
+    """
+    if sample_size <= 0 or window_size <= 0:
+        raise ValueError("Invalid sample or window size. Both must be positive.")
+    if len(sequence) <= sample_size:
+        return [sequence]
+
+    # The windows tile the entire sequence, so that each character can be sampled. Only the last one may be shorter.
+    positions = range(0, len(sequence), window_size)
+    windows = min(len(positions), math.ceil(sample_size / window_size))
+    return [sequence[start:start + window_size] for start in sorted(random.Random(seed).sample(positions, windows))]
@@ -0,0 +1,328 @@
+"""
+A lightweight local server, which keeps the script tables in memory and serves script classification and cleaning to
+clients written in any language.
+
+Usage:
+    python -m alphabetic.serve --socket /tmp/alphabetic.sock
+    python -m alphabetic.serve --host 127.0.0.1 --port 8765
+
+Protocol: each request and response is a single line of JSON (UTF-8), where responses carry the "id" of their request
+and may arrive out of order. Requests of the same endpoint (and parameters) that arrive concurrently are coalesced into
+micro-batches, which are processed in a worker thread, so that the event loop keeps accepting requests meanwhile.
+
+    {"id": 1, "op": "is", "text": "Hallo", "script_type": "Alphabet"}             --> {"id": 1, "result": true}
+    {"id": 2, "op": "classify", "text": "مرحبا"}                                   --> {"id": 2, "result": "Abjad"}
+    {"id": 3, "op": "strip", "text": "Grüße!", "languages": ["German"]}           --> {"id": 3, "result": "Grüße"}
+    {"id": 4, "op": "validate", "text": "Grüße!", "target": "German"}             --> {"id": 4, "result": {"valid": false, ...}}
+    {"id": 5, "op": "stats"}                                                       --> {"id": 5, "result": {"strip": {"count": 1, ...}}}
+"""
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import threading
+from collections import defaultdict, deque
+from typing import Union
+
+from .core import WritingSystem, shared_writing_system
+
+
+class BatchingServer:
+    """
+    Serves the endpoints "is", "classify", "strip", "validate" and "stats" over a Unix socket or localhost TCP.
+
+    Example:
+        >>> server = BatchingServer()
+        >>> asyncio.run(server.serve(path="/tmp/alphabetic.sock"))
+    """
+
+    endpoints = ("is", "classify", "strip", "validate", "stats")
+
+    def __init__(self, writing_system: Union[WritingSystem, None] = None, max_batch_size: int = 256, max_delay: float = 0.002, latency_window: int = 10_000):
+        """
+        Parameters:
+            writing_system (WritingSystem | None, optional): The instance serving the requests. Defaults to the shared instance.
+            max_batch_size (int, optional): The maximum number of requests per batch. Defaults to 256.
+            max_delay (float, optional): The maximum time (in seconds) a request waits for further requests of its batch. Defaults to 2 ms.
+            latency_window (int, optional): The number of most recent latencies per endpoint used for the statistics. Defaults to 10,000.
+        """
+        self.writing_system = writing_system or shared_writing_system()
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.address = None
+        self.ready = threading.Event()
+
+        self.__pending = {}
+        self.__tasks = set()
+        self.__counts = defaultdict(int)
+        self.__latencies = defaultdict(lambda: deque(maxlen=latency_window))
+        self.__loop = None
+        self.__closed = None
+
+
+    def __batch_key(self, request: dict) -> tuple:
+        """Returns the endpoint and parameters of a request, i.e., requests with equal keys can be processed in one batch."""
+        op = request.get("op")
+        if op == "is":
+            return (op, request["script_type"], request.get("strip_spaces", True))
+        if op == "classify":
+            return (op, request.get("strip_spaces", True))
+        if op == "strip":
+            languages = request.get("languages")
+            return (op, None if languages is None else tuple(languages), request.get("process_token_wise", True), request.get("strip_spaces", True))
+        if op == "validate":
+            return (op, request["target"], request.get("strip_spaces", True))
+        raise ValueError(f"Unknown endpoint: {op}. Must be one of the following: {list(self.endpoints)}")
+
+
+    def process_batch(self, key: tuple, texts: list[str]) -> list:
+        """
+        Processes the texts of a batch, where all requests share the given endpoint and parameters.
+
+        Each endpoint processes the entire batch at once: "is", "classify" and "validate" with regexes compiled once per 
+        parameters (see `is_writing_system_bulk`, `classify_bulk` and `validate_bulk`), and "strip" with the filter of 
+        `strip_non_script_characters`, which is built once per languages and shared by all batches.
+
+        Parameters:
+            key (tuple): The endpoint followed by its parameters.
+            texts (list[str]): The texts of the requests.
+
+        Returns:
+            list: The results in the order of the texts.
+        """
+        ws = self.writing_system
+        op, *params = key
+
+        if op == "is":
+            script_type, strip_spaces = params
+            return ws.is_writing_system_bulk(texts, script_type, strip_spaces)
+        if op == "classify":
+            (strip_spaces,) = params
+            return ws.classify_bulk(texts, strip_spaces)
+        if op == "strip":
+            languages, process_token_wise, strip_spaces = params
+            languages = None if languages is None else [ws.Language[name] for name in languages]
+            return [ws.strip_non_script_characters(text, languages, process_token_wise, strip_spaces) for text in texts]
+
+        target, strip_spaces = params
+        target = ws.Language[target] if target in ws.Language.__members__ else target
+        return ws.validate_bulk(texts, target, strip_spaces)
+
+
+    async def submit(self, request: dict):
+        """
+        Adds a request to the batch of its endpoint and parameters and waits for its result.
+
+        The batch is processed as soon as it contains `max_batch_size` requests or `max_delay` has elapsed since its first request.
+        """
+        key = self.__batch_key(request)
+        future = self.__loop.create_future()
+
+        batch = self.__pending.get(key)
+        if batch is None:
+            batch = self.__pending[key] = []
+            self.__loop.call_later(self.max_delay, self.__flush, key, batch)
+        batch.append((request["text"], future))
+
+        if len(batch) >= self.max_batch_size:
+            self.__flush(key, batch)
+        return await future
+
+
+    def __flush(self, key: tuple, batch: list) -> None:
+        # The timer of a batch that was already flushed due to its size must not flush a newer batch of the same key.
+        if self.__pending.get(key) is not batch:
+            return
+        del self.__pending[key]
+        # The event loop only keeps weak references to tasks, hence the task is referenced until it is done.
+        task = asyncio.ensure_future(self.__run_batch(key, batch))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+
+    async def __run_batch(self, key: tuple, batch: list) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            results = await self.__loop.run_in_executor(None, self.process_batch, key, texts)
+        except Exception:
+            # Process the requests one by one, so that an invalid request only fails itself.
+            for text, future in batch:
+                try:
+                    result = (await self.__loop.run_in_executor(None, self.process_batch, key, [text]))[0]
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+    def stats(self) -> dict:
+        """
+        Returns the latency statistics (in milliseconds, from receiving a request until its response is ready) per endpoint.
+
+        Returns:
+            dict: Per endpoint, the number of requests ("count") as well as "mean", "p50", "p99" and "max" of the most recent latencies.
+        """
+        result = {}
+        for op, latencies in list(self.__latencies.items()):
+            ordered = sorted(latencies)
+            result[op] = {
+                "count": self.__counts[op],
+                "mean": sum(ordered) / len(ordered) * 1000,
+                "p50": ordered[len(ordered) // 2] * 1000,
+                "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+                "max": ordered[-1] * 1000,
+            }
+        return result
+
+
+    async def __handle_request(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock) -> None:
+        start = time.perf_counter()
+        request_id, op = None, None
+        try:
+            request = json.loads(line)
+            request_id, op = request.get("id"), request.get("op")
+            response = {"id": request_id, "result": self.stats() if op == "stats" else await self.submit(request)}
+        except Exception as e:
+            response = {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+
+        if op in self.endpoints:
+            self.__counts[op] += 1
+            self.__latencies[op].append(time.perf_counter() - start)
+
+        async with write_lock:
+            writer.write(json.dumps(response, ensure_ascii=False).encode("utf8") + b"\n")
+            await writer.drain()
+
+
+    async def __handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Each request is handled by its own task, so that pipelined requests of a single client can share a batch.
+        tasks, write_lock = set(), asyncio.Lock()
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.ensure_future(self.__handle_request(line, writer, write_lock))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+
+    async def serve(self, path: Union[str, None] = None, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """
+        Serves requests until `close` is called.
+
+        Parameters:
+            path (str | None, optional): The path of the Unix socket. If None, localhost TCP is used instead. Defaults to None.
+            host (str, optional): The host for TCP. Defaults to "127.0.0.1".
+            port (int, optional): The port for TCP (0 selects a free port, see `address`). Defaults to 8765.
+        """
+        self.__loop = asyncio.get_running_loop()
+        self.__closed = asyncio.Event()
+
+        if path is not None:
+            server = await asyncio.start_unix_server(self.__handle_client, path=path, limit=1 << 24)
+        else:
+            server = await asyncio.start_server(self.__handle_client, host=host, port=port, limit=1 << 24)
+        self.address = server.sockets[0].getsockname()
+        self.ready.set()
+
+        async with server:
+            await self.__closed.wait()
+
+
+    def close(self) -> None:
+        """Stops the server (can be called from any thread)."""
+        if self.__loop is not None:
+            self.__loop.call_soon_threadsafe(self.__closed.set)
+
+
+class Client:
+    """
+    A minimal blocking client for the server, e.g., for testing or as a reference for clients in other languages.
+
+    Example:
+        >>> with Client(path="/tmp/alphabetic.sock") as client:
+        ...     client.request("strip", text="Grüße!", languages=["German"])
+        'Grüße'
+    """
+
+    def __init__(self, path: Union[str, None] = None, host: str = "127.0.0.1", port: int = 8765):
+        if path is not None:
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.connect(path)
+        else:
+            self.__socket = socket.create_connection((host, port))
+        self.__file = self.__socket.makefile("rwb")
+        self.__next_id = 0
+
+
+    def request_many(self, requests: list[dict]) -> list:
+        """
+        Sends all requests at once (pipelined, so that the server can batch them) and returns their results in the same order.
+
+        Raises:
+            RuntimeError: If the server reports an error for one of the requests.
+        """
+        ids = []
+        for request in requests:
+            self.__next_id += 1
+            ids.append(self.__next_id)
+            self.__file.write(json.dumps({**request, "id": self.__next_id}, ensure_ascii=False).encode("utf8") + b"\n")
+        self.__file.flush()
+
+        responses = {}
+        while len(responses) < len(ids):
+            response = json.loads(self.__file.readline())
+            responses[response["id"]] = response
+
+        for response in responses.values():
+            if "error" in response:
+                raise RuntimeError(f"The server reported an error: {response['error']}")
+        return [responses[i]["result"] for i in ids]
+
+
+    def request(self, op: str, **params):
+        """Sends a single request to the given endpoint and returns its result."""
+        return self.request_many([{"op": op, **params}])[0]
+
+
+    def close(self) -> None:
+        self.__file.close()
+        self.__socket.close()
+
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def main(argv: Union[list[str], None] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m alphabetic.serve", description="Serves script classification and cleaning over a local socket.")
+    parser.add_argument("--socket", help="Path of the Unix socket (otherwise, localhost TCP is used).")
+    parser.add_argument("--host", default="127.0.0.1", help="Host for TCP (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8765, help="Port for TCP (default: 8765).")
+    parser.add_argument("--max-batch-size", type=int, default=256, help="Maximum number of requests per batch (default: 256).")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="Maximum time a request waits for its batch in ms (default: 2).")
+    args = parser.parse_args(argv)
+
+    server = BatchingServer(max_batch_size=args.max_batch_size, max_delay=args.max_delay_ms / 1000)
+    try:
+        asyncio.run(server.serve(path=args.socket, host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        print("Server stopped.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
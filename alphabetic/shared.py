@@ -0,0 +1,79 @@
+import os
+import mmap
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import Union
+
+from .ranges import CodepointRangeSet
+
+
+MAGIC = b"ALPHRNG1"
+
+
+def pack_range_sets(range_sets: dict[str, CodepointRangeSet], path: Union[str, Path]) -> None:
+    """
+    Writes range sets into a single binary file of packed codepoint arrays, which can be memory-mapped by `load_range_sets`.
+
+    Layout: the magic bytes and the number of tables, followed by one record per table consisting of the length of its
+    name, the (UTF-8 encoded and 4-byte aligned) name, the number of ranges and the arrays of the range starts and
+    (exclusive) ends as unsigned 32-bit integers in native byte order.
+
+    Parameters:
+        range_sets (dict[str, CodepointRangeSet]): The range sets to be written, by name.
+        path (str | Path): The target file, which is replaced atomically.
+    """
+    chunks = [MAGIC, struct.pack("=I", len(range_sets))]
+    for name, range_set in range_sets.items():
+        encoded = name.encode("utf8")
+        starts = array("I", [ord(start) for start, _ in range_set.ranges])
+        ends = array("I", [ord(end) + 1 for _, end in range_set.ranges])
+        chunks += [struct.pack("=I", len(encoded)), encoded, b"\0" * (-len(encoded) % 4),
+                   struct.pack("=I", len(starts)), starts.tobytes(), ends.tobytes()]
+
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    Path(tmp_path).write_bytes(b"".join(chunks))
+    os.replace(tmp_path, path)
+
+
+def load_range_sets(path: Union[str, Path]) -> dict[str, CodepointRangeSet]:
+    """
+    Memory-maps a file written by `pack_range_sets` (read-only) and returns range sets backed directly by the mapping.
+
+    Since the pages of the mapping are never written (not even by reference counting), they are shared between all
+    processes mapping the same file, e.g., the forked workers of a web server.
+
+    Parameters:
+        path (str | Path): The file written by `pack_range_sets`.
+
+    Returns:
+        dict[str, CodepointRangeSet]: The range sets by name.
+
+    Raises:
+        ValueError: If the file was not written by `pack_range_sets`.
+    """
+    with open(path, "rb") as f:
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    if view[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Invalid file: [{path}]. It was not written by pack_range_sets.")
+
+    offset = len(MAGIC)
+    (count,) = struct.unpack_from("=I", view, offset)
+    offset += 4
+
+    range_sets = {}
+    for _ in range(count):
+        (name_length,) = struct.unpack_from("=I", view, offset)
+        offset += 4
+        name = bytes(view[offset:offset + name_length]).decode("utf8")
+        offset += name_length + (-name_length % 4)
+
+        (n,) = struct.unpack_from("=I", view, offset)
+        offset += 4
+        starts = view[offset:offset + 4 * n].cast("I")
+        ends = view[offset + 4 * n:offset + 8 * n].cast("I")
+        offset += 8 * n
+        range_sets[name] = CodepointRangeSet.from_buffers(starts, ends)
+    return range_sets
@@ -0,0 +1,217 @@
+import mmap
+import codecs
+from pathlib import Path
+from collections import Counter
+from typing import Iterable, TextIO, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python path is used instead.
+    np = None
+
+
+class ScriptStatistics:
+    """
+    Accumulates a codepoint histogram over a corpus and derives script and language statistics from it.
+
+    The histogram is filled in a single pass over the input (text, files or streams). All statistics such as
+    the share of characters per writing system type, the coverage per language or the most frequent
+    out-of-script characters are derived afterwards from the histogram, so the corpus is never scanned twice.
+    Partial results computed by parallel workers can be combined via `merge`.
+
+    Example:
+        >>> ws = WritingSystem()
+        >>> stats = ws.statistics().update("Hallo Welt! Привет!")
+        >>> stats.script_type_shares()["Alphabet"]
+        0.8823529411764706
+        >>> stats.top_out_of_script(1)
+        [('!', 2)]
+    """
+
+    hangul_syllables = range(0xAC00, 0xD7A4)
+
+    def __init__(self, writing_system, chunk_size: int = 1 << 20, use_numpy: bool = True):
+        """
+        Parameters:
+            writing_system (WritingSystem): The instance providing the script tables.
+            chunk_size (int, optional): Number of characters (or bytes for files) counted per chunk. Defaults to 1 MiB.
+            use_numpy (bool, optional): If True and NumPy is installed, chunks are counted vectorized. Defaults to True.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}. The chunk size must be a positive integer.")
+
+        self.writing_system = writing_system
+        self.chunk_size = chunk_size
+        self.use_numpy = use_numpy and np is not None
+        self.histogram = Counter()
+
+
+    def __count_chunk(self, chunk: str) -> None:
+        if self.use_numpy and len(chunk) > 1024:
+            codepoints = np.frombuffer(chunk.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+            values, counts = np.unique(codepoints, return_counts=True)
+            self.histogram.update(dict(zip(map(chr, values.tolist()), counts.tolist())))
+        else:
+            self.histogram.update(chunk)
+
+
+    def update(self, text: str) -> "ScriptStatistics":
+        """
+        Adds the characters of the given text to the histogram.
+
+        Parameters:
+            text (str): The text to be counted.
+
+        Returns:
+            ScriptStatistics: The instance itself, so that calls can be chained.
+        """
+        for i in range(0, len(text), self.chunk_size):
+            self.__count_chunk(text[i:i + self.chunk_size])
+        return self
+
+
+    def update_from_stream(self, stream: Union[Iterable[str], TextIO]) -> "ScriptStatistics":
+        """
+        Adds all characters of a text stream to the histogram.
+
+        Parameters:
+            stream (Iterable[str] | TextIO): A text file object (read in chunks) or any iterable of strings.
+
+        Returns:
+            ScriptStatistics: The instance itself, so that calls can be chained.
+        """
+        if hasattr(stream, "read"):
+            while chunk := stream.read(self.chunk_size):
+                self.__count_chunk(chunk)
+        else:
+            for chunk in stream:
+                self.update(chunk)
+        return self
+
+
+    def update_from_file(self, file_path: Union[str, Path], encoding: str = "utf8", use_mmap: bool = True) -> "ScriptStatistics":
+        """
+        Adds all characters of a text file to the histogram.
+
+        If `use_mmap` is True, the file is memory-mapped and decoded chunk-wise with an incremental decoder,
+        so that multi-byte sequences split between two chunks are handled correctly. Otherwise, the file is streamed.
+
+        Parameters:
+            file_path (str | Path): The path of the text file.
+            encoding (str, optional): The encoding of the file. Defaults to "utf8".
+            use_mmap (bool, optional): Whether to memory-map the file instead of streaming it. Defaults to True.
+
+        Returns:
+            ScriptStatistics: The instance itself, so that calls can be chained.
+        """
+        file_path = Path(file_path)
+
+        # Empty files cannot be memory-mapped.
+        if not use_mmap or file_path.stat().st_size == 0:
+            with open(file_path, encoding=encoding) as stream:
+                return self.update_from_stream(stream)
+
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, len(mapped), self.chunk_size):
+                self.__count_chunk(decoder.decode(mapped[offset:offset + self.chunk_size]))
+            self.__count_chunk(decoder.decode(b"", final=True))
+        return self
+
+
+    def merge(self, other: Union["ScriptStatistics", Counter, dict]) -> "ScriptStatistics":
+        """
+        Merges a partial result (e.g., computed by a parallel worker) into this instance.
+
+        Parameters:
+            other (ScriptStatistics | Counter | dict): Another statistics object or its histogram.
+
+        Returns:
+            ScriptStatistics: The instance itself, so that calls can be chained.
+        """
+        self.histogram.update(other.histogram if isinstance(other, ScriptStatistics) else other)
+        return self
+
+
+    def __script_items(self) -> list[tuple[str, int, str]]:
+        """Returns (character, count, decomposed character) for all non-whitespace characters of the histogram."""
+        decompose = self.writing_system.decompose_korean_char_sequence
+        return [(c, n, decompose(c) if ord(c) in self.hangul_syllables else c)
+                for c, n in self.histogram.items() if not c.isspace()]
+
+
+    @property
+    def total(self) -> int:
+        """The number of counted non-whitespace characters."""
+        return sum(n for c, n in self.histogram.items() if not c.isspace())
+
+
+    def script_type_shares(self) -> dict[str, float]:
+        """
+        Computes the share of (non-whitespace) characters per writing system type.
+
+        Hangul syllables are decomposed into their Jamo constituents before they are checked against the Featural script.
+        Note that a character can belong to several types (e.g., Latin letters in Alphabet and Abugida scripts),
+        therefore the shares do not necessarily sum up to 1.
+
+        Returns:
+            dict[str, float]: A mapping of each writing system type ('Abjad', 'Alphabet', ...) to its share within [0; 1].
+        """
+        items = self.__script_items()
+        total = sum(n for _, n, _ in items)
+
+        shares = {}
+        for script_type, characters in self.writing_systems_to_scripts.items():
+            covered = sum(n for _, n, d in items if all(c in characters for c in d))
+            shares[script_type] = covered / total if total else 0.0
+        return shares
+
+
+    def language_coverage(self, languages: Union[list, None] = None) -> dict[str, float]:
+        """
+        Computes for each language the share of (non-whitespace) characters that are covered by its script.
+
+        Parameters:
+            languages (list[Language] | None, optional): The languages to consider. If None, all supported languages are used.
+
+        Returns:
+            dict[str, float]: A mapping of each language name to its coverage within [0; 1], sorted in descending order.
+        """
+        ws = self.writing_system
+        items = self.__script_items()
+        total = sum(n for _, n, _ in items)
+        languages = list(ws.Language) if languages is None else languages
+
+        coverage = {}
+        for language in languages:
+            characters = ws.language_characters(language)
+            covered = sum(n for _, n, d in items if all(c in characters for c in d))
+            coverage[language.name] = covered / total if total else 0.0
+        return dict(sorted(coverage.items(), key=lambda x: x[1], reverse=True))
+
+
+    def top_out_of_script(self, n: int = 10, languages: Union[list, None] = None) -> list[tuple[str, int]]:
+        """
+        Returns the most frequent characters that do not belong to any supported script (or to the given languages).
+
+        Parameters:
+            n (int, optional): The number of characters to return. Defaults to 10.
+            languages (list[Language] | None, optional): If given, characters outside the scripts of these languages are
+                considered instead of characters outside of all writing system types. Defaults to None.
+
+        Returns:
+            list[tuple[str, int]]: Pairs of character and count, sorted by count in descending order.
+        """
+        if languages is None:
+            scripts = list(self.writing_systems_to_scripts.values())
+        else:
+            scripts = [self.writing_system.language_characters(language) for language in languages]
+
+        out_of_script = Counter({c: count for c, count, d in self.__script_items()
+                                 if not all(any(x in script for script in scripts) for x in d)})
+        return out_of_script.most_common(n)
+
+
+    @property
+    def writing_systems_to_scripts(self) -> dict:
+        return self.writing_system.writing_systems_to_scripts
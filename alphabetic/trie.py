@@ -0,0 +1,75 @@
+import re
+from typing import Iterable, Union
+
+
+class LetterTrie:
+    """
+    A trie over the letters (including multigraphs) of an alphabet, used for greedy longest-match segmentation.
+
+    The trie is compiled once into a regular expression whose structure mirrors the trie (e.g., the letters "N", "Ng"
+    and "Ny" become `N(?:[gy])?`). Hence, the segmentation runs inside the regex engine instead of a Python loop.
+
+    Example:
+        >>> trie = LetterTrie(["N", "Ng", "Ny", "a", "g", "y"])
+        >>> trie.tokenize("Ngaya")
+        ['Ng', 'a', 'y', 'a']
+    """
+
+    END = ""
+
+    def __init__(self, letters: Iterable[str]):
+        """
+        Parameters:
+            letters (Iterable[str]): The letters of the alphabet. Empty strings are ignored.
+        """
+        self.root = {}
+        self.letters = frozenset(letter for letter in letters if letter)
+
+        for letter in self.letters:
+            node = self.root
+            for c in letter:
+                node = node.setdefault(c, {})
+            node[self.END] = letter
+
+        pattern = self.__to_regex(self.root) if self.root else "(?!)"
+        self.pattern = re.compile(pattern)
+        self.pattern_with_unknown = re.compile(f"{pattern}|.", re.DOTALL)
+
+
+    def __to_regex(self, node: dict) -> str:
+        """Converts a (sub)trie into a regex, where longer matches are tried first and shorter ones via backtracking."""
+        leaves, branches = [], []
+        for c, child in sorted(node.items()):
+            if c == self.END:
+                continue
+            if len(child) == 1 and self.END in child:
+                leaves.append(re.escape(c))
+            else:
+                sub_pattern = self.__to_regex(child)
+                branches.append(f"{re.escape(c)}{sub_pattern}" if self.END not in child else f"{re.escape(c)}(?:{sub_pattern})?")
+
+        alternatives = branches + ([leaves[0] if len(leaves) == 1 else f"[{''.join(leaves)}]"] if leaves else [])
+        return alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+
+
+    def longest_match(self, text: str, pos: int = 0) -> Union[str, None]:
+        """
+        Returns the longest letter starting at the given position of the text, or None if no letter starts there.
+        """
+        match = self.pattern.match(text, pos)
+        return match.group() if match else None
+
+
+    def tokenize(self, text: str, keep_unknown: bool = False) -> list[str]:
+        """
+        Splits the text into letters by greedy longest match.
+
+        Parameters:
+            text (str): The text (e.g., a word) to be split.
+            keep_unknown (bool, optional): If True, characters that do not start any letter are returned as
+                single-character tokens. Otherwise, they are skipped. Defaults to False.
+
+        Returns:
+            list[str]: The letters of the text.
+        """
+        return (self.pattern_with_unknown if keep_unknown else self.pattern).findall(text)
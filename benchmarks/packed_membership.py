@@ -0,0 +1,54 @@
+"""
+Benchmark of the membership tests on the packed, memory-mapped tables of `WritingSystem.preload_for_fork` compared to
+the regular tables (frozensets), which shows the per-character cost of sharing the tables between forked workers. Usage:
+
+    python benchmarks/packed_membership.py --repeat 5
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alphabetic import WritingSystem
+
+TEXT = "Schöne Grüße aus Köln, wir sehen uns morgen " * 2500
+
+
+def best_of(repeat: int, operation) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    regular, packed = WritingSystem(), WritingSystem()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        regular.preload_for_fork(freeze=False)
+        packed.preload_for_fork(os.path.join(tmp_dir, "alphabetic.bin"), freeze=False)
+
+        operations = {
+            "is_alphabet": lambda ws: ws.is_alphabet(TEXT),
+            "language_characters": lambda ws: sum(c in ws.language_characters(ws.Language.German) for c in TEXT),
+            "validate": lambda ws: ws.validate(TEXT, "Alphabet"),
+            "strip_non_script_characters": lambda ws: ws.strip_non_script_characters(TEXT, ws.Language.German),
+        }
+        print(f"Python {sys.version.split()[0]}, {len(TEXT):,} characters")
+        for name, operation in operations.items():
+            operation(regular), operation(packed)  # Warm up the caches built on first use.
+            t_regular = best_of(args.repeat, lambda: operation(regular))
+            t_packed = best_of(args.repeat, lambda: operation(packed))
+            print(f"{name:<28} regular={t_regular * 1e3:8.2f} ms packed={t_packed * 1e3:8.2f} ms slowdown={t_packed / t_regular:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
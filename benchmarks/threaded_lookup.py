@@ -0,0 +1,55 @@
+"""
+Multithreaded benchmark of the lookup paths of a shared `WritingSystem` instance.
+
+On a free-threaded CPython build (e.g., python3.13t) the throughput should scale with the number of threads,
+whereas on a regular build the GIL serializes the lookups. Usage:
+
+    python3.13t benchmarks/threaded_lookup.py --threads 1 2 4 8 --iterations 20000
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alphabetic import shared_writing_system
+
+SAMPLES = ["Schöne Grüße aus Köln", "גדולים או בינוניים", "早上好", "ምልካም እድል", "좋은 아침", "დილა მშვიდობისა", "Здравейте"]
+
+
+def lookups(iterations: int) -> int:
+    ws = shared_writing_system()
+    for i in range(iterations):
+        sample = SAMPLES[i % len(SAMPLES)]
+        ws.is_alphabet(sample)
+        ws.is_featural(sample)
+        ws.character_profile(sample[0])
+        ws.language_characters(ws.Language.German)
+    return iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--iterations", type=int, default=20000, help="Lookups per thread.")
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}, CPUs: {os.cpu_count()}")
+
+    lookups(100)  # Warm up the shared instance and its caches.
+    baseline = None
+
+    for n_threads in args.threads:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            total = sum(pool.map(lookups, [args.iterations] * n_threads))
+        throughput = total / (time.perf_counter() - start)
+        baseline = baseline or throughput
+        print(f"threads={n_threads:<3} lookups/s={throughput:>12,.0f} speedup={throughput / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
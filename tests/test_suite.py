@@ -3,6 +3,7 @@ import sys
 import inspect
 import unittest
 import pytest
+from array import array
 
 # Import the module from the parent directory
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
@@ -179,3 +180,490 @@ class TestCore(unittest.TestCase):
         umlauts = list(german_letters_umlauts.split("\\", maxsplit=1)[0])
 
         assert "".join(sorted(upper + lower + umlauts)) == "".join(sorted(ws.by_language(ws.Language.German, as_list=True)))
+
+
+    def test_statistics_shares_and_merge(self):
+        ws = WritingSystem()
+        part_1 = ws.statistics().update("Hallo Welt! ")
+        part_2 = ws.statistics().update("Привет! 안녕")
+        stats = ws.statistics().merge(part_1).merge(part_2.histogram)
+        shares = stats.script_type_shares()
+
+        assert (stats.total == 19 and shares["Alphabet"] == 15 / 19 and shares["Featural"] == 2 / 19 and
+                stats.top_out_of_script(1) == [("!", 2)] and
+                stats.language_coverage([ws.Language.German])["German"] == 9 / 19)
+
+
+    def test_statistics_from_file(self):
+        import tempfile
+        ws = WritingSystem()
+        text = "Schöne Grüße aus Köln! שלום " * 100
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "corpus.txt")
+            with open(file_path, "w", encoding="utf8") as f:
+                f.write(text)
+
+            # A small chunk size forces multi-byte characters to be split between chunks.
+            mapped = ws.statistics(chunk_size=7).update_from_file(file_path)
+            streamed = ws.statistics(chunk_size=7).update_from_file(file_path, use_mmap=False)
+
+        assert mapped.histogram == streamed.histogram == ws.statistics().update(text).histogram
+
+
+    def test_incremental_classifier(self):
+        ws = WritingSystem()
+        text = "좋은 아침 Schöne Grüße"
+        chunked, whole = ws.incremental(), ws.incremental().feed(text)
+
+        for i in range(0, len(text), 3):
+            chunked.feed(text[i:i + 3])
+
+        korean = ws.incremental().feed("좋은 ").feed("아").feed("침").result()
+        german = ws.incremental().feed("Schöne").feed(" Grü").feed("ße").result()
+
+        assert (chunked.result() == whole.result() and whole.result()["script_types"] == [] and
+                korean["script_types"] == ["Featural"] and "Korean" in korean["languages"] and
+                german["script_types"] == ["Alphabet"] and "German" in german["languages"] and "English" not in german["languages"])
+
+
+    def test_shared_instance_thread_safety(self):
+        import pickle
+        from concurrent.futures import ThreadPoolExecutor
+        from alphabetic import shared_writing_system
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: shared_writing_system(), range(32)))
+            results = list(pool.map(instances[0].is_alphabet, ["Hallo", "שלום"] * 16))
+        ws = instances[0]
+
+        with pytest.raises(TypeError):
+            ws.writing_systems_to_scripts["Alphabet"] = set()
+
+        assert (all(x is ws for x in instances) and results == [True, False] * 16 and
+                pickle.loads(pickle.dumps(ws)).is_abjad("שלום"))
+
+
+    def test_overlay_directory(self):
+        import json
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as overlay_dir:
+            with open(os.path.join(overlay_dir, "alphabet.json"), "w", encoding="utf8") as f:
+                json.dump({"haw": {"script": ["A", "a", "ʻ"]}}, f, ensure_ascii=False)
+            ws = WritingSystem(overlay_dirs=overlay_dir)
+
+        assert ws.by_language(ws.Language.Hawaiian, as_list=True) == ["A", "a", "ʻ"] and ws.is_alphabet("ʻAʻa")
+
+
+    def test_register_script(self):
+        ws = WritingSystem()
+        assert ws.is_alphabet("abc") and not ws.is_alphabet("abc𑅐") and ws.Language.German in ws.character_profile("ä")[1]
+        
+        ws.register_script(JsonUtils.FilePath.Alphabet, "deu", ["a", "b", "c", "𑅐"])
+
+        with pytest.raises(Non_Existing_ISO_639_2_Langcode):
+            ws.register_script(JsonUtils.FilePath.Alphabet, "xxx", ["x"])
+
+        assert (ws.is_alphabet("abc𑅐") and ws.language_characters(ws.Language.German) == set("abc𑅐") and
+                ws.Language.German not in ws.character_profile("ä")[1] and
+                "𑅐" not in WritingSystem().language_characters(ws.Language.German))
+
+
+    def test_codepoint_range_set_algebra(self):
+        ws = WritingSystem()
+        latin = ws.character_range("a-zA-Z")
+        vowels = ws.character_range("aeiouAEIOU")
+
+        assert (len(latin) == 52 and "q" in latin and "ä" not in latin and
+                set(latin - vowels) == set(ws.generate_all_characters_in_range("a-z") + ws.generate_all_characters_in_range("A-Z")) - set("aeiouAEIOU") and
+                (latin & vowels) == vowels and (vowels | ws.character_range("b-d")).ranges == [("A", "A"), ("E", "E"), ("I", "I"), ("O", "O"), ("U", "U"), ("a", "e"), ("i", "i"), ("o", "o"), ("u", "u")] and
+                set("abc!") - vowels == ws.character_range("bc!") and {"a", "b"} | vowels == vowels | {"b"} and {"a", "b"} & vowels == vowels & {"a"})
+
+        # Range sets only equal range sets, so that equal objects always share their hash.
+        assert vowels != frozenset("aeiouAEIOU") and vowels == ws.character_range("AEIOUaeiou") and len({vowels, ws.character_range("AEIOUaeiou")}) == 1
+        for operation in (vowels.union, vowels.intersection, vowels.difference):
+            with pytest.raises(TypeError):
+                operation(None)
+
+
+    def test_codepoint_range_set_as_script_and_filter(self):
+        ws = WritingSystem()
+        cjk = ws.character_range("一-鿿")
+        ws.register_script(JsonUtils.FilePath.Logographic, "Hani", cjk)
+
+        assert (ws.is_logographic("丂丄") and not ws.is_logographic("丂a") and
+                ws.strip_non_script_characters("Hello 你好!", [ws.Language.English, cjk]) == "Hello 你好")
+
+
+    def test_segment_by_script(self):
+        ws = WritingSystem()
+        text = "مرحبا 123 hello"
+
+        assert (ws.segment_by_script("東京タワーとTokyo") == [(0, 2, "Hani"), (2, 5, "Kana"), (5, 6, "Hira"), (6, 11, "Latn")] and
+                ws.segment_by_script(text) == [(0, 10, "Arab"), (10, 15, "Latn")] and
+                ws.segment_by_script(text, merge_common=False) == [(0, 5, "Arab"), (5, 10, None), (10, 15, "Latn")] and
+                ws.segment_by_script("좋은 아침 Привет", level=ws.SegmentationLevel.Type) == [(0, 6, "Featural"), (6, 12, "Alphabet")] and
+                ws.segment_by_script("") == [])
+
+
+    def test_normalization_aware_matching(self):
+        import unicodedata
+        ws = WritingSystem()
+        nfd = lambda x: unicodedata.normalize("NFD", x)
+
+        assert (not ws.is_alphabet(nfd("Dobrý deň Zürich à Nîmes")) and ws.is_alphabet(nfd("Dobrý deň Zürich à Nîmes"), normalize=True) and
+                ws.is_abjad(nfd("آمد"), normalize=True) and not ws.is_abjad(nfd("آمد")) and ws.is_alphabet("Zürich", normalize=True) and
+                ws.strip_non_script_characters(nfd("Grüße!Ωλ"), ws.Language.German) == "Gruße" and
+                ws.strip_non_script_characters(nfd("Grüße!Ωλ"), ws.Language.German, normalize=True) == nfd("Grüße") and
+                all(ws.strip_non_script_characters(nfd(text), ws.Language.German, process_token_wise=token_wise, normalize=True) == 
+                    nfd(ws.strip_non_script_characters(text, ws.Language.German, process_token_wise=token_wise))
+                    for text in ["Café Noël", "naïve Öl über Ärger", "Dobrý deň"] for token_wise in [True, False]) and
+                ws.strip_non_script_characters(nfd("Café Noël"), ws.Language.German, normalize=True, return_offsets=True)[1].tolist() == [0, 1, 2, 5, 6, 7, 10])
+
+
+    def test_tokenize_letters(self):
+        ws = WritingSystem()
+        javanese = ws.Language.Javanese
+
+        assert (ws.tokenize_letters("Nyanyi", javanese) == ["Ny", "a", "ny", "i"] and
+                ws.tokenize_letters("Dhalang 1!", javanese) == ["Dh", "a", "l", "a", "ng"] and
+                ws.tokenize_letters("ng 1", javanese, keep_unknown=True) == ["ng", " ", "1"] and
+                ws.tokenize_letters_bulk(["ngomong", "kothak"], javanese) == [["ng", "o", "m", "o", "ng"], ["k", "o", "th", "a", "k"]])
+
+
+    def test_language_routing(self):
+        ws = WritingSystem()
+        routing = ws.language_routing()
+
+        assert (routing[ws.Language.Japanese] == (ws.Syllabary.Hiragana, ws.Syllabary.Katakana, ws.Logographic.Kanji) and
+                routing[ws.Language.Korean] == routing[ws.Language.Jeju] == (ws.Featural.Hangul,) and
+                routing[ws.Language.Hindi] == (ws.Abugida.Hindi,) and ws.Language.German not in routing and
+                WritingSystem.language_routing() is routing)
+
+
+    def test_series_accessor(self):
+        pd = pytest.importorskip("pandas")
+        import alphabetic.accessors
+        ws = WritingSystem()
+        texts = ["Hallo Welt", "שלום", "早上好", "안녕하세요", "  ", "Schönes클라 Wetter*+/ heute!தமி חדשים"]
+        languages = [ws.Language.German, ws.Language.Hebrew]
+        s = pd.Series(texts)
+
+        assert (s.alphabetic.is_alphabet().tolist() == [ws.is_alphabet(t) for t in texts] and
+                s.alphabetic.is_featural().tolist() == [ws.is_featural(t) for t in texts] and
+                s.alphabetic.strip(languages).tolist() == [ws.strip_non_script_characters(t, languages) for t in texts] and
+                s.alphabetic.strip(process_token_wise=False).tolist() == [ws.strip_non_script_characters(t, process_token_wise=False) for t in texts] and
+                s.alphabetic.classify().tolist()[:4] == ["Alphabet", "Abjad", "Logographic", "Featural"] and
+                s.alphabetic.classify().isna().tolist()[4:] == [True, True])
+
+        # Both backends (Arrow and pandas' string methods) must return the same dtypes and nulls.
+        from unittest import mock
+        nullable = pd.Series(["Hallo", None, "\u110b\u1161\u11ab", "早上好"])
+        run = lambda: (nullable.alphabetic.is_featural(), nullable.alphabetic.classify(), s.alphabetic.is_alphabet())
+        with mock.patch.object(alphabetic.accessors, "pa", None):
+            fallback = run()
+        for result, expected in zip(fallback, run() if alphabetic.accessors.pa is not None else fallback):
+            assert result.equals(expected) and result.dtype == expected.dtype
+        assert (fallback[0].tolist() == [False, pd.NA, True, False] and fallback[0].dtype == "boolean" and
+                fallback[1].tolist() == ["Alphabet", None, "Featural", "Logographic"] and fallback[2].dtype == bool)
+
+
+    def test_alphabet_similarity(self):
+        ws = WritingSystem()
+        bitsets = ws.alphabet_bitsets()
+        german, russian = ws.Language.German, ws.Language.Russian
+        german_chars, russian_chars = ws.language_characters(german), ws.language_characters(russian)
+        nearest = ws.nearest_alphabets(german, k=3)
+
+        assert (len(nearest) == 3 and german not in [language for language, _ in nearest] and
+                nearest == sorted(nearest, key=lambda item: item[1], reverse=True) and
+                bitsets.similarity(german, russian) == len(german_chars & russian_chars) / len(german_chars | russian_chars) and
+                bitsets.similarity(german, german, "containment") == 1.0 and ws.alphabet_bitsets() is bitsets and
+                ws.languages_sharing("ßü") == [german] and ws.Language.Korean in ws.languages_sharing("한국") and
+                ws.languages_sharing("ß€") == [] and ws.Abugida.Devanagari in bitsets.entries and
+                bitsets.similarity(ws.Abugida.Hindi, ws.Language.Hindi) == 1.0 and len(bitsets.matrix()) == len(bitsets.entries) and
+                ws.nearest_alphabets(ws.Language.Hindi, k=1, include_scripts=True) == [(ws.Abugida.Hindi, 1.0)] and
+                all(isinstance(entry, ws.Language) for entry, _ in ws.nearest_alphabets(ws.Abugida.Devanagari, k=10)))
+
+
+    def test_languages_for_char_and_coverage(self):
+        ws = WritingSystem()
+        covering = ws.languages_that_can_write("Grüße aus Köln")
+
+        assert (ws.languages_for_char("đ") == [ws.Language.Croatian, ws.Language.Istro_Romanian] and ws.languages_for_char("€") == [] and
+                set(ws.languages_for_char("한")) == {ws.Language.Korean, ws.Language.Jeju} and covering == [ws.Language.German] and
+                ws.languages_that_can_write("ß€") == [] and
+                ws.languages_that_can_write("Grüße aus Köln", strip_spaces=False) == [] and
+                set(ws.character_profile("ř")[1]) == set(ws.languages_for_char("ř")) and
+                ws.scripts_for_char("한") == [ws.Featural.Hangul] and ws.scripts_for_char("あ") == [ws.Syllabary.Hiragana] and
+                ws.Abjad.Arabic in ws.scripts_for_char("ب") and ws.Abugida.Devanagari in ws.scripts_for_char("ह") and ws.scripts_for_char("a") == [])
+
+
+    def test_estimate_writing_system(self):
+        ws = WritingSystem()
+        text = "Hallo Welt " * 100_000
+        estimate = ws.estimate_writing_system(text, "Alphabet", seed=0)
+        mixed = ws.estimate_writing_system(("Hallo" * 99 + "好") * 2_000, "Alphabet", early_stop=False, seed=1)
+        exact = ws.estimate_writing_system("안녕 하세요", "Featural")
+        # A long foreign span is sampled by few windows, hence the interval must be wide (each window counts as one trial at worst).
+        halves = ws.estimate_writing_system("a" * 500_000 + "好" * 500_000, "Alphabet", early_stop=False, seed=2)
+
+        from alphabetic.sampling import cluster_wilson_interval, wilson_interval
+        assert (estimate["verdict"] and not estimate["certain"] and estimate["sampled"] <= 4096 and 0.9 < estimate["lower"] <= estimate["upper"] == 1.0 and
+                estimate["lower"] == wilson_interval(64, 64)[0] and cluster_wilson_interval([], []) == (0.0, 1.0) and
+                halves["lower"] < 0.4 and halves["upper"] > 0.6 and
+                not mixed["verdict"] and mixed["certain"] and mixed["lower"] <= 494 / 495 <= mixed["upper"] and
+                exact["verdict"] and exact["certain"] and exact["sampled"] == 12 and
+                not ws.estimate_writing_system(text + "好", "Alphabet", sample_size=len(text) + 1)["verdict"] and
+                ws.estimate_writing_system(text, "Alphabet", seed=3) == ws.estimate_writing_system(text, "Alphabet", seed=3) and
+                not ws.estimate_writing_system("a" * 100 + "好", "Alphabet", sample_size=100, window_size=64)["verdict"])
+
+
+    def test_validate(self):
+        ws = WritingSystem()
+        report = ws.validate("Grüße, Ωmega!", ws.Language.German)
+        reports = ws.validate_bulk(["안녕 하세요", "안녕 a"], "Featural")
+
+        assert (report == {"valid": False, "offsets": [5, 7, 12], "characters": [",", "Ω", "!"], "blocks": {"Basic Latin": 2, "Greek and Coptic": 1}} and
+                ws.validate("Hallo Welt", "Alphabet")["valid"] and not ws.validate("Hallo Welt", "Alphabet", strip_spaces=False)["valid"] and
+                reports[0]["valid"] and reports[1]["offsets"] == [3] and ws.unicode_block("ß") == "Latin-1 Supplement" and
+                ws.validate("好!", ws.character_range("一-鿿"))["characters"] == ["!"] and
+                ws.validate("\u110b\u1161\u11ab\u1102\u1167\u11bc a", "Featural")["offsets"] == [7])  # NFD-normalized "안녕"
+
+        with pytest.raises(ValueError):
+            ws.validate("abc", "Alphabets")
+
+
+    def test_token_cache(self):
+        ws = WritingSystem(token_cache_size=2)
+        stripped = ws.strip_non_script_characters("der Hund, der Hund!", ws.Language.German)
+        info = ws.token_cache_info()
+        ws.is_alphabet("Hund"), ws.is_alphabet("Hund"), ws.is_alphabet("Katze")
+        bounded = ws.token_cache_info()
+        ws.clear_token_cache()
+
+        assert (stripped == WritingSystem().strip_non_script_characters("der Hund, der Hund!", ws.Language.German) == "der Hund der Hund" and
+                info == {"hits": 1, "misses": 3, "hit_rate": 0.25, "size": 2, "maxsize": 2} and
+                bounded["hits"] == 2 and bounded["size"] == 2 and ws.token_cache_info()["size"] == 0 and
+                ws.is_alphabet("Hund") and not ws.is_alphabet("Hund!") and WritingSystem().token_cache_info() is None)
+
+
+    def test_preload_for_fork(self):
+        import pickle
+        import tempfile
+        from alphabetic.shared import load_range_sets
+        ws, reference = WritingSystem(), WritingSystem()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tables.bin")
+            ws.preload_for_fork(path, freeze=False)
+            shared = load_range_sets(path)
+
+            assert (set(shared["type:Alphabet"]) == reference.writing_systems_to_scripts["Alphabet"] and
+                    isinstance(ws.writing_systems_to_scripts["Abjad"], type(shared["type:Abjad"])) and
+                    ws.is_alphabet("Schöne Grüße") and not ws.is_alphabet("Grüße!") and ws.is_featural("안녕하세요") and
+                    set(ws.language_characters(ws.Language.German)) == reference.language_characters(ws.Language.German) and
+                    ws.validate("Grüße, Ωmega!", ws.Language.German) == reference.validate("Grüße, Ωmega!", ws.Language.German) and
+                    pickle.loads(pickle.dumps(ws)).is_abjad("مرحبا"))
+
+
+    def test_batching_server(self):
+        import asyncio
+        import threading
+        from alphabetic.serve import BatchingServer, Client
+        server = BatchingServer(WritingSystem(), max_batch_size=16)
+        thread = threading.Thread(target=asyncio.run, args=(server.serve(port=0),), daemon=True)
+        thread.start()
+        server.ready.wait(10)
+
+        with Client(port=server.address[1]) as client:
+            stripped = client.request_many([{"op": "strip", "text": f"Grüße {i}!", "languages": ["German"]} for i in range(100)])
+            hindi = client.request("strip", text="नमस्ते दुनिया", languages=["Hindi"])
+            verdicts = [client.request("is", text="Hallo", script_type="Alphabet"), client.request("classify", text="早上好")]
+            report = client.request("validate", text="Grüße!", target="German")
+            with pytest.raises(RuntimeError):
+                client.request("is", text="Hallo", script_type="Alphabets")
+            stats = client.request("stats")
+
+        server.close()
+        thread.join(10)
+        ws = WritingSystem()
+        ws_classify = ws.classify_bulk(["Hallo", "مرحبا", "早上好", "안녕", " ", "Hallo 好"])
+        ws_bulk = ws.is_writing_system_bulk(["Hallo Welt", "مرحبا", "Hallo 好"], "Alphabet")
+        # Precomposed, NFD-normalized (conjoining Jamo) and compatibility Jamo Hangul must be judged as by the per-item checks.
+        hangul = ["안녕하세요", "\u110b\u1161\u11ab\u1102\u1167\u11bc", "ㅇㅏㄴ", "\u110b\u1161\u11ab a", "\u11ab好"]
+        hangul_consistent = (ws.is_writing_system_bulk(hangul, "Featural") == [ws.is_writing_system(text, "Featural") for text in hangul] ==
+                             [True, True, True, False, False] and ws.classify_bulk(hangul) == [ws.classify(text) for text in hangul])
+
+        assert (stripped == ["Grüße"] * 100 and hindi == ws.strip_non_script_characters("नमस्ते दुनिया", ws.Language.Hindi) and verdicts == [True, "Logographic"] and
+                ws_classify == ["Alphabet", "Abjad", "Logographic", "Featural", None, None] and ws_bulk == [True, True, False] and report["offsets"] == [5] and
+                hangul_consistent and stats["strip"]["count"] == 101 and stats["is"]["count"] == 2 and stats["strip"]["p50"] <= stats["strip"]["max"] and
+                not thread.is_alive())
+
+
+    def test_iso_639_3_mmap_backend(self):
+        import tempfile
+        from alphabetic.iso_index import CodeIndex, build_code_index, index_is_current
+        ws = WritingSystem()
+        table = JsonUtils.load_dict_from_jsonfile(JsonUtils.FilePath.ISO_639_3_Language_Code)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            JsonUtils.set_iso_639_3_backend("mmap", os.path.join(tmp_dir, "iso_639_3.idx"))
+            try:
+                index = JsonUtils.load_iso_639_3_table()
+                assert (len(index) == len(table) and dict(index) == table and "xyz" not in index and "deu" in index and
+                        ws.iso_code_to_name("aaa") == "Ghotuo" and JsonUtils.language_code_exists("aal") and
+                        JsonUtils.load_iso_639_3_table() is index)
+            finally:
+                JsonUtils.set_iso_639_3_backend("json")
+
+            json_path, index_path = os.path.join(tmp_dir, "codes.json"), os.path.join(tmp_dir, "codes.idx")
+            with open(json_path, "w", encoding="utf8") as f:
+                f.write('{"aaa": "Ghotuo"}')
+            build_code_index(json_path, index_path)
+            current = index_is_current(index_path, json_path)
+            with open(json_path, "w", encoding="utf8") as f:
+                f.write('{"aaa": "Ghotuo", "aab": "Alumu-Tesu"}')
+            assert (current and not index_is_current(index_path, json_path) and not index_is_current(json_path, json_path) and
+                    not os.path.exists(f"{index_path}.tmp") and dict(CodeIndex(index_path)) == {"aaa": "Ghotuo"})
+
+        with pytest.raises(ValueError):
+            JsonUtils.set_iso_639_3_backend("sqlite")
+
+
+    def test_strip_with_offsets(self):
+        ws = WritingSystem()
+        text = "  Grüße,\tΩ Welt!  "
+        tokens, token_offsets = ws.strip_non_script_characters(text, ws.Language.German, return_offsets=True)
+        whole, whole_offsets = ws.strip_non_script_characters(text, ws.Language.German, process_token_wise=False, return_offsets=True)
+
+        assert (tokens == ws.strip_non_script_characters(text, ws.Language.German) == "Grüße  Welt" and
+                list(token_offsets) == [2, 3, 4, 5, 6, 8, 10, 11, 12, 13, 14] and token_offsets.typecode == "I" and
+                whole == ws.strip_non_script_characters(text, ws.Language.German, process_token_wise=False) == "GrüßeWelt" and
+                "".join(text[i] for i in whole_offsets) == whole and
+                ws.strip_non_script_characters("", return_offsets=True) == ("", array("I")))
+
+
+    def test_sort_by_alphabet(self):
+        ws = WritingSystem()
+        key = ws.sort_key(ws.Language.Javanese)
+
+        assert (sorted(["ngoko", "Nyai", "nasi", "obah"], key=key) == ["nasi", "ngoko", "Nyai", "obah"] and
+                sorted(["NGOKO", "noa", "nga", "Ngoko"], key=key) == ["noa", "nga", "NGOKO", "Ngoko"] and key("NGOKO") > key("NOA") and
+                ws.sort_key(ws.Language.Javanese) is key and
+                ws.sorted_by_alphabet(["ba", "Ba", "a1", "ab", "A", "1"], ws.Language.German) == ["1", "A", "a1", "ab", "Ba", "ba"] and
+                ws.sorted_by_alphabet(["Zebra", "apfel", "Affe"], ws.Language.German, reverse=True) == ["Zebra", "apfel", "Affe"] and
+                # Characters of the Private Use Areas (or NUL) are ordered like any other non-letter, before all letters.
+                ws.sorted_by_alphabet(["a", "\U00100001", "b", "\U00100000"], ws.Language.German) == ["\U00100000", "\U00100001", "a", "b"] and
+                sorted(["nga", "\U00100005", "a\0b", "a"], key=key) == ["\U00100005", "a", "a\0b", "nga"])
+
+
+    def test_alphabet_encoder(self):
+        from alphabetic.encoding import AlphabetEncoder, np
+        ws = WritingSystem()
+        encoder = ws.alphabet_encoder(ws.Language.German, use_numpy=False)
+        javanese = ws.alphabet_encoder(ws.Language.Javanese, multigraphs=True, use_numpy=False)
+        ids = encoder.encode("Hallo!")
+
+        assert (ids.typecode == "H" and ids[-1] == 0 and ids[0] == encoder.letters.index("H") + 1 and
+                encoder.decode(ids) == "Hallo�" and encoder.decode(ids, unknown="") == "Hallo" and
+                list(map(list, encoder.encode_batch(["Hallo", "", "Welt"]))) == [list(encoder.encode("Hallo")), [], list(encoder.encode("Welt"))] and
+                ws.alphabet_encoder(ws.Language.German, use_numpy=False) is encoder and
+                len(javanese.encode("Nyanyi")) == 4 and javanese.decode_batch(javanese.encode_batch(["Nyanyi", "ngoko"])) == ["Nyanyi", "ngoko"] and
+                # Characters of the input that coincide with the placeholders of multigraphs are unknown.
+                list(javanese.encode("ng" + chr(0x100000 + javanese.ids["ng"]) + "\U00100000")) == [javanese.ids["ng"], 0, 0])
+
+        with pytest.raises(ValueError):
+            AlphabetEncoder(["a", "ng", "\U00100001"], multigraphs=True)
+
+        with pytest.raises(ValueError):
+            encoder.decode([len(encoder.letters) + 1])
+
+        if np is not None:
+            vectorized = ws.alphabet_encoder(ws.Language.German)
+            assert (vectorized.encode("Hallo!").dtype == np.uint16 and vectorized.encode("Hallo!").tolist() == list(ids) and
+                    vectorized.decode(vectorized.encode("Grüße, Welt")) == "Grüße��Welt")
+
+
+    def test_is_script_and_language(self):
+        ws = WritingSystem()
+
+        assert (ws.is_script("नमस्ते", ws.Abugida.Devanagari) and not ws.is_script("नमस्ते ሰላም", ws.Abugida.Devanagari) and
+                ws.is_abugida("नमस्ते ሰላም") and ws.is_script("안녕하세요", ws.Featural.Hangul) and
+                ws.is_script("\u110b\u1161\u11ab\u1102\u1167\u11bc", ws.Featural.Hangul) and  # NFD-normalized "안녕"
+                ws.is_script_bulk(["\u110b\u1161\u11ab", "ㅇㅏㄴ", "\u110b\u1161\u11ab a"], ws.Featural.Hangul) == [True, True, False] and
+                ws.is_script_bulk(["مرحبا", "abc", ""], ws.Abjad.Arabic) == [True, False, True] and
+                ws.is_language("Grüße", ws.Language.German) and not ws.is_language("Grüße", ws.Language.English) and
+                not ws.is_language("Grüße Welt", ws.Language.German, strip_spaces=False) and
+                ws.is_language_bulk(["Hallo Welt", "Hallo!"], ws.Language.German) == [True, False] and
+                ws.validate("abc", ws.Abjad.Arabic)["offsets"] == [0, 1, 2])
+
+
+    def test_pipeline(self):
+        ws = WritingSystem()
+        clean = ws.pipeline().normalize().strip(languages=ws.Language.German)
+        texts = ["  Gr\u00fc\u00dfe,\t\u03a9mega!  ", "a ! b", "", "日本 Welt"]
+
+        assert (clean.run_batch(texts) == [ws.strip_non_script_characters(text, ws.Language.German) for text in texts] and
+                clean("Gru\u0308\u00dfe!") == "Gr\u00fc\u00dfe" and ws.pipeline().normalize().stages == (("normalize", "NFC"),) and
+                list(ws.pipeline().strip(ws.Language.German, process_token_wise=False).stream(["a b!", " c"])) == ["ab", "c"] and
+                ws.pipeline().decompose_hangul().classify()("안녕하세요") == ["Featural"] and
+                ws.pipeline().normalize().classify().run_batch(["Grüße", "مرحبا"]) == [["Alphabet"], ["Abjad", "Alphabet"]])
+
+        with pytest.raises(ValueError):
+            ws.pipeline().classify().normalize()
+
+        # Multigraphs (e.g., Hindi conjuncts or Maori "ng") are not split into their letters by either.
+        text = "Guten Tag, Cara! नमस्ते दुनिया Привет, мир! こんにちは世界 안녕하세요 مرحبا שלום Γειά σου ñandú ng ch Ŋŋ Ɛɔ"
+        for language in (language for language in ws.Language if ws.by_language(language, as_list=True)):
+            for process_token_wise in (True, False):
+                assert (ws.pipeline().strip(language, process_token_wise)(text) ==
+                        ws.strip_non_script_characters(text, language, process_token_wise)), language
+        assert ws.pipeline().strip(ws.Language.Hindi)("नमस्ते दुनिया") == ws.strip_non_script_characters("नमस्ते दुनिया", ws.Language.Hindi)
+
+        german = ws.pipeline().strip(ws.Language.German)
+        before = german("Grüße, Welt")
+        ws.register_script(JsonUtils.FilePath.Alphabet, "deu", list("aeiouäöü"))
+        assert before == "Grüße Welt" and german("Grüße, Welt") == ws.strip_non_script_characters("Grüße, Welt", ws.Language.German) == "üe e"
+
+
+    def test_detect_mixed_script(self):
+        ws = WritingSystem()
+        spoofed = ws.detect_mixed_script("pаypal")  # Cyrillic "а"
+
+        assert (spoofed["mixed"] and spoofed["scripts"] == {"Latn": 5, "Cyrl": 1} and spoofed["dominant"] == "Latn" and
+                spoofed["positions"] == {"Cyrl": [1]} and spoofed["confusables"] == [1] and spoofed["skeleton"] == ws.skeleton("paypal") and
+                not ws.detect_mixed_script("paypal")["mixed"] and not ws.detect_mixed_script("東京タワーとTokyo")["mixed"] and
+                ws.detect_mixed_script("Привeт")["confusables"] == [4] and  # Latin "e" in Cyrillic
+                ws.skeleton("ｐаураl") == "paypal" and ws.detect_mixed_script("ｐаураl")["scripts"] == {"Latn": 2, "Cyrl": 4} and
+                [r["mixed"] for r in ws.detect_mixed_script_bulk(["", "123", "abc"])] == [False, False, False])
+
+        # The script of a compatibility ideograph is derived from its NFKC form, which must follow newly registered scripts.
+        hans = ws.Logographic.Chinese_Simplified
+        before = ws.detect_mixed_script("\uf900")["scripts"]
+        ws.register_script(JsonUtils.FilePath.Logographic, hans.value[0], ws.by_logographic(hans, as_list=True) + ["\u8c48"])
+        assert before == {} and ws.detect_mixed_script("\uf900")["scripts"] == {"Hani": 1}
+
+
+    def test_segment_by_language(self):
+        ws = WritingSystem()
+        german, turkish = "Wir waren gestern in der Stadt und haben viel gesehen. ", "Şimdi çok güzel bir ağaç görüyorum ve çiçekler açıyor. "
+        text = german * 20 + turkish * 20 + german * 5
+        spans = ws.segment_by_language(text, [ws.Language.German, ws.Language.Turkish])
+
+        assert ([labels for _, _, labels in spans] == [[ws.Language.German], [ws.Language.Turkish], [ws.Language.German]] and
+                spans[0][0] == 0 and spans[-1][1] == len(text) and all(a[1] == b[0] for a, b in zip(spans, spans[1:])) and
+                abs(spans[1][0] - len(german) * 20) <= 32 and abs(spans[2][0] - (len(german) + len(turkish)) * 20) <= 32 and
+                ws.segment_by_language("") == [] and ws.segment_by_language("123 !!") == [(0, 6, [])])
+
+        # Without candidates, the labels of a span must not depend on how the steps align with the text.
+        first_labels = set()
+        for n in (199, 200, 201, 203, 1000, 2000):
+            spans = ws.segment_by_language((german * 40)[:n] + (turkish * 40)[:n])
+            first_labels.add(tuple(spans[0][2]))
+            assert len(spans) == 2 and spans[1][2] == [ws.Language.Turkish] and abs(spans[1][0] - n) <= 32
+        assert len(first_labels) == 1 and ws.Language.German in first_labels.pop()
+
+        with pytest.raises(ValueError):
+            ws.segment_by_language(text, window_size=8, step=16)